@@ -17,17 +17,35 @@ from axelrod.load_data_ import load_pso_tables, load_weights
 from axelrod import graph
 from axelrod.plot import Plot
 from axelrod.game import DefaultGame, AsymmetricGame, Game
-from axelrod.history import History, LimitedHistory
+from axelrod.history import (
+    ArrayHistory,
+    History,
+    LimitedArrayHistory,
+    LimitedHistory,
+)
 from axelrod.player import Player
 from axelrod.classifier import Classifiers
 from axelrod.evolvable_player import EvolvablePlayer
 from axelrod.mock_player import MockPlayer
 from axelrod.match import Match
-from axelrod.moran import MoranProcess, ApproximateMoranProcess
+from axelrod.moran import (
+    MoranProcess,
+    ApproximateMoranProcess,
+    MoranEnsembleResults,
+    TypeMoranProcess,
+    fixation_probability,
+    play_moran_processes,
+    type_payoff_matrix,
+)
 from axelrod.strategies import *
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.deterministic_cache import (
+    DeterministicCache,
+    PersistentDeterministicCache,
+)
+from axelrod.batch_match import BatchMatch
+from axelrod import markov
 from axelrod.match_generator import *
 from axelrod.tournament import Tournament
-from axelrod.result_set import ResultSet
+from axelrod.result_set import ResultAccumulator, ResultSet
 from axelrod.ecosystem import Ecosystem
 from axelrod.fingerprint import AshlockFingerprint, TransitiveFingerprint
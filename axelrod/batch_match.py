@@ -0,0 +1,281 @@
+"""Vectorised play of many matches between memory-one players.
+
+A memory-one player is fully described by its initial action and by its
+probabilities of cooperating after each of the four possible previous rounds:
+
+    (P(C|CC), P(C|CD), P(C|DC), P(C|DD))
+
+where the first action of each state is the player's own action. The
+BatchMatch class uses this description to play every turn of many matches at
+once using NumPy arrays rather than calling `Player.strategy` turn by turn.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from axelrod import DEFAULT_TURNS
+from axelrod.action import Action
+from axelrod.game import Game
+from axelrod.player import Player
+from axelrod.random_ import RandomGenerator
+from axelrod.strategies.cooperator import Cooperator
+from axelrod.strategies.defector import Defector
+from axelrod.strategies.memoryone import MemoryOnePlayer, WinStayLoseShift
+from axelrod.strategies.titfortat import TitForTat
+
+C, D = Action.C, Action.D
+
+STATES = ((C, C), (C, D), (D, C), (D, D))
+
+# Deterministic players whose strategy is equivalent to a four-vector.
+_KNOWN_FOUR_VECTORS = {
+    Cooperator.strategy: ((1, 1, 1, 1), C),
+    Defector.strategy: ((0, 0, 0, 0), D),
+    TitForTat.strategy: ((1, 0, 1, 0), C),
+    WinStayLoseShift.strategy: ((1, 0, 0, 1), C),
+}
+
+
+def memory_one_parameters(player: Player) -> Tuple[np.ndarray, Action]:
+    """Returns the four-vector and initial action of a memory-one player.
+
+    Players are recognised by their strategy method so that subclasses which
+    override `strategy` (for example transformed players) are not mistaken
+    for memory-one players. The player's match attributes should already be
+    set as some four-vectors (e.g. GTFT and the ZD strategies) depend on the
+    game.
+
+    Parameters
+    ----------
+    player : axelrod.Player
+
+    Returns
+    -------
+    four_vector : numpy.ndarray
+        The probabilities of cooperating after CC, CD, DC and DD.
+    initial : axelrod.Action
+        The first move of the player.
+    """
+    strategy = type(player).strategy
+    if strategy is MemoryOnePlayer.strategy:
+        four_vector = [player._four_vector[state] for state in STATES]
+        return np.array(four_vector, dtype=float), player._initial
+    if strategy in _KNOWN_FOUR_VECTORS:
+        four_vector, initial = _KNOWN_FOUR_VECTORS[strategy]
+        return np.array(four_vector, dtype=float), initial
+    raise TypeError("{} is not a memory-one player.".format(player))
+
+
+class BatchMatch(object):
+    """Plays repetitions of matches between pairs of memory-one players in
+    lock-step.
+
+    All turns of all matches are played simultaneously using arrays: one
+    entry per pair of players and per repetition. Actions are stored as
+    integers using the value of the corresponding `axelrod.Action` (0 for C
+    and 1 for D).
+    """
+
+    def __init__(
+        self,
+        pairs: List[Tuple[Player, Player]],
+        turns: int = None,
+        prob_end: float = None,
+        game: Game = None,
+        noise: float = 0,
+        repetitions: int = 1,
+        seed: int = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        pairs : list
+            A list of pairs of memory-one axelrod.Player objects
+        turns : integer
+            The number of turns per match
+        prob_end : float
+            The probability of a given turn ending a match
+        game : axelrod.Game
+            The game object used to score the matches
+        noise : float
+            The probability that a player's intended action should be flipped
+        repetitions : integer
+            The number of times each match is played
+        seed : int
+            Random seed for reproducibility
+        """
+        defaults = {
+            (True, True): (DEFAULT_TURNS, 0),
+            (True, False): (float("inf"), prob_end),
+            (False, True): (turns, 0),
+            (False, False): (turns, prob_end),
+        }
+        self.turns, self.prob_end = defaults[(turns is None, prob_end is None)]
+        if self.turns == float("inf") and not self.prob_end:
+            raise ValueError("Matches of infinite length cannot be played.")
+
+        if game is None:
+            self.game = Game()
+        else:
+            self.game = game
+
+        self.noise = noise
+        self.repetitions = repetitions
+        self.pairs = [tuple(pair) for pair in pairs]
+        self.set_seed(seed)
+
+        known_turns = self.turns if prob_end is None else float("inf")
+        self.match_attributes = {
+            "length": known_turns,
+            "game": self.game,
+            "noise": self.noise,
+        }
+
+        self.result = None  # type: np.ndarray
+        self.lengths = None  # type: np.ndarray
+
+    def set_seed(self, seed: int) -> None:
+        """Sets a random seed for the BatchMatch, for reproducibility.
+
+        A single generator is used for the match lengths, the players' random
+        choices and the noise. The same seed always gives the same results
+        but the random draws are not the ones a sequence of `Match` objects
+        would make: the results only agree with `Match` in distribution.
+        """
+        self.seed = seed
+        self._random = RandomGenerator(seed=self.seed)
+
+    def _parameters(self):
+        """Returns arrays of the four-vectors and the initial actions of the
+        players, with one row per pair."""
+        vectors = np.empty((len(self.pairs), 2, 4))
+        initials = np.empty((len(self.pairs), 2), dtype=np.uint8)
+        for index, pair in enumerate(self.pairs):
+            for position, player in enumerate(pair):
+                player.set_match_attributes(**self.match_attributes)
+                four_vector, initial = memory_one_parameters(player)
+                vectors[index, position] = four_vector
+                initials[index, position] = initial.value
+        return vectors, initials
+
+    def _sample_lengths(self) -> np.ndarray:
+        """Samples the length of every match."""
+        shape = (len(self.pairs), self.repetitions)
+        if not self.prob_end:
+            return np.full(shape, self.turns, dtype=int)
+        if self.prob_end == 1:
+            return np.ones(shape, dtype=int)
+        random_values = self._random.random(*shape)
+        lengths = np.ceil(np.log(1 - random_values) / np.log(1 - self.prob_end))
+        # A random value of exactly 0 gives a length of 0, as it would
+        # with axelrod.match.sample_length.
+        return np.minimum(lengths, self.turns).astype(int)
+
+    def _choose(self, probabilities: np.ndarray) -> np.ndarray:
+        """Returns D (1) or C (0) for each entry given the probabilities of
+        cooperating, applying noise."""
+        actions = (
+            self._random.random(*probabilities.shape) >= probabilities
+        ).astype(np.uint8)
+        if self.noise:
+            flips = self._random.random(*probabilities.shape) < self.noise
+            actions ^= flips.astype(np.uint8)
+        return actions
+
+    def play(self) -> np.ndarray:
+        """
+        Plays all the matches.
+
+        Returns
+        -------
+        A numpy array of shape (pairs, repetitions, turns, 2) of the actions
+        played by both players, where turns is the length of the longest
+        match. Turns after the end of a shorter match are set to 0 and should
+        be ignored: the length of each match is stored in `self.lengths`.
+        """
+        vectors, initials = self._parameters()
+        self.lengths = self._sample_lengths()
+        max_turns = int(self.lengths.max(initial=0))
+
+        shape = (len(self.pairs), self.repetitions)
+        result = np.zeros(shape + (max_turns, 2), dtype=np.uint8)
+        if max_turns == 0:
+            self.result = result
+            return result
+
+        # The index of a state (own action, opponent action) is
+        # 2 * own action + opponent action.
+        probabilities = np.empty(shape + (2,))
+        probabilities[..., 0] = 1 - initials[:, 0, None]
+        probabilities[..., 1] = 1 - initials[:, 1, None]
+        actions = self._choose(probabilities)
+        result[:, :, 0] = actions
+        for turn in range(1, max_turns):
+            first, second = actions[..., 0], actions[..., 1]
+            probabilities[..., 0] = np.take_along_axis(
+                vectors[:, 0], 2 * first + second, axis=1
+            )
+            probabilities[..., 1] = np.take_along_axis(
+                vectors[:, 1], 2 * second + first, axis=1
+            )
+            actions = self._choose(probabilities)
+            result[:, :, turn] = actions
+
+        self.result = result
+        return result
+
+    def _mask(self) -> np.ndarray:
+        """Returns a boolean array of the turns actually played."""
+        turns = np.arange(self.result.shape[2])
+        return turns < self.lengths[..., None]
+
+    def final_score(self) -> np.ndarray:
+        """Returns the final scores, of shape (pairs, repetitions, 2)."""
+        first, second = self.result[..., 0], self.result[..., 1]
+        mask = self._mask()
+        scores = np.empty(self.result.shape[:2] + (2,))
+        for index, matrix in enumerate((self.game.A, self.game.B)):
+            turn_scores = np.asarray(matrix, dtype=float)[first, second]
+            scores[..., index] = np.sum(turn_scores * mask, axis=2)
+        return scores
+
+    def final_score_per_turn(self) -> np.ndarray:
+        """Returns the mean scores per turn, of shape (pairs, repetitions,
+        2)."""
+        with np.errstate(invalid="ignore"):
+            return self.final_score() / self.lengths[..., None]
+
+    def cooperation(self) -> np.ndarray:
+        """Returns the count of cooperations by each player, of shape
+        (pairs, repetitions, 2)."""
+        cooperations = (self.result == C.value) & self._mask()[..., None]
+        return cooperations.sum(axis=2)
+
+    def normalised_cooperation(self) -> np.ndarray:
+        """Returns the count of cooperations by each player per turn, of
+        shape (pairs, repetitions, 2)."""
+        with np.errstate(invalid="ignore"):
+            return self.cooperation() / self.lengths[..., None]
+
+    def state_distribution(self) -> np.ndarray:
+        """Returns the count of each state (CC, CD, DC, DD), of shape
+        (pairs, repetitions, 4)."""
+        states = 2 * self.result[..., 0] + self.result[..., 1]
+        mask = self._mask()
+        return np.stack(
+            [np.sum((states == index) & mask, axis=2) for index in range(4)],
+            axis=-1,
+        )
+
+    def interactions(
+        self, pair_index: int, repetition: int = 0
+    ) -> List[Tuple[Action, Action]]:
+        """Returns the actions of a single match in the form used by
+        axelrod.Match:
+
+            [(C, D), (D, C), ...]
+        """
+        length = self.lengths[pair_index, repetition]
+        plays = self.result[pair_index, repetition, :length]
+        return [(Action(first), Action(second)) for first, second in plays]
@@ -10,11 +10,18 @@ if some_key in cache:
     do_something(cache[some_key])
 else:
     ...
+
+PersistentDeterministicCache provides the same interface for a cache stored
+in an SQLite database, whose entries are read when they are looked up.
 """
 
 import pickle
-from collections import UserDict
-from typing import List, Tuple
+import sqlite3
+from collections import OrderedDict, UserDict
+from collections.abc import MutableMapping
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from axelrod import Classifiers
 
@@ -24,6 +31,11 @@ from .player import Player
 CachePlayerKey = Tuple[Player, Player]
 CacheKey = Tuple[str, str]
 
+C, D = Action.C, Action.D
+
+# The pairs of actions indexed by 2 * first action value + second action value.
+_PLAYS = ((C, C), (C, D), (D, C), (D, D))
+
 
 def _key_transform(key: CachePlayerKey) -> CacheKey:
     """Convert a CachePlayerKey to a CacheKey
@@ -33,7 +45,9 @@ def _key_transform(key: CachePlayerKey) -> CacheKey:
     key: tuple
         A 3-tuple: (player instance, player instance)
     """
-    return key[0].name, key[1].name
+    # The string of a player includes its parameters, which distinguishes
+    # players of the same strategy, such as Cyclers, sharing a cache.
+    return str(key[0]), str(key[1])
 
 
 def _is_valid_key(key: CachePlayerKey) -> bool:
@@ -174,3 +188,213 @@ class DeterministicCache(UserDict):
                 "Try deleting and re-building the cache file."
             )
         return True
+
+
+def _persistent_key_transform(key: CachePlayerKey) -> CacheKey:
+    """Convert a CachePlayerKey to the key of a persistent cache.
+
+    A persistent cache is shared by matches with different match attributes,
+    so the length of the match and the game are included for players that
+    make use of them.
+
+    Parameters
+    ----------
+    key: tuple
+        A 2-tuple: (player instance, player instance)
+    """
+    names = []
+    for player in key:
+        name = str(player)
+        makes_use_of = Classifiers["makes_use_of"](player)
+        for attribute in ("length", "game"):
+            if attribute in makes_use_of:
+                name += ", {}: {}".format(
+                    attribute, player.match_attributes[attribute]
+                )
+        names.append(name)
+    return names[0], names[1]
+
+
+def _pack_interactions(interactions: List) -> bytes:
+    """Packs a list of pairs of actions into bytes, one bit per action."""
+    values = np.array(
+        [action.value for plays in interactions for action in plays],
+        dtype=np.uint8,
+    )
+    return np.packbits(values).tobytes()
+
+
+def _unpack_interactions(data: bytes, turns: int) -> List:
+    """Unpacks the first turns pairs of actions packed by
+    _pack_interactions."""
+    values = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=2 * turns)
+    indices = 2 * values[::2] + values[1::2]
+    return [_PLAYS[index] for index in indices.tolist()]
+
+
+class PersistentDeterministicCache(MutableMapping):
+    """A deterministic cache stored in an SQLite database.
+
+    This behaves as DeterministicCache but entries are only read from the
+    database when they are looked up, and are written as soon as they are set,
+    with one bit per action. Entries are only replaced by longer ones, so a
+    cached match can be used for any shorter number of turns and is extended
+    when a longer match is played.
+
+    The cache can be shared by processes: it is pickled as its file name and
+    each process opens its own connection. An immutable cache is opened read
+    only. As the cache can be used for matches with different attributes, the
+    keys of players that make use of the length of a match or of the game
+    include them.
+
+    The most recently looked up entries are kept in memory, up to
+    max_entries of them.
+    """
+
+    max_entries = 1000
+
+    def __init__(self, file_name: str, mutable: bool = True) -> None:
+        """Open or create a cache.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to the database file, which is created if it does not exist
+            and the cache is mutable.
+        mutable : bool
+            Whether the cache can be updated.
+        """
+        self.file_name = file_name
+        self.mutable = mutable
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        # The entries most recently read by this process, oldest first.
+        self._entries = OrderedDict()  # type: OrderedDict
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.mutable:
+                connection = sqlite3.connect(
+                    self.file_name, timeout=60, isolation_level=None
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "player TEXT, opponent TEXT, turns INTEGER, actions BLOB, "
+                    "PRIMARY KEY (player, opponent))"
+                )
+            else:
+                connection = sqlite3.connect(
+                    "file:{}?mode=ro".format(self.file_name), uri=True
+                )
+            self._connection = connection
+        return self._connection
+
+    def _read(self, key: CacheKey) -> Optional[List]:
+        """Returns the entry for a key, reading it from the database if it has
+        not been read recently, or None if there is no entry."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        row = self.connection.execute(
+            "SELECT turns, actions FROM cache "
+            "WHERE player = ? AND opponent = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        value = _unpack_interactions(row[1], row[0])
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def _write(self, key: CacheKey, value: List) -> None:
+        """Writes an entry unless a longer one is stored."""
+        self.connection.execute(
+            "INSERT INTO cache VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (player, opponent) DO UPDATE SET "
+            "turns = excluded.turns, actions = excluded.actions "
+            "WHERE excluded.turns > cache.turns",
+            (*key, len(value), _pack_interactions(value)),
+        )
+        self._entries.pop(key, None)
+
+    def __getitem__(self, key: CachePlayerKey) -> List[Tuple[Action, Action]]:
+        value = self._read(_persistent_key_transform(key))
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self._read(_persistent_key_transform(key)) is not None
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        """Validate the key and value before setting them."""
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+
+        if not _is_valid_key(key):
+            raise ValueError(
+                "Key must be a tuple of 2 deterministic axelrod Player classes"
+            )
+
+        if not _is_valid_value(value):
+            raise ValueError(
+                "Value must be a list with length equal to turns attribute"
+            )
+
+        self._write(_persistent_key_transform(key), value)
+
+    def __delitem__(self, key: CachePlayerKey):
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+        key = _persistent_key_transform(key)
+        deleted = self.connection.execute(
+            "DELETE FROM cache WHERE player = ? AND opponent = ?", key
+        ).rowcount
+        self._entries.pop(key, None)
+        if not deleted:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[CacheKey]:
+        rows = self.connection.execute("SELECT player, opponent FROM cache")
+        return (tuple(row) for row in rows.fetchall())
+
+    def __len__(self) -> int:
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM cache"
+        ).fetchone()
+        return count
+
+    def __getstate__(self):
+        return {"file_name": self.file_name, "mutable": self.mutable}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def load(self, file_name: str) -> bool:
+        """Add the entries of a cache saved by DeterministicCache.save. Their
+        keys are used as they are.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to a previously saved cache file
+        """
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+        cache = DeterministicCache(file_name=file_name)
+        with self.connection:
+            self.connection.execute("BEGIN")
+            for key, value in cache.data.items():
+                self._write(key, value)
+        return True
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._entries = OrderedDict()
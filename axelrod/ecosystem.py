@@ -9,13 +9,31 @@ tournament = axelrod.Tournament(players=players)
 results = tournament.play()
 ecosystem = axelrod.Ecosystem(results)
 ecosystem.reproduce(100)
+
+The populations can also evolve continuously, following the replicator
+dynamics of the payoff matrix:
+
+solution = ecosystem.replicator_dynamics(100)
 """
 
-import random
-from typing import Callable, List
+from collections import namedtuple
+from typing import Callable, List, Optional
 
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from axelrod.random_ import RandomGenerator
 from axelrod.result_set import ResultSet
 
+# The relative population size below which a player is treated as extinct by
+# the replicator dynamics.
+_EXTINCT = 1e-200
+
+ReplicatorSolution = namedtuple(
+    "ReplicatorSolution",
+    "times populations stationary_points convergence_times",
+)
+
 
 class Ecosystem(object):
     """An ecosystem based on the payoff matrix from a tournament.
@@ -24,6 +42,9 @@ class Ecosystem(object):
     ----------
     num_players: int
         The number of players
+    population_sizes: numpy.ndarray
+        The relative population sizes of the players: one row per turn,
+        starting with the initial populations, and one column per player.
     """
 
     def __init__(
@@ -31,6 +52,7 @@ class Ecosystem(object):
         results: ResultSet,
         fitness: Callable[[float], float] = None,
         population: List[int] = None,
+        seed: Optional[int] = None,
     ) -> None:
         """Create a new ecosystem.
 
@@ -43,20 +65,25 @@ class Ecosystem(object):
         population: List of ints.
             The initial populations of the players, corresponding to the
             payoff matrix in results.
+        seed: int
+            A random seed for reproducibility
         """
 
         self.results = results
         self.num_players = self.results.num_players
-        self.payoff_matrix = self.results.payoff_matrix
-        self.payoff_stddevs = self.results.payoff_stddevs
-
-        # Population sizes will be recorded in this nested list, with each
-        # internal list containing strategy populations for a given turn. The
-        # first list, representing the starting populations, will by default
-        # have all equal values, and all population lists will be normalized to
-        # one. An initial population vector can also be passed. This will be
-        # normalised, but must be of the correct size and have all non-negative
-        # values.
+        self.payoff_matrix = np.asarray(self.results.payoff_matrix, dtype=float)
+        self.payoff_stddevs = np.asarray(
+            self.results.payoff_stddevs, dtype=float
+        )
+        self._random = RandomGenerator(seed=seed)
+
+        # Population sizes will be recorded in a 2D array, with each row
+        # containing strategy populations for a given turn. The first row,
+        # representing the starting populations, will by default have all
+        # equal values, and all population rows will be normalized to one. An
+        # initial population vector can also be passed. This will be
+        # normalised, but must be of the correct size and have all
+        # non-negative values.
         if population:
             if min(population) < 0:
                 raise TypeError(
@@ -68,11 +95,13 @@ class Ecosystem(object):
                 )
             else:
                 norm = sum(population)
-                self.population_sizes = [[p / norm for p in population]]
+                self.population_sizes = np.array(
+                    [[p / norm for p in population]]
+                )
         else:
-            self.population_sizes = [
-                [1 / self.num_players for _ in range(self.num_players)]
-            ]
+            self.population_sizes = np.full(
+                (1, self.num_players), 1 / self.num_players
+            )
 
         # This function is quite arbitrary and probably only influences the
         # kinetics for the current code.
@@ -89,9 +118,13 @@ class Ecosystem(object):
         turns: int
             The number of turns to run.
         """
-        for iturn in range(turns):
-            plist = list(range(self.num_players))
-            pops = self.population_sizes[-1]
+        start = len(self.population_sizes)
+        population_sizes = np.empty((start + turns, self.num_players))
+        population_sizes[:start] = self.population_sizes
+        self.population_sizes = population_sizes
+
+        for iturn in range(start, start + turns):
+            pops = population_sizes[iturn - 1]
 
             # The unit payoff for each player in this turn is the sum of the
             # payoffs obtained from playing with all other players, scaled by
@@ -99,23 +132,157 @@ class Ecosystem(object):
             # normal distribution based on the payoff matrix and its standard
             # deviations obtained from the iterated PD tournament run
             # previously.
-            payoffs = [0.0 for ip in plist]
-            for ip in plist:
-                for jp in plist:
-                    avg = self.payoff_matrix[ip][jp]
-                    dev = self.payoff_stddevs[ip][jp]
-                    p = random.normalvariate(avg, dev)
-                    payoffs[ip] += p * pops[jp]
+            payoffs = (
+                self._random.normal(self.payoff_matrix, self.payoff_stddevs)
+                @ pops
+            )
 
             # The fitness should determine how well a strategy reproduces. The
             # new populations should be multiplied by something that is
             # proportional to the fitness, but we are normalizing anyway so
             # just multiply times fitness.
-            fitness = [self.fitness(p) for p in payoffs]
-            newpops = [p * f for p, f in zip(pops, fitness)]
+            fitness = np.fromiter(
+                map(self.fitness, payoffs), dtype=float, count=self.num_players
+            )
+            newpops = pops * fitness
 
             # Make sure the new populations are normalized to one.
-            norm = sum(newpops)
-            newpops = [p / norm for p in newpops]
+            population_sizes[iturn] = newpops / newpops.sum()
+
+    def replicator_dynamics(
+        self,
+        time: float,
+        populations=None,
+        tolerance: float = 1e-8,
+        method: str = "RK45",
+        rtol: float = 1e-8,
+        atol: float = 1e-10,
+    ) -> ReplicatorSolution:
+        """Integrate the replicator dynamics of the payoff matrix.
+
+        The relative population size x_i of each player grows at a rate equal
+        to the difference between its payoff (A x)_i and the mean payoff
+        x . A x, where A is the payoff matrix:
+
+            dx_i / dt = x_i ((A x)_i - x . A x)
+
+        The payoffs are used as the fitness: the fitness function is not
+        applied. Several initial populations are integrated at once, with an
+        adaptive solver, which stops when all of them have converged.
+
+        Parameters
+        ----------
+        time: float
+            The maximum time to integrate for.
+        populations: array-like
+            An initial population vector, or a 2D array with one initial
+            population vector per row. Each is normalised to one. Defaults to
+            the last populations in population_sizes.
+        tolerance: float
+            A population has converged once the rates of change of the sizes
+            of all players stay below this value.
+        method: str
+            The integration method of scipy.integrate.solve_ivp. Implicit
+            methods estimate a Jacobian over all initial populations at once,
+            so explicit methods are faster for large batches.
+        rtol, atol: float
+            The relative and absolute tolerances of the solver.
+
+        Returns
+        -------
+        ReplicatorSolution
+            A named tuple of:
+
+            - times: the times chosen by the solver, starting at 0;
+            - populations: the populations at those times, with one row per
+              time (and then one row per initial population if several were
+              given);
+            - stationary_points: the populations they converged to, or NaN
+              for those which did not converge before `time`;
+            - convergence_times: the times after which they stayed within
+              `tolerance` of a stationary point, or infinity.
+        """
+        if populations is None:
+            populations = self.population_sizes[-1]
+        populations = np.array(populations, dtype=float)
+        single = populations.ndim == 1
+        populations = np.atleast_2d(populations)
+        if populations.shape[1] != self.num_players:
+            raise TypeError(
+                "Population vector must be same size as number of players"
+            )
+        if populations.min() < 0:
+            raise TypeError(
+                "Minimum value of population vector must be non-negative"
+            )
+        populations /= populations.sum(axis=1, keepdims=True)
+        shape = populations.shape
+
+        def derivative(_, y):
+            x = y.reshape(shape)
+            # Extinct populations decay towards subnormal floats, which make
+            # matrix products very slow.
+            x = np.where(np.abs(x) < _EXTINCT, 0, x)
+            payoffs = x @ self.payoff_matrix.T
+            mean_payoffs = np.sum(x * payoffs, axis=1, keepdims=True)
+            return (x * (payoffs - mean_payoffs)).ravel()
+
+        def rates(y):
+            """The largest rate of change of each population."""
+            return np.abs(derivative(None, y).reshape(shape)).max(axis=1)
+
+        def converged(t, y):
+            return rates(y).max() - tolerance
+
+        # The solver stops when all rates fall below the tolerance.
+        setattr(converged, "terminal", True)
+        setattr(converged, "direction", -1)
+
+        if rates(populations.ravel()).max() < tolerance:
+            # All populations start at stationary points.
+            times = np.zeros(1)
+            trajectory = populations[np.newaxis]
+            stationary_points = populations.copy()
+            convergence_times = np.zeros(shape[0])
+        else:
+            solution = solve_ivp(
+                derivative,
+                (0, time),
+                populations.ravel(),
+                method=method,
+                rtol=rtol,
+                atol=atol,
+                events=converged,
+            )
+            times = solution.t
+            trajectory = solution.y.T.reshape((len(times),) + shape)
+
+            moving = np.array([rates(y) >= tolerance for y in solution.y.T])
+            if solution.status == 1:
+                # The solver stopped when all populations converged.
+                moving[-1] = False
+            # The index of the first time after the last one at which each
+            # population was still moving.
+            last_moving = np.where(
+                moving.any(axis=0),
+                len(times) - 1 - np.argmax(moving[::-1], axis=0),
+                -1,
+            )
+            has_converged = last_moving < len(times) - 1
+            convergence_times = np.full(shape[0], np.inf)
+            convergence_times[has_converged] = times[
+                last_moving[has_converged] + 1
+            ]
+            stationary_points = np.full(shape, np.nan)
+            stationary_points[has_converged] = trajectory[-1][has_converged]
 
-            self.population_sizes.append(newpops)
+        if single:
+            return ReplicatorSolution(
+                times,
+                trajectory[:, 0],
+                stationary_points[0],
+                convergence_times[0],
+            )
+        return ReplicatorSolution(
+            times, trajectory, stationary_points, convergence_times
+        )
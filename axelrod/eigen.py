@@ -69,7 +69,7 @@ def principal_eigenvector(
         Eigenvalue corresponding to the returned eigenvector
     """
 
-    mat_ = np.array(mat)
+    mat_ = np.asarray(mat)
     size = mat_.shape[0]
     initial = np.ones(size)
 
@@ -77,7 +77,7 @@ def principal_eigenvector(
     if not maximum_iterations:
         maximum_iterations = float("inf")
     last = initial
-    for i, vector in enumerate(_power_iteration(mat, initial=initial)):
+    for i, vector in enumerate(_power_iteration(mat_, initial=initial)):
         if i > maximum_iterations:
             break
         if _squared_error(vector, last) < max_error:
@@ -1,22 +1,24 @@
-import os
+import warnings
 from collections import namedtuple
-from tempfile import mkstemp
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 
-import dask.dataframe as dd
 import matplotlib.pyplot as plt
 import numpy as np
 import tqdm
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 import axelrod as axl
-from axelrod import Player
+from axelrod import Player, markov
+from axelrod.action import Action
 from axelrod.interaction_utils import (
     compute_final_score_per_turn,
+    read_action_arrays,
     read_interactions_from_file,
 )
 from axelrod.strategy_transformers import DualTransformer, JossAnnTransformer
 
+C = Action.C
+
 Point = namedtuple("Point", "x y")
 
 
@@ -152,23 +154,49 @@ def _create_edges(points: List[Point], progress_bar: bool = True) -> list:
     return edges
 
 
-def _generate_data(interactions: dict, points: list, edges: list) -> dict:
+class _ScoreAccumulator(object):
+    """Accumulates the score per turn of the strategy against each probe as
+    the matches of a spatial tournament are played.
+
+    It is passed to `Tournament.play` so that the interactions are not kept
+    in memory. The scores are taken from the results of the matches if they
+    are calculated, and otherwise from their interactions.
+    """
+
+    def __init__(self, edges: list) -> None:
+        self.edge_indices = {edge: index for index, edge in enumerate(edges)}
+        self.sums = np.zeros(len(edges))  # type: np.ndarray
+        self.counts = np.zeros(len(edges), dtype=np.int64)  # type: np.ndarray
+
+    def add_results(self, results: dict) -> None:
+        """Adds the results of a chunk of matches as returned by
+        `Tournament._play_matches`."""
+        for edge, interactions in results.items():
+            index = self.edge_indices[edge]
+            for interaction, match_results, _ in interactions:
+                # The score per turn of the first player of the edge.
+                if match_results is None:
+                    score = compute_final_score_per_turn(interaction)[0]
+                else:
+                    score = match_results[3][0]
+                self.sums[index] += score
+                self.counts[index] += 1
+
+
+def _generate_data(accumulator: _ScoreAccumulator, points: list) -> dict:
     """Generates useful data from a spatial tournament.
 
-    Matches interactions from `results` to their corresponding Point in
-    `probe_points`.
+    Matches the scores accumulated from the matches of each edge to their
+    corresponding Point in `points`, the edges and points being in the same
+    order.
 
     Parameters
     ----------
-    interactions : dict
-        A dictionary mapping edges to the corresponding interactions of
-        those players.
+    accumulator : _ScoreAccumulator
+        The scores per turn of the strategy accumulated over the matches of
+        the spatial tournament.
     points : list
         of Point objects with coordinates (x, y).
-    edges : list of tuples
-        A list containing tuples of length 2. All tuples will have either 0
-        or 1 as the first element. The second element is the index of the
-        corresponding probe (+1 to allow for including the Strategy).
 
     Returns
     ----------
@@ -176,16 +204,8 @@ def _generate_data(interactions: dict, points: list, edges: list) -> dict:
         A dictionary where the keys are Points of the form (x, y) and
         the values are the mean score for the corresponding interactions.
     """
-    edge_scores = [
-        np.mean(
-            [
-                compute_final_score_per_turn(scores)[0]
-                for scores in interactions[edge]
-            ]
-        )
-        for edge in edges
-    ]
-    point_scores = dict(zip(points, edge_scores))
+    edge_scores = accumulator.sums / accumulator.counts
+    point_scores = dict(zip(points, edge_scores.tolist()))
     return point_scores
 
 
@@ -217,6 +237,140 @@ def _reshape_data(data: dict, points: list, size: int) -> np.ndarray:
     return plotting_data
 
 
+def _create_player(strategy: Union[type, Player]) -> Player:
+    """Returns a new instance of a strategy given as a class or an
+    instance."""
+    if isinstance(strategy, axl.Player):
+        return strategy.clone()
+    return strategy()
+
+
+def _probe_machines(probe: Union[type, Player], turns: int) -> tuple:
+    """Returns finite state descriptions of a probe and of its dual.
+
+    The dual plays the opposite of the probe when both have the same
+    history, so its state is updated as if its own actions were flipped.
+    """
+    player = _create_player(probe)
+    player.set_match_attributes(length=turns)
+    initial, probability, next_state = markov.player_machine(player)
+
+    def dual_probability(state):
+        return 1 - probability(state)
+
+    def dual_next_state(state, action, opponent_action):
+        return next_state(state, 1 - action, opponent_action)
+
+    return (
+        (initial, probability, next_state),
+        (initial, dual_probability, dual_next_state),
+    )
+
+
+def _exact_scores(
+    strategy_machine: tuple,
+    probe_machine: tuple,
+    cooperation: np.ndarray,
+    weight: np.ndarray,
+    turns: int,
+    game: axl.Game,
+    block_size: int = 2**22,
+) -> np.ndarray:
+    """Returns the expected score per turn of a strategy against probes.
+
+    The probe at index i cooperates with probability cooperation[i] +
+    weight[i] * p in a state of the chain in which the probe described by
+    `probe_machine` cooperates with probability p. The distribution of the
+    states of the chain is propagated turn by turn for all probes at once,
+    in blocks of probes.
+    """
+    _, strategy_probabilities, probe_probabilities, successors = (
+        markov.product_chain(strategy_machine, probe_machine)
+    )
+    size = len(successors)
+    payoffs = np.ravel(game.A)
+    scores = np.empty(len(cooperation))
+    block = max(1, block_size // (4 * size))
+    for start in range(0, len(cooperation), block):
+        p = strategy_probabilities[np.newaxis, :, np.newaxis]
+        q = (
+            cooperation[start : start + block, np.newaxis]
+            + weight[start : start + block, np.newaxis]
+            * probe_probabilities[np.newaxis, :]
+        )[:, :, np.newaxis]
+        # The probabilities of CC, CD, DC and DD in each state.
+        transitions = np.concatenate(
+            [p * q, p * (1 - q), (1 - p) * q, (1 - p) * (1 - q)], axis=2
+        )
+        rewards = transitions @ payoffs
+        targets = (
+            np.arange(len(q))[:, np.newaxis, np.newaxis] * size
+            + successors[np.newaxis, :, :]
+        ).ravel()
+        distribution = np.zeros((len(q), size))
+        distribution[:, 0] = 1
+        total = np.zeros(len(q))
+        for _ in range(turns):
+            total += np.sum(distribution * rewards, axis=1)
+            distribution = np.bincount(
+                targets,
+                weights=(distribution[:, :, np.newaxis] * transitions).ravel(),
+                minlength=distribution.size,
+            ).reshape(distribution.shape)
+        scores[start : start + block] = total / turns
+    return scores
+
+
+def _generate_exact_data(
+    strategy: Union[type, Player],
+    probe: Union[type, Player],
+    points: List[Point],
+    turns: int,
+) -> dict:
+    """Computes the expected score per turn of a strategy against the probe
+    of each point by solving the Markov chain of their match.
+
+    Below the diagonal x + y = 1 the probe cooperates with probability x,
+    defects with probability y and otherwise plays as the probe. On and
+    above it, the probe is the dual of the Joss-Ann transformed probe with
+    probabilities (1 - x, 1 - y): it cooperates with probability 1 - y,
+    defects with probability 1 - x and otherwise plays as the dual of the
+    probe.
+
+    Returns
+    ----------
+    point_scores : dict
+        A dictionary where the keys are Points of the form (x, y) and
+        the values are the expected score per turn of the strategy.
+    """
+    game = axl.Game()
+    player = _create_player(strategy)
+    player.set_match_attributes(length=turns, game=game)
+    strategy_machine = markov.player_machine(player)
+    probe_machine, dual_probe_machine = _probe_machines(probe, turns)
+
+    x, y = np.array(points, dtype=float).reshape(-1, 2).T
+    dual = x + y >= 1
+    scores = np.empty(len(points))
+    scores[~dual] = _exact_scores(
+        strategy_machine,
+        probe_machine,
+        x[~dual],
+        (1 - x - y)[~dual],
+        turns,
+        game,
+    )
+    scores[dual] = _exact_scores(
+        strategy_machine,
+        dual_probe_machine,
+        (1 - y)[dual],
+        (x + y - 1)[dual],
+        turns,
+        game,
+    )
+    return dict(zip(points, scores.tolist()))
+
+
 class AshlockFingerprint(object):
     def __init__(
         self,
@@ -236,6 +390,29 @@ class AshlockFingerprint(object):
         """
         self.strategy = strategy
         self.probe = probe
+        self.filename = None  # type: Optional[str]
+
+    @property
+    def interactions(self) -> dict:
+        """
+        The interactions of the spatial tournament, read back from the file
+        given to `fingerprint`.
+
+        Deprecated: the interactions are no longer kept in memory, use
+        `axelrod.interaction_utils.read_interactions_from_file` instead.
+        """
+        warnings.warn(
+            "AshlockFingerprint.interactions is deprecated, read the "
+            "interactions from the file given to fingerprint with "
+            "axelrod.interaction_utils.read_interactions_from_file instead.",
+            DeprecationWarning,
+        )
+        if self.filename is None:
+            raise AttributeError(
+                "The interactions are only available if a filename is given "
+                "to fingerprint."
+            )
+        return read_interactions_from_file(self.filename, progress_bar=False)
 
     def _construct_tournament_elements(
         self, step: float, progress_bar: bool = True
@@ -284,6 +461,7 @@ class AshlockFingerprint(object):
         filename: str = None,
         progress_bar: bool = True,
         seed: int = None,
+        exact: bool = False,
     ) -> dict:
         """Build and play the spatial tournament.
 
@@ -306,11 +484,20 @@ class AshlockFingerprint(object):
             The number of processes to be used for parallel processing
         filename: str, optional
             The name of the file for self.spatial_tournament's interactions.
-            if None, will auto-generate a filename.
+            If None, the interactions are not written: the scores are
+            accumulated as the matches are played.
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
         seed : int, optional
             Random seed for reproducibility
+        exact : bool, optional
+            Whether to compute the expected score against each probe instead
+            of playing the spatial tournament. A match between a strategy
+            and a probe with a finite state (memory-one players, finite state
+            machines, LookerUp and Gambler players) is a finite Markov chain
+            so its expected score can be computed without sampling noise. In
+            this case `repetitions`, `processes`, `filename` and `seed` are
+            not used.
 
         Returns
         ----------
@@ -318,10 +505,14 @@ class AshlockFingerprint(object):
             A dictionary where the keys are coordinates of the form (x, y) and
             the values are the mean score for the corresponding interactions.
         """
-
-        temp_file_descriptor = None
-        if filename is None:
-            temp_file_descriptor, filename = mkstemp()  # type: ignore
+        self.filename = None if exact else filename
+        if exact:
+            self.step = step
+            self.points = _create_points(step, progress_bar=progress_bar)
+            self.data = _generate_exact_data(
+                self.strategy, self.probe, self.points, turns
+            )
+            return self.data
 
         edges, tourn_players = self._construct_tournament_elements(
             step, progress_bar=progress_bar
@@ -335,23 +526,18 @@ class AshlockFingerprint(object):
             edges=edges,
             seed=seed,
         )
+        accumulator = _ScoreAccumulator(edges)
+        # The file holds the interactions without the results of the
+        # matches, which are only calculated if no file is written.
         self.spatial_tournament.play(
-            build_results=False,
+            build_results=filename is None,
             filename=filename,
             processes=processes,
             progress_bar=progress_bar,
+            accumulator=accumulator,
         )
 
-        self.interactions = read_interactions_from_file(
-            filename, progress_bar=progress_bar
-        )
-
-        if temp_file_descriptor is not None:
-            assert filename is not None
-            os.close(temp_file_descriptor)
-            os.remove(filename)
-
-        self.data = _generate_data(self.interactions, self.points, edges)
+        self.data = _generate_data(accumulator, self.points)
         return self.data
 
     def plot(
@@ -409,6 +595,62 @@ class AshlockFingerprint(object):
         return fig
 
 
+class _CooperationAccumulator(object):
+    """Accumulates the number of cooperations of the first player of each
+    match, in each turn, against each opponent.
+
+    It is passed to `Tournament.play` so that the interactions are neither
+    written to file nor kept in memory, and is also used to analyse the rows
+    of an interactions file.
+    """
+
+    def __init__(self, number_of_players: int, turns: int) -> None:
+        self.sums = np.zeros(
+            (number_of_players, turns), dtype=np.int64
+        )  # type: np.ndarray
+        self.counts = np.zeros(
+            number_of_players, dtype=np.int64
+        )  # type: np.ndarray
+
+    def add_results(self, results: dict) -> None:
+        """Adds the interactions of a chunk of matches as returned by
+        `Tournament._play_matches`."""
+        for (_, opponent_index), interactions in results.items():
+            sums = self.sums[opponent_index]
+            for interaction, _, _ in interactions:
+                sums[: len(interaction)] += [
+                    action == C for action, _ in interaction
+                ]
+                self.counts[opponent_index] += 1
+
+    def add_rows(
+        self,
+        opponent_indices: np.ndarray,
+        lengths: np.ndarray,
+        defections: np.ndarray,
+    ) -> None:
+        """Adds rows of an interactions file from the point of view of the
+        first player, as read by `read_action_arrays`."""
+        turns = np.arange(len(defections)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        cells = (
+            np.repeat(opponent_indices, lengths) * self.sums.shape[1] + turns
+        )
+        self.sums += (
+            np.bincount(cells, weights=1 - defections, minlength=self.sums.size)
+            .reshape(self.sums.shape)
+            .astype(np.int64)
+        )
+        self.counts += np.bincount(opponent_indices, minlength=len(self.counts))
+
+    def cooperation_rates(self) -> np.ndarray:
+        """Returns the mean cooperation rate in each turn against each
+        opponent that was played."""
+        played = self.counts > 0
+        return self.sums[played] / self.counts[played, np.newaxis]
+
+
 class TransitiveFingerprint(object):
     def __init__(self, strategy, opponents=None, number_of_opponents=50):
         """
@@ -460,7 +702,8 @@ class TransitiveFingerprint(object):
             The number of processes to be used for parallel processing
         filename: str, optional
             The name of the file for spatial tournament's interactions.
-            if None, a filename will be generated.
+            If None, the interactions are not written: the cooperations are
+            accumulated as the matches are played.
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
 
@@ -477,10 +720,6 @@ class TransitiveFingerprint(object):
         else:
             players = [self.strategy()] + self.opponents
 
-        temp_file_descriptor = None
-        if filename is None:
-            temp_file_descriptor, filename = mkstemp()  # type: ignore
-
         edges = [(0, k + 1) for k in range(len(self.opponents))]
         tournament = axl.Tournament(
             players=players,
@@ -490,20 +729,16 @@ class TransitiveFingerprint(object):
             repetitions=repetitions,
             seed=seed,
         )
+        accumulator = _CooperationAccumulator(len(players), turns)
         tournament.play(
             filename=filename,
             build_results=False,
             progress_bar=progress_bar,
             processes=processes,
+            accumulator=accumulator,
         )
 
-        self.data = self.analyse_cooperation_ratio(filename)
-
-        if temp_file_descriptor is not None:
-            assert filename is not None
-            os.close(temp_file_descriptor)
-            os.remove(filename)
-
+        self.data = accumulator.cooperation_rates()
         return self.data
 
     @staticmethod
@@ -516,7 +751,8 @@ class TransitiveFingerprint(object):
         Parameters
         ----------
         filename : str
-            The filename of the interactions
+            The filename of the interactions, in either the CSV or the binary
+            format.
 
         Returns
         ----------
@@ -525,32 +761,25 @@ class TransitiveFingerprint(object):
             opponent in each turn. The ith row corresponds to the ith opponent
             and the jth column the jth turn.
         """
-        did_c = np.vectorize(
-            lambda actions: [int(action == "C") for action in actions]
+        (
+            player_indices,
+            opponent_indices,
+            lengths,
+            defections,
+        ) = read_action_arrays(filename)
+        # We ignore the actions of all opponents. So we only keep the rows of
+        # the player with index `0`.
+        rows = player_indices == 0
+        accumulator = _CooperationAccumulator(
+            int(opponent_indices.max(initial=0)) + 1,
+            int(lengths.max(initial=0)),
         )
-
-        cooperation_rates = {}
-        df = dd.read_csv(filename)
-        # We ignore the actions of all opponents. So we filter the dataframe to
-        # only include the results of the player with index `0`.
-        df = df[df["Player index"] == 0][["Opponent index", "Actions"]]
-
-        for _, row in df.iterrows():
-            opponent_index, player_history = (
-                row["Opponent index"],
-                row["Actions"],
-            )
-            if opponent_index in cooperation_rates:
-                cooperation_rates[opponent_index].append(did_c(player_history))
-            else:
-                cooperation_rates[opponent_index] = [did_c(player_history)]
-
-        for index, rates in cooperation_rates.items():
-            cooperation_rates[index] = np.mean(rates, axis=0)
-
-        return np.array(
-            [cooperation_rates[index] for index in sorted(cooperation_rates)]
+        accumulator.add_rows(
+            opponent_indices[rows],
+            lengths[rows],
+            defections[np.repeat(rows, lengths)],
         )
+        return accumulator.cooperation_rates()
 
     def plot(
         self,
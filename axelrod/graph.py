@@ -6,6 +6,8 @@ https://github.com/marcharper/stationary/blob/master/stationary/utils/graph.py
 
 from collections import defaultdict
 
+import numpy as np
+
 
 class Graph(object):
     """Weighted and directed graph class.
@@ -21,7 +23,8 @@ class Graph(object):
 
     For efficiency, neighbors are cached in dictionaries. Undirected
     graphs are implemented as directed graphs in which every edge (s, t)
-    has the opposite edge (t, s).
+    has the opposite edge (t, s). A compressed sparse row representation of
+    the adjacency, suited to large sparse graphs, is given by `to_csr`.
 
     Attributes
     ----------
@@ -44,20 +47,23 @@ class Graph(object):
         self.out_mapping = defaultdict(lambda: defaultdict(float))
         self.in_mapping = defaultdict(lambda: defaultdict(float))
         self._edges = []
+        self._edge_set = set()
         if edges:
             self._add_edges(edges)
 
     def _add_edge(self, source, target, weight=None):
-        if (source, target) not in self._edges:
+        if (source, target) not in self._edge_set:
             self._edges.append((source, target))
+            self._edge_set.add((source, target))
             self.out_mapping[source][target] = weight
             self.in_mapping[target][source] = weight
         if (
             not self.directed
             and (source != target)
-            and (target, source) not in self._edges
+            and (target, source) not in self._edge_set
         ):
             self._edges.append((target, source))
+            self._edge_set.add((target, source))
             self.out_mapping[target][source] = weight
             self.in_mapping[source][target] = weight
 
@@ -95,6 +101,39 @@ class Graph(object):
         """Returns a list of the outgoing vertices."""
         return list(self.in_mapping[source].keys())
 
+    def to_csr(self, vertices=None):
+        """
+        Returns the compressed sparse row representation of the adjacency of
+        the graph: the outgoing vertices of the vertex at position i are at
+        positions indices[indptr[i]:indptr[i + 1]], in increasing order.
+
+        Parameters
+        ----------
+        vertices: list
+            The order of the vertices, by default the sorted vertices.
+
+        Returns
+        -------
+        indptr, indices: numpy arrays of integers
+        """
+        if vertices is None:
+            vertices = sorted(self.vertices)
+        position = {vertex: i for i, vertex in enumerate(vertices)}
+        rows = [
+            (
+                sorted(position[target] for target in self.out_mapping[vertex])
+                if vertex in self.out_mapping
+                else []
+            )
+            for vertex in vertices
+        ]
+        indptr = np.zeros(len(vertices) + 1, dtype=np.intp)
+        indptr[1:] = np.cumsum([len(row) for row in rows])
+        indices = np.fromiter(
+            (i for row in rows for i in row), dtype=np.intp, count=indptr[-1]
+        )
+        return indptr, indices
+
     def __repr__(self):
         s = "<Graph: {}>".format(repr(self.original_edges))
         return s
@@ -165,3 +204,44 @@ def attached_complete_graphs(length, loops=True, directed=False):
         graph.add_loops()
 
     return graph
+
+
+def lattice(width, height, periodic=True, loops=False, directed=False):
+    """
+    Produces a square lattice of width x height vertices, in which each vertex
+    is connected to its (up to) four nearest neighbors. The vertex in column x
+    of row y is labelled y * width + x.
+
+    Parameters
+    ----------
+    width: int
+        Number of vertices in each row
+    height: int
+        Number of vertices in each column
+    periodic: bool, True
+        Connect opposite edges of the lattice, giving a torus
+    loops: bool, False
+        attach loops at each node?
+    directed: bool, False
+        Is the graph directed?
+
+    Returns
+    -------
+    a Graph object for the lattice
+    """
+    edges = []
+    for y in range(height):
+        for x in range(width):
+            vertex = y * width + x
+            if x + 1 < width:
+                edges.append((vertex, vertex + 1))
+            elif periodic and width > 2:
+                edges.append((vertex, y * width))
+            if y + 1 < height:
+                edges.append((vertex, vertex + width))
+            elif periodic and height > 2:
+                edges.append((vertex, x))
+    graph = Graph(edges=edges, directed=directed)
+    if loops:
+        graph.add_loops()
+    return graph
@@ -1,9 +1,35 @@
 from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
 
 from axelrod.action import Action, actions_to_str
 
 C, D = Action.C, Action.D
 
+# Maps action values (0 for C and 1 for D) back to actions.
+_ACTIONS = np.array([C, D], dtype=object)
+_ACTION_TUPLE = (C, D)
+# The length below which a list comprehension converts values to actions
+# faster than indexing _ACTIONS.
+_SHORT_SLICE = 64
+# The states (play, coplay) indexed by 2 * play value + coplay value.
+_STATES = ((C, C), (C, D), (D, C), (D, D))
+# The initial capacity of an ArrayHistory of unknown length.
+_DEFAULT_CAPACITY = 64
+
+
+def _values(actions):
+    """Returns the values of an iterable of actions as an array."""
+    return np.array([action.value for action in actions], dtype=np.uint8)
+
+
+def _to_actions(values):
+    """Returns the list of actions of an array of action values."""
+    if len(values) < _SHORT_SLICE:
+        return [_ACTION_TUPLE[value] for value in values.tolist()]
+    return _ACTIONS[values].tolist()
+
 
 class History(object):
     """
@@ -55,6 +81,30 @@ class History(object):
         self._coplays.extend(coplays)
         self._state_distribution.update(zip(plays, coplays))
 
+    def repeat_cycle(self, length, turns):
+        """Extends the history to the given number of turns by repeating its
+        last `length` entries.
+
+        The counts of actions and states are updated once per repetition of
+        the cycle rather than once per entry.
+        """
+        repeats, remainder = divmod(turns - len(self._plays), length)
+        cycle = (self._plays[-length:], self._coplays[-length:])
+        for plays, coplays, times in (
+            (cycle[0], cycle[1], repeats),
+            (cycle[0][:remainder], cycle[1][:remainder], 1),
+        ):
+            actions = Counter(plays)
+            states = Counter(zip(plays, coplays))
+            for key in actions:
+                actions[key] *= times
+            for key in states:
+                states[key] *= times
+            self._actions.update(actions)
+            self._state_distribution.update(states)
+            self._plays.extend(plays * times)
+            self._coplays.extend(coplays * times)
+
     def reset(self):
         """Clears all data in the History object."""
         self._plays.clear()
@@ -138,3 +188,337 @@ class LimitedHistory(History):
             first_play, first_coplay = self._plays.pop(0), self._coplays.pop(0)
             self._actions[first_play] -= 1
             self._state_distribution[(first_play, first_coplay)] -= 1
+
+
+class ActionArray(Sequence):
+    """
+    A read only sequence of the plays or the coplays of an ArrayHistory,
+    backed by its array of action values.
+
+    Indexing with an integer returns an action and slicing returns a list
+    of actions, so that an ActionArray can be used in place of the lists of
+    actions of History. It follows the history as it is appended to.
+    """
+
+    def __init__(self, history, coplays=False):
+        """
+        Parameters
+        ----------
+        history: ArrayHistory
+            The history holding the values of the actions (0 for C and 1 for
+            D).
+        coplays: bool
+            Whether the actions are the coplays rather than the plays.
+        """
+        self._history = history
+        self._index = int(coplays)
+
+    @property
+    def values(self):
+        """The values of the actions, as a view of the underlying array."""
+        return self._history._window()[self._index]
+
+    def __getitem__(self, key):
+        history = self._history
+        if key.__class__ is slice:
+            values = (
+                history._coplay_values if self._index else history._play_values
+            )
+            return history._slice(values, key)
+        return history._action(key, self._index)
+
+    def __len__(self):
+        return self._history._length
+
+    def __eq__(self, other):
+        return self[:] == list(other)
+
+    def __repr__(self):
+        return repr(self[:])
+
+
+class ArrayHistory(History):
+    """
+    History class storing the plays and coplays in preallocated arrays of
+    action values, with running counts of the states.
+
+    Appending is O(1) and the counts of cooperations, defections and states
+    are computed from 4 running counts. The underlying arrays are available
+    without copies as `plays_array` and `coplays_array`. The arrays grow as
+    needed but can be sized up front with `reserve`.
+
+    Reading a single action costs a few times more than with History, and
+    slicing more again as the values are converted to a list of actions, but
+    this is outweighed by the cheaper appends and counts: matches between
+    strategies reading the last actions or the counts, such as Tit For Tat,
+    Grudger or First by Tideman and Chieruzzi, are faster than with History.
+    Strategies which repeatedly read long slices of the history are slower.
+    """
+
+    def __init__(self, plays=None, coplays=None, length=None):
+        """
+        Parameters
+        ----------
+        plays:
+            An ordered iterable of the actions of the player.
+        coplays:
+            An ordered iterable of the actions of the coplayer (aka opponent).
+        length: int
+            The number of plays to allocate memory for.
+        """
+        self._length = 0
+        self._play_values = np.empty(0, dtype=np.uint8)
+        self._coplay_values = np.empty(0, dtype=np.uint8)
+        self._state_counts = [0, 0, 0, 0]
+        # The position of the first play in the arrays.
+        self._offset = 0
+        self._plays_view = ActionArray(self)
+        self._coplays_view = ActionArray(self, coplays=True)
+        self.reserve(_DEFAULT_CAPACITY if length is None else length)
+        if plays:
+            self.extend(plays, coplays)
+
+    def reserve(self, length):
+        """Ensures there is memory allocated for the given number of plays."""
+        if length == float("inf") or length <= len(self._play_values):
+            return
+        length = int(length)
+        for name in ("_play_values", "_coplay_values"):
+            values = np.empty(length, dtype=np.uint8)
+            values[: self._length] = getattr(self, name)[: self._length]
+            setattr(self, name, values)
+
+    def _window(self):
+        """Returns views of the values of the plays and coplays."""
+        return (
+            self._play_values[: self._length],
+            self._coplay_values[: self._length],
+        )
+
+    def _slice(self, values, key):
+        """Returns the list of the plays, or coplays, in a slice of the
+        history, given their array."""
+        start, stop, step = key.indices(self._length)
+        if step < 0:
+            return _to_actions(
+                values[self._offset : self._offset + self._length][key]
+            )
+        offset = self._offset
+        return _to_actions(values[offset + start : offset + stop : step])
+
+    def _action(self, key, coplays=False):
+        """Returns the play, or the coplay, at an integer index."""
+        length = self._length
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("history index out of range")
+        values = self._coplay_values if coplays else self._play_values
+        return _ACTION_TUPLE[values.item(self._offset + key)]
+
+    def append(self, play, coplay):
+        """Appends a new (play, coplay) pair and updates the counts."""
+        length = self._length
+        if length == len(self._play_values):
+            self.reserve(max(2 * length, 1))
+        play, coplay = play.value, coplay.value
+        self._play_values[length] = play
+        self._coplay_values[length] = coplay
+        self._state_counts[2 * play + coplay] += 1
+        self._length = length + 1
+
+    def _add_counts(self, plays, coplays):
+        counts = np.bincount(2 * plays + coplays, minlength=4)
+        for index, count in enumerate(counts.tolist()):
+            self._state_counts[index] += count
+
+    def extend(self, plays, coplays):
+        """A function that emulates list.extend."""
+        plays, coplays = _values(plays), _values(coplays)
+        start, end = self._length, self._length + len(plays)
+        self.reserve(max(end, 2 * start))
+        self._play_values[start:end] = plays
+        self._coplay_values[start:end] = coplays
+        self._length = end
+        self._add_counts(plays, coplays)
+
+    def repeat_cycle(self, length, turns):
+        """Extends the history to the given number of turns by repeating its
+        last `length` entries."""
+        start = self._length
+        self.reserve(turns)
+        for values in (self._play_values, self._coplay_values):
+            values[start:turns] = np.resize(
+                values[start - length : start], turns - start
+            )
+        self._length = max(start, turns)
+        self._add_counts(
+            self._play_values[start:turns], self._coplay_values[start:turns]
+        )
+
+    def reset(self):
+        """Clears all data in the History object."""
+        self._length = 0
+        self._state_counts = [0, 0, 0, 0]
+
+    @property
+    def plays_array(self):
+        """The values of the plays, as a view of the underlying array."""
+        return self._window()[0]
+
+    @property
+    def coplays_array(self):
+        """The values of the coplays, as a view of the underlying array."""
+        return self._window()[1]
+
+    @property
+    def _plays(self):
+        return self._plays_view[:]
+
+    @property
+    def _coplays(self):
+        return self._coplays_view[:]
+
+    @property
+    def coplays(self):
+        return self._coplays_view
+
+    @property
+    def cooperations(self):
+        return self._state_counts[0] + self._state_counts[1]
+
+    @property
+    def defections(self):
+        return self._state_counts[2] + self._state_counts[3]
+
+    @property
+    def state_distribution(self):
+        return Counter(
+            {
+                state: count
+                for state, count in zip(_STATES, self._state_counts)
+                if count
+            }
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, ArrayHistory):
+            return np.array_equal(
+                self.plays_array, other.plays_array
+            ) and np.array_equal(self.coplays_array, other.coplays_array)
+        return super().__eq__(other)
+
+    def __getitem__(self, key):
+        if key.__class__ is slice:
+            return self._slice(self._play_values, key)
+        length = self._length
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("history index out of range")
+        return _ACTION_TUPLE[self._play_values.item(self._offset + key)]
+
+    def __len__(self):
+        return self._length
+
+
+class LimitedArrayHistory(ArrayHistory):
+    """
+    ArrayHistory class that only tracks the last N rounds in a ring buffer.
+
+    Each entry is written twice, N entries apart, so that the last N entries
+    are always a contiguous view of the buffer.
+    """
+
+    def __init__(self, memory_depth, plays=None, coplays=None):
+        """
+        Parameters
+        ----------
+        memory_depth, int:
+            length of history to retain
+        """
+        self.memory_depth = memory_depth
+        # The total number of plays, including those that were dropped.
+        self._total = 0
+        super().__init__(length=2 * memory_depth)
+        if plays:
+            self.extend(plays, coplays)
+
+    def reserve(self, length):
+        """The memory used is fixed by the memory depth."""
+        if not len(self._play_values):
+            super().reserve(2 * self.memory_depth)
+
+    def _window(self):
+        start = self._offset
+        end = start + self._length
+        return self._play_values[start:end], self._coplay_values[start:end]
+
+    def copy(self):
+        """Returns a new object with the same data."""
+        return self.__class__(
+            self.memory_depth, plays=self._plays, coplays=self._coplays
+        )
+
+    def flip_plays(self):
+        """Creates a flipped plays history for use with DualTransformer."""
+        flipped_plays = [action.flip() for action in self._plays]
+        return self.__class__(
+            self.memory_depth, plays=flipped_plays, coplays=self._coplays
+        )
+
+    def append(self, play, coplay):
+        """Appends a new (play, coplay) pair, dropping the oldest pair if the
+        memory depth is exceeded, and updates the counts."""
+        depth = self.memory_depth
+        if not depth:
+            return
+        position = self._total % depth
+        plays, coplays = self._play_values, self._coplay_values
+        if self._length == depth:
+            dropped = 2 * int(plays[position]) + int(coplays[position])
+            self._state_counts[dropped] -= 1
+        else:
+            self._length += 1
+        play, coplay = play.value, coplay.value
+        plays[position] = plays[position + depth] = play
+        coplays[position] = coplays[position + depth] = coplay
+        self._state_counts[2 * play + coplay] += 1
+        self._total += 1
+        if self._total > depth:
+            self._offset = self._total % depth
+
+    def extend(self, plays, coplays):
+        """A function that emulates list.extend."""
+        for play, coplay in zip(plays, coplays):
+            self.append(play, coplay)
+
+    def repeat_cycle(self, length, turns):
+        """Extends the history to the given number of turns, counting the
+        dropped plays, by repeating its last `length` entries.
+
+        A cycle longer than the memory depth is not kept in full, so it can
+        only be repeated a whole number of times, which leaves the last N
+        entries unchanged.
+        """
+        if length > self.memory_depth and turns > self._total:
+            if (turns - self._total) % length:
+                raise ValueError(
+                    "A cycle longer than the memory depth can only be "
+                    "repeated a whole number of times."
+                )
+            if self.memory_depth:
+                plays, coplays = self._plays, self._coplays
+                self.reset()
+                self._total = turns - len(plays)
+                self.extend(plays, coplays)
+            return
+        cycle = list(zip(self[-length:], self.coplays[-length:]))
+        for index in range(turns - self._total):
+            self.append(*cycle[index % length])
+
+    def reset(self):
+        """Clears all data in the History object."""
+        super().reset()
+        self._total = 0
+        self._offset = 0
@@ -8,8 +8,10 @@ This is used by both the Match class and the ResultSet class which analyse
 interactions.
 """
 
+import zipfile
 from collections import Counter, defaultdict
 
+import numpy as np
 import pandas as pd
 import tqdm
 
@@ -258,9 +260,10 @@ def read_interactions_from_file(filename, progress_bar=True):
     Reads a file and returns a dictionary mapping tuples of player pairs to
     lists of interactions
     """
-    df = pd.read_csv(filename)[
-        ["Interaction index", "Player index", "Opponent index", "Actions"]
-    ]
+    columns = ["Interaction index", "Player index", "Opponent index", "Actions"]
+    if is_binary_interactions_file(filename):
+        return _read_binary_interactions(filename, progress_bar=progress_bar)
+    df = pd.read_csv(filename)[columns]
     groupby = df.groupby("Interaction index")
     if progress_bar:
         groupby = tqdm.tqdm(groupby)
@@ -273,6 +276,252 @@ def read_interactions_from_file(filename, progress_bar=True):
     return pairs_to_interactions
 
 
+def _read_binary_interactions(filename, progress_bar=True):
+    """
+    Reads a binary interactions file and returns a dictionary mapping tuples
+    of player pairs to lists of interactions
+    """
+    with np.load(filename) as data:
+        player_indices = data["Player index"]
+        opponent_indices = data["Opponent index"]
+        lengths = _upcast(data["Action lengths"])
+        bits = _unpack_actions(data)
+    ends = np.cumsum(lengths)
+
+    actions = np.array([C, D], dtype=object)
+    rows = range(0, len(lengths), 2)
+    if progress_bar:
+        rows = tqdm.tqdm(rows)
+
+    pairs_to_interactions = defaultdict(list)
+    for row in rows:
+        key = (int(player_indices[row]), int(opponent_indices[row]))
+        start = ends[row] - lengths[row]
+        plays = actions[bits[start : ends[row]]]
+        coplays = actions[bits[ends[row] : ends[row + 1]]]
+        pairs_to_interactions[key].append(list(zip(plays, coplays)))
+    return pairs_to_interactions
+
+
+# The columns of an interactions file which are not stored as arrays in the
+# binary format.
+_NAME_COLUMNS = ("Player name", "Opponent name")
+_ACTIONS_COLUMN = "Actions"
+# The number of rows held in lists before being converted to arrays.
+_BUFFER_SIZE = 10000
+
+
+class BinaryInteractionsWriter(object):
+    """
+    Writes the rows of an interactions file, as produced by
+    axelrod.Tournament, to a NumPy .npz file rather than a CSV file.
+
+    Numeric columns are stored as typed arrays and the actions of every row
+    are bit-packed (1 for D) into a single array, along with the number of
+    actions of each row. Player names are stored once per player. Rows are
+    buffered and converted to compact arrays regularly, bit-packing the
+    actions, so that the rows held in memory take about as much space as
+    the file; the file is written when the writer is closed.
+    """
+
+    def __init__(self, filename, header):
+        """
+        Parameters
+        ----------
+        filename : string
+            The file to write to
+        header : list
+            The names of the columns of the rows
+        """
+        self.filename = filename
+        self.header = list(header)
+        self.names = {}
+        self._rows = []
+        self._arrays = {
+            column: []
+            for column in self.header
+            if column not in _NAME_COLUMNS + (_ACTIONS_COLUMN,)
+        }
+        self._actions = []
+        # The actions left over after packing the whole bytes of a block.
+        self._action_bits = np.array([], dtype=bool)
+        self._action_lengths = []
+
+    def writerow(self, row):
+        """Adds a row with one entry per column of the header."""
+        self._rows.append(row)
+        if len(self._rows) >= _BUFFER_SIZE:
+            self._flush()
+
+    def _flush(self):
+        """Converts the buffered rows to arrays and bit-packs their
+        actions."""
+        if not self._rows:
+            return
+        columns = dict(zip(self.header, zip(*self._rows)))
+        for column, arrays in self._arrays.items():
+            arrays.append(_downcast(np.array(columns[column])))
+        for index, name in zip(columns["Player index"], columns["Player name"]):
+            self.names[index] = name
+
+        actions = "".join(columns[_ACTIONS_COLUMN]).encode()
+        bits = np.concatenate(
+            [
+                self._action_bits,
+                np.frombuffer(actions, dtype=np.uint8) == ord("D"),
+            ]
+        )
+        whole_bytes = len(bits) - len(bits) % 8
+        self._actions.append(np.packbits(bits[:whole_bytes]))
+        self._action_bits = bits[whole_bytes:]
+        self._action_lengths.append(
+            _downcast(
+                np.array([len(actions) for actions in columns[_ACTIONS_COLUMN]])
+            )
+        )
+        self._rows = []
+
+    def close(self):
+        """Writes the file."""
+        self._flush()
+        arrays = {
+            column: _downcast(np.concatenate(chunks or [np.array([], int)]))
+            for column, chunks in self._arrays.items()
+        }
+        lengths = np.concatenate(self._action_lengths or [np.array([], int)])
+        arrays["Actions"] = np.concatenate(
+            self._actions + [np.packbits(self._action_bits)]
+        )
+        arrays["Action lengths"] = _downcast(lengths)
+        arrays["Header"] = np.array(self.header)
+        indices = sorted(self.names)
+        arrays["Names"] = np.array([self.names[i] for i in indices] or [""])
+        arrays["Name indices"] = np.array(indices, dtype=int)
+        with open(self.filename, "wb") as file_obj:
+            np.savez(file_obj, **arrays)
+
+
+def _downcast(array):
+    """Returns an integer array using the smallest integer type that holds
+    its values."""
+    if array.dtype.kind not in "iu" or not len(array):
+        return array
+    dtype = np.result_type(
+        np.min_scalar_type(array.min()), np.min_scalar_type(array.max())
+    )
+    return array.astype(dtype)
+
+
+def _upcast(array):
+    """Returns an integer array as 64 bit integers, as read from a CSV
+    file."""
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64)
+    return array
+
+
+def is_binary_interactions_file(filename):
+    """Returns True if the file was written by BinaryInteractionsWriter."""
+    return zipfile.is_zipfile(filename)
+
+
+def _unpack_actions(data):
+    """Returns the action values (0 for C and 1 for D) of all rows."""
+    count = int(_upcast(data["Action lengths"]).sum())
+    return np.unpackbits(data["Actions"], count=count)
+
+
+def read_binary_interactions_header(filename):
+    """Returns the names of the columns of a binary interactions file."""
+    with np.load(filename) as data:
+        return data["Header"].tolist()
+
+
+def read_binary_interactions(filename, columns=None):
+    """
+    Reads a binary interactions file into a pandas DataFrame with the same
+    columns as the corresponding CSV file.
+
+    Parameters
+    ----------
+    filename : string
+        A file written by BinaryInteractionsWriter
+    columns : list
+        The columns to read. All columns are read by default. Reading the
+        names and the actions is slower than reading numeric columns.
+    """
+    with np.load(filename) as data:
+        header = data["Header"].tolist()
+        if columns is None:
+            columns = header
+        df = pd.DataFrame(
+            {
+                column: _upcast(data[column])
+                for column in columns
+                if column not in _NAME_COLUMNS + (_ACTIONS_COLUMN,)
+            }
+        )
+        if set(_NAME_COLUMNS) & set(columns):
+            names = dict(
+                zip(data["Name indices"].tolist(), data["Names"].tolist())
+            )
+            for column, indices in zip(
+                _NAME_COLUMNS, ("Player index", "Opponent index")
+            ):
+                if column in columns:
+                    df[column] = [names[i] for i in data[indices].tolist()]
+        if _ACTIONS_COLUMN in columns:
+            lengths = _upcast(data["Action lengths"])
+            bits = _unpack_actions(data)
+            characters = np.array(["C", "D"])[bits]
+            ends = np.cumsum(lengths).tolist()
+            df[_ACTIONS_COLUMN] = [
+                "".join(characters[end - length : end])
+                for end, length in zip(ends, lengths.tolist())
+            ]
+    return df[[column for column in header if column in columns]]
+
+
+def read_action_arrays(filename):
+    """
+    Reads the actions of every row of an interactions file, in either format,
+    as arrays rather than as strings or Action objects.
+
+    Parameters
+    ----------
+    filename : string
+        A CSV file or a file written by BinaryInteractionsWriter
+
+    Returns
+    -------
+    player_indices, opponent_indices : numpy.ndarray
+        The indices of the player and of the opponent of each row.
+    lengths : numpy.ndarray
+        The number of actions of each row.
+    defections : numpy.ndarray
+        The actions of all rows, one after the other: 1 for D and 0 for C.
+    """
+    if is_binary_interactions_file(filename):
+        with np.load(filename) as data:
+            return (
+                _upcast(data["Player index"]),
+                _upcast(data["Opponent index"]),
+                _upcast(data["Action lengths"]),
+                _unpack_actions(data),
+            )
+    df = pd.read_csv(
+        filename, usecols=["Player index", "Opponent index", "Actions"]
+    )
+    actions = df["Actions"].fillna("").astype(str)
+    defections = np.frombuffer("".join(actions).encode(), dtype=np.uint8)
+    return (
+        df["Player index"].to_numpy(),
+        df["Opponent index"].to_numpy(),
+        actions.str.len().to_numpy(),
+        (defections == ord("D")).astype(np.uint8),
+    )
+
+
 def string_to_interactions(string):
     """
     Converts a compact string representation of an interaction to an
@@ -1,18 +1,22 @@
 import inspect
 import re
-from typing import Callable, Set, Text, Type, Union
+from functools import lru_cache
+from typing import Callable, FrozenSet, Set, Text, Type, Union
 
 from axelrod.player import Player
 
 
-def method_makes_use_of(method: Callable) -> Set[Text]:
-    result = set()
-    method_code = inspect.getsource(method)
+@lru_cache(maxsize=None)
+def _source_makes_use_of(obj: Callable) -> FrozenSet[Text]:
+    # Reading the source is slow so it is only done once per function.
+    method_code = inspect.getsource(obj)
     attr_string = r".match_attributes\[\"(\w+)\"\]"
-    all_attrs = re.findall(attr_string, method_code)
-    for attr in all_attrs:
-        result.add(attr)
-    return result
+    return frozenset(re.findall(attr_string, method_code))
+
+
+def method_makes_use_of(method: Callable) -> Set[Text]:
+    # Bound methods are keyed by their function as players are not hashable.
+    return set(_source_makes_use_of(getattr(method, "__func__", method)))
 
 
 def class_makes_use_of(cls) -> Set[Text]:
@@ -36,7 +40,7 @@ def makes_use_of(player: Type[Player]) -> Set[Text]:
 
 
 def makes_use_of_variant(
-    player_or_method: Union[Callable, Type[Player]]
+    player_or_method: Union[Callable, Type[Player]],
 ) -> Set[Text]:
     """A version of makes_use_of that works on functions or player classes."""
     try:
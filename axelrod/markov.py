@@ -0,0 +1,461 @@
+"""Exact expected outcomes of matches between memory-one players.
+
+A match between two memory-one players is a Markov chain on the four states
+(CC, CD, DC, DD) of the last round of play (from the point of view of the
+first player). This module builds the transition matrix of that chain from
+the players' four-vectors and uses it to compute the expected state
+distribution and expected scores of a match without playing it.
+
+For example:
+
+>>> import axelrod as axl
+>>> from axelrod import markov
+>>> players = (axl.GTFT(), axl.ZDExtort2())
+>>> markov.expected_scores(*players, turns=200, noise=0.05)  # doctest: +SKIP
+(1.8842665562305583, 2.681431108402805)
+
+More generally, a match between two players whose behaviour only depends on
+a finite state (memory-one players, finite state machines and lookup table
+players) is a Markov chain on the pairs of states of the players, described
+by `player_machine` and `product_chain`.
+"""
+
+from typing import Callable, Hashable, List, Tuple
+
+import numpy as np
+
+from axelrod import DEFAULT_TURNS
+from axelrod.action import Action
+from axelrod.batch_match import memory_one_parameters
+from axelrod.game import Game
+from axelrod.player import Player
+from axelrod.strategies.finite_state_machines import FSMPlayer
+from axelrod.strategies.gambler import Gambler
+from axelrod.strategies.lookerup import LookerUp
+
+C, D = Action.C, Action.D
+
+# The position, in a four-vector of the second player, of each state as seen
+# by the first player: CD for the first player is DC for the second.
+_COPLAYER_STATES = [0, 2, 1, 3]
+
+# Tail probability below which the length distribution is truncated.
+_TOLERANCE = 1e-15
+# Number of turns whose state distributions are computed at once.
+_BLOCK_SIZE = 256
+
+
+def _with_noise(probabilities: np.ndarray, noise: float) -> np.ndarray:
+    """Returns the probabilities of cooperating once intended actions are
+    flipped with probability `noise`."""
+    probabilities = np.asarray(probabilities, dtype=float)
+    return probabilities * (1 - noise) + (1 - probabilities) * noise
+
+
+def transition_matrix(
+    four_vector_1, four_vector_2, noise: float = 0
+) -> np.ndarray:
+    """Returns the transition matrix of a match between two memory-one
+    players.
+
+    Parameters
+    ----------
+    four_vector_1, four_vector_2 : iterable
+        The probabilities of cooperating after CC, CD, DC and DD, from the
+        point of view of each player.
+    noise : float
+        The probability that a player's intended action is flipped.
+
+    Returns
+    -------
+    numpy.ndarray
+        A 4 by 4 row stochastic matrix over the states (CC, CD, DC, DD) seen
+        by the first player.
+    """
+    p = _with_noise(four_vector_1, noise)
+    q = _with_noise(four_vector_2, noise)[_COPLAYER_STATES]
+    return np.column_stack([p * q, p * (1 - q), (1 - p) * q, (1 - p) * (1 - q)])
+
+
+def initial_distribution(
+    initial_1: Action, initial_2: Action, noise: float = 0
+) -> np.ndarray:
+    """Returns the distribution of the first state of a match.
+
+    Parameters
+    ----------
+    initial_1, initial_2 : axelrod.Action
+        The first move of each player.
+    noise : float
+        The probability that a player's intended action is flipped.
+
+    Returns
+    -------
+    numpy.ndarray
+        The probabilities of the first round being CC, CD, DC and DD.
+    """
+    p, q = _with_noise([initial_1 == C, initial_2 == C], noise)
+    return np.array([p * q, p * (1 - q), (1 - p) * q, (1 - p) * (1 - q)])
+
+
+def _power_sum(matrix: np.ndarray, n: int) -> np.ndarray:
+    """Returns the sum of the first n powers of matrix, starting at the
+    identity, using O(log(n)) products."""
+    size = len(matrix)
+    total = np.zeros((size, size))
+    # Reading the bits of n from the lowest: block_sum is the sum of the
+    # first 2 ** k powers, block_power is matrix ** (2 ** k) and power is
+    # matrix raised to the number of powers already added to total.
+    power = np.eye(size)
+    block_sum, block_power = np.eye(size), matrix
+    for bit in reversed(bin(n)[2:]):
+        if bit == "1":
+            total = total + power @ block_sum
+            power = power @ block_power
+        block_sum = block_sum + block_sum @ block_power
+        block_power = block_power @ block_power
+    return total
+
+
+def _cesaro_limit(matrix: np.ndarray) -> np.ndarray:
+    """Returns the limit of the average of the powers of matrix.
+
+    For an aperiodic chain this is simply the limit of the powers. Periodic
+    chains are handled by averaging over 12 consecutive powers, as 12 is a
+    multiple of every possible period of a chain with 4 states.
+    """
+    power = matrix.copy()
+    for _ in range(64):
+        power = power @ power
+        power /= power.sum(axis=1, keepdims=True)
+    limit = np.zeros_like(matrix)
+    for _ in range(12):
+        limit += power
+        power = power @ matrix
+    return limit / 12
+
+
+def _length_weights(turns: float, prob_end: float) -> np.ndarray:
+    """Returns, for each turn t, the expected value of 1 / n over the
+    matches of length n > t.
+
+    The mean over a match of any per turn quantity x_t is the sum of x_t / n
+    over the turns so its expected value is the sum of x_t times these
+    weights.
+    """
+    if prob_end == 1:
+        return np.ones(1)
+    if turns == float("inf"):
+        turns = int(np.ceil(np.log(_TOLERANCE) / np.log(1 - prob_end)))
+    lengths = np.arange(1, turns + 1)
+    probabilities = prob_end * (1 - prob_end) ** (lengths - 1)
+    # Longer matches are truncated to `turns`.
+    probabilities[-1] = (1 - prob_end) ** (turns - 1)
+    return np.cumsum((probabilities / lengths)[::-1])[::-1]
+
+
+def mean_state_distribution(
+    initial: np.ndarray,
+    matrix: np.ndarray,
+    turns: float = DEFAULT_TURNS,
+    prob_end: float = 0,
+) -> np.ndarray:
+    """Returns the expected proportion of turns spent in each state of a
+    Markov chain.
+
+    Parameters
+    ----------
+    initial : numpy.ndarray
+        The distribution of the first state.
+    matrix : numpy.ndarray
+        The row stochastic transition matrix.
+    turns : int or float("inf")
+        The maximum number of turns.
+    prob_end : float
+        The probability of a given turn ending the match.
+
+    Returns
+    -------
+    numpy.ndarray
+        The expected value, over matches, of the proportion of turns of the
+        match spent in each state. For an infinite number of turns and no
+        probabilistic ending this is the long run (stationary) distribution.
+    """
+    if not prob_end:
+        if turns == float("inf"):
+            return initial @ _cesaro_limit(matrix)
+        return initial @ _power_sum(matrix, int(turns)) / turns
+    weights = _length_weights(turns, prob_end)
+    powers = [np.eye(len(matrix))]
+    for _ in range(min(_BLOCK_SIZE, len(weights)) - 1):
+        powers.append(powers[-1] @ matrix)
+    powers = np.array(powers)
+    block_power = powers[-1] @ matrix
+
+    distribution = np.zeros_like(initial)
+    state = initial
+    for start in range(0, len(weights), len(powers)):
+        block_weights = weights[start : start + len(powers)]
+        states = np.einsum("i,tij->tj", state, powers[: len(block_weights)])
+        distribution += block_weights @ states
+        state = state @ block_power
+    return distribution / weights.sum()
+
+
+def _set_up(
+    player1: Player,
+    player2: Player,
+    turns: float,
+    prob_end: float,
+    noise: float,
+    game: Game,
+) -> Tuple[np.ndarray, np.ndarray, float, float, Game]:
+    """Returns the initial distribution, transition matrix, length
+    parameters and game of a match, following the conventions of
+    axelrod.Match."""
+    defaults = {
+        (True, True): (DEFAULT_TURNS, 0),
+        (True, False): (float("inf"), prob_end),
+        (False, True): (turns, 0),
+        (False, False): (turns, prob_end),
+    }
+    turns, prob_end = defaults[(turns is None, prob_end is None)]
+    if game is None:
+        game = Game()
+
+    known_turns = turns if not prob_end else float("inf")
+    vectors, initials = [], []
+    for player in (player1, player2):
+        player.set_match_attributes(length=known_turns, game=game, noise=noise)
+        four_vector, initial = memory_one_parameters(player)
+        vectors.append(four_vector)
+        initials.append(initial)
+
+    initial = initial_distribution(*initials, noise=noise)
+    matrix = transition_matrix(*vectors, noise=noise)
+    return initial, matrix, turns, prob_end, game
+
+
+def expected_state_distribution(
+    player1: Player,
+    player2: Player,
+    turns: int = None,
+    prob_end: float = None,
+    noise: float = 0,
+    game: Game = None,
+) -> np.ndarray:
+    """Returns the expected normalised state distribution of a match between
+    two memory-one players.
+
+    Parameters
+    ----------
+    player1, player2 : axelrod.Player
+        Memory-one players.
+    turns : integer or float("inf")
+        The number of turns per match
+    prob_end : float
+        The probability of a given turn ending a match
+    noise : float
+        The probability that a player's intended action should be flipped
+    game : axelrod.Game
+        The game object used to score the match
+
+    Returns
+    -------
+    numpy.ndarray
+        The expected proportion of turns spent in states CC, CD, DC and DD,
+        from the point of view of the first player.
+    """
+    initial, matrix, turns, prob_end, _ = _set_up(
+        player1, player2, turns, prob_end, noise, game
+    )
+    return mean_state_distribution(initial, matrix, turns, prob_end)
+
+
+def expected_scores(
+    player1: Player,
+    player2: Player,
+    turns: int = None,
+    prob_end: float = None,
+    noise: float = 0,
+    game: Game = None,
+) -> Tuple[float, float]:
+    """Returns the expected mean score per turn of both players in a match
+    between two memory-one players.
+
+    This is the expected value of `axelrod.Match.final_score_per_turn`. The
+    parameters are the same as for `expected_state_distribution`.
+    """
+    initial, matrix, turns, prob_end, game = _set_up(
+        player1, player2, turns, prob_end, noise, game
+    )
+    distribution = mean_state_distribution(initial, matrix, turns, prob_end)
+    return (
+        float(distribution @ np.ravel(game.A)),
+        float(distribution @ np.ravel(game.B)),
+    )
+
+
+# A finite state description of a player: its initial state, its probability
+# of cooperating in a state and its next state given a state, its own action
+# and the action of its opponent (0 for C and 1 for D).
+Machine = Tuple[Hashable, Callable, Callable]
+
+
+def _memory_one_machine(player: Player) -> Machine:
+    """The states are -1 before the first turn and then the index of the
+    last state (CC, CD, DC or DD) of the match."""
+    four_vector, initial = memory_one_parameters(player)
+    probabilities = {-1: float(initial == C)}
+    probabilities.update(enumerate(four_vector.tolist()))
+
+    def next_state(state, action, opponent_action):
+        return 2 * action + opponent_action
+
+    return -1, probabilities.__getitem__, next_state
+
+
+def _fsm_machine(player: FSMPlayer) -> Machine:
+    """The states are the state of the machine and the action it will
+    play."""
+    next_states, next_actions, indices = player.fsm.compile()
+    next_states, next_actions = next_states.tolist(), next_actions.tolist()
+
+    def probability(state):
+        return 1.0 - state[1]
+
+    def next_state(state, action, opponent_action):
+        return (
+            next_states[state[0]][opponent_action],
+            next_actions[state[0]][opponent_action],
+        )
+
+    initial = (indices[player.initial_state], player.initial_action.value)
+    return initial, probability, next_state
+
+
+def _lookup_machine(player: LookerUp) -> Machine:
+    """The states are the number of turns played (up to the depth of the
+    table), the last plays of both players and the opening plays of the
+    opponent."""
+    table = player._lookup
+    depth = table.table_depth
+    initial_actions = player._initial_actions_pool
+    actions = (C, D)
+
+    def probability(state):
+        turn, plays, op_plays, op_openings = state
+        if turn < len(initial_actions):
+            reaction = initial_actions[turn]
+        else:
+            reaction = table.get(
+                plays[len(plays) - table.player_depth :],
+                op_plays[len(op_plays) - table.op_depth :],
+                op_openings,
+            )
+        if isinstance(reaction, Action):
+            return float(reaction == C)
+        return float(reaction)
+
+    def next_state(state, action, opponent_action):
+        turn, plays, op_plays, op_openings = state
+        plays = (plays + (actions[action],))[len(plays) + 1 - depth :]
+        op_plays = (op_plays + (actions[opponent_action],))[
+            len(op_plays) + 1 - depth :
+        ]
+        if len(op_openings) < table.op_openings_depth:
+            op_openings += (actions[opponent_action],)
+        return min(turn + 1, depth), plays, op_plays, op_openings
+
+    return (0, (), (), ()), probability, next_state
+
+
+def player_machine(player: Player) -> Machine:
+    """Returns a finite state description of a player.
+
+    Memory-one players, finite state machines and lookup table players
+    (LookerUp, Gambler and their subclasses) are supported, provided their
+    strategy method has not been overridden. The player's match attributes
+    should already be set.
+
+    Parameters
+    ----------
+    player : axelrod.Player
+
+    Returns
+    -------
+    initial : hashable
+        The state of the player before the first turn.
+    probability : function
+        Mapping a state to the probability of cooperating in that state.
+    next_state : function
+        Mapping a state, the action of the player and the action of its
+        opponent (0 for C and 1 for D) to the next state of the player.
+    """
+    strategy = type(player).strategy
+    try:
+        return _memory_one_machine(player)
+    except TypeError:
+        pass
+    if strategy is FSMPlayer.strategy:
+        return _fsm_machine(player)
+    if strategy in (LookerUp.strategy, Gambler.strategy):
+        return _lookup_machine(player)
+    raise TypeError("{} does not have a finite state.".format(player))
+
+
+def product_chain(
+    machine1: Machine, machine2: Machine, max_states: int = 10000
+) -> Tuple[List[Tuple], np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the Markov chain of a match between two players described by
+    `player_machine`.
+
+    The states of the chain are the pairs of states of the players that can
+    be reached by any sequence of actions, starting from the pair of initial
+    states.
+
+    Parameters
+    ----------
+    machine1, machine2 : tuple
+        The finite state descriptions of the players.
+    max_states : int
+        The maximum number of states of the chain.
+
+    Returns
+    -------
+    states : list
+        The pairs of states, the first being the initial one.
+    probabilities1, probabilities2 : numpy.ndarray
+        The probability of each player cooperating in each state.
+    successors : numpy.ndarray
+        successors[i, k] is the index of the state following state i when
+        the players play the k-th of CC, CD, DC and DD (from the point of
+        view of the first player).
+    """
+    initial1, probability1, next_state1 = machine1
+    initial2, probability2, next_state2 = machine2
+    states = [(initial1, initial2)]
+    indices = {states[0]: 0}
+    successors = []
+    for state1, state2 in states:
+        row = []
+        for action1 in (0, 1):
+            for action2 in (0, 1):
+                state = (
+                    next_state1(state1, action1, action2),
+                    next_state2(state2, action2, action1),
+                )
+                if state not in indices:
+                    if len(states) == max_states:
+                        raise ValueError(
+                            "The chain has more than {} states.".format(
+                                max_states
+                            )
+                        )
+                    indices[state] = len(states)
+                    states.append(state)
+                row.append(indices[state])
+        successors.append(row)
+    probabilities1 = np.array([probability1(state) for state, _ in states])
+    probabilities2 = np.array([probability2(state) for _, state in states])
+    return states, probabilities1, probabilities2, np.array(successors)
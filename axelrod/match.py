@@ -30,6 +30,8 @@ class Match(object):
         match_attributes=None,
         reset=True,
         seed=None,
+        detect_cycles=False,
+        history_class=None,
     ):
         """
         Parameters
@@ -54,6 +56,14 @@ class Match(object):
             Whether to reset players or not
         seed : int
             Random seed for reproducibility
+        detect_cycles : bool
+            Whether to stop calling the players' strategies once a cycle of
+            play is detected in a deterministic match, repeating the cycle
+            for the remaining turns instead. The players end the match in
+            the state described by their `state_key` after the last turn.
+        history_class : type
+            A class, such as axelrod.ArrayHistory, used for the histories of
+            the players in place of axelrod.History when they are reset.
         """
 
         defaults = {
@@ -91,6 +101,8 @@ class Match(object):
 
         self.players = list(players)
         self.reset = reset
+        self.detect_cycles = detect_cycles
+        self.history_class = history_class
 
     def set_seed(self, seed):
         """Sets a random seed for the Match, for reproducibility. Initializes
@@ -115,6 +127,7 @@ class Match(object):
             player.set_match_attributes(**self.match_attributes)
             newplayers.append(player)
         self._players = newplayers
+        self._players_allow_cycle_detection = None
 
     @property
     def _stochastic(self):
@@ -135,6 +148,49 @@ class Match(object):
             and not (any(Classifiers["stochastic"](p) for p in self.players))
         )
 
+    @property
+    def _cycle_detection_possible(self):
+        """
+        A boolean to show whether cycles can be detected: the match must be
+        deterministic and the players must not depend on the length of the
+        match or on anything other than the history of play.
+        """
+        if not self.detect_cycles or self._stochastic:
+            return False
+        # Inspecting the players is relatively expensive so it is done once.
+        if self._players_allow_cycle_detection is None:
+            self._players_allow_cycle_detection = all(
+                Classifiers.obey_axelrod(player)
+                and "length" not in Classifiers["makes_use_of"](player)
+                for player in self.players
+            )
+        return self._players_allow_cycle_detection
+
+    def _joint_state_key(self):
+        """Returns the state keys of both players or None if either is
+        unknown."""
+        keys = tuple(player.state_key() for player in self.players)
+        if None in keys:
+            return None
+        return keys
+
+    def _repeat_cycle(self, result, start, turns):
+        """Extends result, as well as the players' histories, by as many
+        whole repetitions of the turns from start onwards as fit in the given
+        number of turns.
+
+        The players are in the same state at the end of each repetition as at
+        the start of the cycle so the remaining turns can be played as usual,
+        leaving the players in the state they would have reached by playing
+        every turn.
+        """
+        length = len(result) - start
+        repeats = (turns - len(result)) // length
+        end = len(result) + repeats * length
+        for player in self.players:
+            player.history.repeat_cycle(length, end)
+        result.extend(result[start:] * repeats)
+
     def _cached_enough_turns(self, cache_key, turns):
         """
         Returns true iff there are is a entry in self._cache for the given key and
@@ -186,12 +242,25 @@ class Match(object):
             for p in self.players:
                 if self.reset:
                     p.reset()
+                    if self.history_class is not None:
+                        p._history = self.history_class()
+                        p.history.reserve(turns)
                 p.set_match_attributes(**self.match_attributes)
                 # Generate a random seed for the player, if stochastic
                 if Classifiers["stochastic"](p):
                     p.set_seed(self._random.random_seed_int())
             result = []
-            for _ in range(turns):
+            detect_cycles = self._cycle_detection_possible
+            seen = {}
+            while len(result) < turns:
+                if detect_cycles:
+                    key = self._joint_state_key()
+                    if key in seen:
+                        self._repeat_cycle(result, seen[key], turns)
+                        detect_cycles = False
+                        continue
+                    if key is not None:
+                        seen[key] = len(result)
                 plays = self.simultaneous_play(
                     self.players[0], self.players[1], self.noise
                 )
@@ -1,4 +1,10 @@
-from axelrod.random_ import BulkRandomGenerator
+from math import ceil
+
+from axelrod.classifier import Classifiers
+from axelrod.random_ import BulkRandomGenerator, RandomGenerator
+
+# The relative cost per turn of a player classified as having a long run time.
+LONG_RUN_TIME_COST = 100
 
 
 class MatchGenerator(object):
@@ -13,6 +19,10 @@ class MatchGenerator(object):
         edges=None,
         match_attributes=None,
         seed=None,
+        detect_cycles=False,
+        balance_chunks=False,
+        player_costs=None,
+        deterministic_cache=None,
     ):
         """
         A class to generate matches. This is used by the Tournament class which
@@ -39,6 +49,22 @@ class MatchGenerator(object):
             The default is to use the correct values for turns, game and noise
             but these can be overridden if desired.
         seed : int
+        detect_cycles : bool
+            Whether matches should detect cycles of deterministic play
+        balance_chunks : bool
+            Whether to balance the cost of chunks: the repetitions of
+            expensive matches are split across chunks, cheap matches are
+            grouped together and chunks are ordered from the most to the least
+            expensive. Each repetition then has its own seed so that results
+            do not depend on how matches are chunked.
+        player_costs : dict
+            Mapping player names to their relative cost per turn, for example
+            from the timings of a previous run, used to balance chunks. By
+            default this is estimated from the classifiers of the players.
+        deterministic_cache : axelrod.DeterministicCache
+            A cache of resulting actions for deterministic matches shared by
+            all matches, for example an axelrod.PersistentDeterministicCache.
+            By default each match has its own cache.
         """
         self.players = players
         self.turns = turns
@@ -49,6 +75,10 @@ class MatchGenerator(object):
         self.prob_end = prob_end
         self.match_attributes = match_attributes
         self.random_generator = BulkRandomGenerator(seed)
+        self.detect_cycles = detect_cycles
+        self.balance_chunks = balance_chunks
+        self.player_costs = player_costs
+        self.deterministic_cache = deterministic_cache
 
         self.edges = edges
         if edges is not None:
@@ -59,6 +89,10 @@ class MatchGenerator(object):
             n = len(self.players)
             self.size = int(n * (n - 1) // 2 + n)
 
+        if balance_chunks:
+            self._chunk_plan = self._build_chunk_plan()
+            self.size = len(self._chunk_plan)
+
     def __len__(self):
         return self.size
 
@@ -70,18 +104,101 @@ class MatchGenerator(object):
         Yields
         -------
         tuples
-            ((player1 index, player2 index), match object)
+            ((player1 index, player2 index), match parameters, repetitions,
+            seed)
+
+            If chunks are balanced, each chunk is instead a list of such
+            tuples in which repetitions is a range of repetition indices and
+            seed is a list of seeds, one per repetition.
         """
-        if self.edges is None:
-            edges = complete_graph(self.players)
-        else:
-            edges = self.edges
+        if self.balance_chunks:
+            yield from self._build_balanced_match_chunks()
+            return
 
-        for index_pair in edges:
+        for index_pair in self._edges():
             match_params = self.build_single_match_params()
             r = next(self.random_generator)
             yield (index_pair, match_params, self.repetitions, r)
 
+    def _edges(self):
+        if self.edges is None:
+            return complete_graph(self.players)
+        return self.edges
+
+    def _build_chunk_plan(self):
+        """
+        Splits the repetitions of the matches into chunks of similar cost.
+
+        The target cost of a chunk is the mean cost of all the repetitions of
+        a match. All matches of a tournament have the same expected number of
+        turns so the cost of a repetition is the sum of the costs per turn of
+        the players.
+
+        Returns
+        -------
+        list
+            Lists of (edge index, range of repetitions) pairs, one list per
+            chunk, from the most to the least expensive chunk.
+        """
+        repetitions = self.repetitions
+        costs = [
+            (
+                player_cost(self.players[i], self.player_costs)
+                + player_cost(self.players[j], self.player_costs)
+            )
+            for i, j in self._edges()
+        ]
+        target = sum(costs) * repetitions / len(costs)
+
+        chunks = []
+        group, group_cost = [], 0
+        for edge_index, cost in enumerate(costs):
+            total = cost * repetitions
+            if total >= target:
+                parts = min(repetitions, ceil(total / target))
+                bounds = [repetitions * k // parts for k in range(parts + 1)]
+                for start, stop in zip(bounds, bounds[1:]):
+                    chunks.append(
+                        (
+                            cost * (stop - start),
+                            [(edge_index, range(start, stop))],
+                        )
+                    )
+            else:
+                group.append((edge_index, range(repetitions)))
+                group_cost += total
+                if group_cost >= target:
+                    chunks.append((group_cost, group))
+                    group, group_cost = [], 0
+        if group:
+            chunks.append((group_cost, group))
+
+        chunks.sort(key=lambda chunk: chunk[0], reverse=True)
+        return [tasks for _, tasks in chunks]
+
+    def _build_balanced_match_chunks(self):
+        edges = list(self._edges())
+        seeds = []
+        for _ in edges:
+            random_generator = RandomGenerator(next(self.random_generator))
+            seeds.append(
+                [
+                    random_generator.random_seed_int()
+                    for _ in range(self.repetitions)
+                ]
+            )
+
+        for tasks in self._chunk_plan:
+            yield [
+                (
+                    edges[edge_index],
+                    self.build_single_match_params(),
+                    repetitions,
+                    seeds[edge_index][repetitions.start : repetitions.stop],
+                )
+                for edge_index, repetitions in tasks
+            ]
+
     def build_single_match_params(self):
         """
         Creates a single set of match parameters.
@@ -92,9 +209,33 @@ class MatchGenerator(object):
             "noise": self.noise,
             "prob_end": self.prob_end,
             "match_attributes": self.match_attributes,
+            "detect_cycles": self.detect_cycles,
+            "deterministic_cache": self.deterministic_cache,
         }
 
 
+def player_cost(player, player_costs=None):
+    """
+    Estimates the relative cost per turn of a player.
+
+    Parameters
+    ----------
+    player : axelrod.Player
+    player_costs : dict
+        Mapping player names to known costs, for example from the timings of
+        a previous run.
+
+    Returns
+    -------
+    float
+    """
+    if player_costs is not None and str(player) in player_costs:
+        return player_costs[str(player)]
+    if Classifiers["long_run_time"](player):
+        return LONG_RUN_TIME_COST
+    return 1
+
+
 def complete_graph(players):
     """
     Return generator of edges of a complete graph on a set of players
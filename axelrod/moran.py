@@ -1,7 +1,9 @@
 """Implementation of the Moran process on Graphs."""
 
 from collections import Counter
-from typing import Callable, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count, get_all_start_methods, get_context
+from typing import Callable, List, Optional, Set, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -9,8 +11,106 @@ import numpy as np
 from axelrod import DEFAULT_TURNS, EvolvablePlayer, Game, Player
 from axelrod.deterministic_cache import DeterministicCache
 from axelrod.graph import Graph, complete_graph
-from axelrod.match import Match
+from axelrod.match import Match, is_stochastic
 from axelrod.random_ import BulkRandomGenerator, RandomGenerator
+from axelrod.tournament import Tournament
+
+
+class PopulationHistory(object):
+    """
+    The numbers of individuals of each type in successive populations of a
+    Moran process.
+
+    Each population is stored as its changes from the previous one, pairs of
+    integer type id and change in count, in the order in which the types
+    appeared. A step of a Moran process only changes the counts of two
+    types, so the memory used does not grow with the number of types, which
+    increases with every mutant under atomic mutation. The populations are
+    converted to Counters, once each, only when they are requested.
+    """
+
+    def __init__(self, type_names: List[str] = None) -> None:
+        self.type_names = []  # type: List[str]
+        self.type_ids = dict()  # type: dict
+        self._last = np.zeros(4, dtype=np.int64)  # type: np.ndarray
+        self._changes = np.zeros((16, 2), dtype=np.int64)  # type: np.ndarray
+        self._ends = np.zeros(16, dtype=np.int64)  # type: np.ndarray
+        self._length = 0
+        self._populations = []  # type: List[Counter]
+        for name in type_names or []:
+            self.type_id(name)
+
+    def type_id(self, name: str) -> int:
+        """Returns the integer id of a type, adding it if it has not been
+        seen before."""
+        try:
+            return self.type_ids[name]
+        except KeyError:
+            pass
+        type_id = len(self.type_names)
+        self.type_names.append(name)
+        self.type_ids[name] = type_id
+        return type_id
+
+    def append(self, counts: np.ndarray) -> None:
+        """Records a population given by the counts of the first types."""
+        counts = np.asarray(counts)
+        if len(counts) > len(self._last):
+            self._last = np.pad(
+                self._last, (0, max(len(counts), 2 * len(self._last)))
+            )
+        change = -self._last
+        change[: len(counts)] += counts
+        type_ids = np.flatnonzero(change)
+        self._last += change
+
+        start = int(self._ends[self._length - 1]) if self._length else 0
+        end = start + len(type_ids)
+        if end > len(self._changes):
+            self._changes = np.pad(
+                self._changes, ((0, max(end, 2 * len(self._changes))), (0, 0))
+            )
+        if self._length == len(self._ends):
+            self._ends = np.pad(self._ends, (0, self._length))
+        self._changes[start:end, 0] = type_ids
+        self._changes[start:end, 1] = change[type_ids]
+        self._ends[self._length] = end
+        self._length += 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The array of the counts of each type (columns) in each population
+        (rows). This is built when requested and has a column for every type
+        that appeared."""
+        ends = self._ends[: self._length]
+        type_ids, changes = self._changes[: ends[-1] if len(ends) else 0].T
+        rows = np.repeat(
+            np.arange(self._length), np.diff(ends, prepend=0)
+        )  # type: np.ndarray
+        counts = np.zeros(
+            (self._length, len(self.type_names)), np.int64
+        )  # type: np.ndarray
+        np.add.at(counts, (rows, type_ids), changes)
+        return np.cumsum(counts, axis=0)
+
+    @property
+    def populations(self) -> List[Counter]:
+        """The list of the populations as Counters of the type names."""
+        population = Counter()  # type: Counter
+        if self._populations:
+            population = self._populations[-1].copy()
+        for row in range(len(self._populations), self._length):
+            start = self._ends[row - 1] if row else 0
+            for type_id, change in self._changes[start : self._ends[row]]:
+                name = self.type_names[type_id]
+                population[name] += int(change)
+                if not population[name]:
+                    del population[name]
+            self._populations.append(population.copy())
+        return self._populations
+
+    def __len__(self) -> int:
+        return self._length
 
 
 class MoranProcess(object):
@@ -31,6 +131,7 @@ class MoranProcess(object):
         stop_on_fixation=True,
         seed=None,
         match_class=Match,
+        incremental_scoring: bool = False,
     ) -> None:
         """
         An agent based Moran process class. In each round, each player plays a
@@ -90,6 +191,17 @@ class MoranProcess(object):
             A bool indicating if the process should stop on fixation
         seed: int
             A random seed for reproducibility
+        match_class:
+            The class of the matches played
+        incremental_scoring:
+            A bool indicating if the scores of the players should be kept
+            between iterations, only replaying the matches of the replaced
+            player. This makes each iteration cost proportional to the degree
+            of the interaction graph rather than its size, so is suited to
+            large sparse graphs. The outcomes of stochastic matches are then
+            kept until one of the players is replaced, the score history is
+            not recorded and, in death-birth mode, the replacement is chosen
+            among the neighbors of the dead player in the reproduction graph.
         """
         m = mutation_method.lower()
         if m in ["atomic", "transition"]:
@@ -114,13 +226,16 @@ class MoranProcess(object):
         self.noise = noise
         self.initial_players = players  # save initial population
         self.players = []  # type: List
-        self.populations = []  # type: List
         self.score_history = []  # type: List
         self.winning_strategy_name = None  # type: Optional[str]
         self.mutation_rate = mutation_rate
         self.stop_on_fixation = stop_on_fixation
+        self.incremental_scoring = incremental_scoring
+        self._scores = None  # type: Optional[np.ndarray]
         self._random = RandomGenerator(seed=seed)
         self._bulk_random = BulkRandomGenerator(self._random.random_seed_int())
+        # Payoffs of deterministic matches, see _match_scores.
+        self._payoffs = dict()  # type: dict
         self.set_players()
         # Build the set of mutation targets
         # Determine the number of unique types (players)
@@ -156,6 +271,9 @@ class MoranProcess(object):
         self.index = dict(
             zip(sorted(interaction_graph.vertices), range(len(players)))
         )
+        self._reproduction_neighbors = reproduction_graph.to_csr(self.locations)
+        self._interaction_neighbors = interaction_graph.to_csr(self.locations)
+        self._matchups = None  # type: Optional[Set[Tuple[int, int]]]
         self.fixated = self.fixation_check()
 
     def set_players(self) -> None:
@@ -172,10 +290,42 @@ class MoranProcess(object):
             else:
                 player.reset()
                 self.players.append(player)
-        self.populations = [self.population_distribution()]
+        self._count_types()
+
+    def _count_types(self) -> None:
+        """Start a new population history from the current players, keeping
+        the integer type id of each player and the running counts of the
+        types."""
+        self.population_history = PopulationHistory()
+        self._player_types = [
+            self.population_history.type_id(str(player))
+            for player in self.players
+        ]
+        self._type_counts = np.bincount(
+            self._player_types,
+            minlength=len(self.population_history.type_names),
+        )
+        self.population_history.append(self._type_counts)
+
+    def _replace_type(self, index: int) -> None:
+        """Update the type id of the player at index and the running counts
+        of the types after the player has been replaced."""
+        self._type_counts[self._player_types[index]] -= 1
+        type_id = self.population_history.type_id(str(self.players[index]))
+        if type_id == len(self._type_counts):
+            self._type_counts = np.append(self._type_counts, 0)
+        self._type_counts[type_id] += 1
+        self._player_types[index] = type_id
+
+    @property
+    def populations(self) -> List[Counter]:
+        """The list of the population distributions of all iterations."""
+        return self.population_history.populations
 
     def fitness_proportionate_selection(
-        self, scores: List, fitness_transformation: Callable = None
+        self,
+        scores: Union[List, np.ndarray],
+        fitness_transformation: Callable = None,
     ) -> int:
         """Randomly selects an individual proportionally to score.
 
@@ -195,11 +345,7 @@ class MoranProcess(object):
             csums = np.cumsum([fitness_transformation(s) for s in scores])
         total = csums[-1]
         r = self._random.random() * total
-
-        for i, x in enumerate(csums):
-            if x >= r:
-                break
-        return i
+        return min(int(np.searchsorted(csums, r)), len(csums) - 1)
 
     def mutate(self, index: int) -> Player:
         """Mutate the player at index.
@@ -250,12 +396,10 @@ class MoranProcess(object):
         else:
             # Select locally
             # index is not None in this case
-            vertex = self._random.choice(
-                sorted(
-                    self.reproduction_graph.out_vertices(self.locations[index])
-                )
+            indptr, indices = self._reproduction_neighbors
+            i = int(
+                self._random.choice(indices[indptr[index] : indptr[index + 1]])
             )
-            i = self.index[vertex]
         return i
 
     def birth(self, index: int = None) -> int:
@@ -268,9 +412,22 @@ class MoranProcess(object):
         """
         # Compute necessary fitnesses.
         scores = self.score_all()
-        if index is not None:
+        if index is not None and self.incremental_scoring:
+            # Select among the neighbors of the dead player
+            indptr, indices = self._reproduction_neighbors
+            neighbors = indices[indptr[index] : indptr[index + 1]]
+            neighbors = neighbors[neighbors != index]
+            if len(neighbors) == 0:
+                return index
+            j = self.fitness_proportionate_selection(
+                scores[neighbors],
+                fitness_transformation=self.fitness_transformation,
+            )
+            j = int(neighbors[j])
+        elif index is not None:
             # Death has already occurred, so remove the dead player from the
             # possible choices
+            assert isinstance(scores, list)
             scores.pop(index)
             # Make sure to get the correct index post-pop
             j = self.fitness_proportionate_selection(
@@ -293,11 +450,12 @@ class MoranProcess(object):
         Boolean:
             True if fixation has occurred (population all of a single type)
         """
-        classes = set(str(p) for p in self.players)
         self.fixated = False
-        if len(classes) == 1:
+        if np.count_nonzero(self._type_counts) == 1:
             # Set the winning strategy name variable
-            self.winning_strategy_name = str(self.players[0])
+            self.winning_strategy_name = self.population_history.type_names[
+                self._player_types[0]
+            ]
             self.fixated = True
         return self.fixated
 
@@ -326,12 +484,17 @@ class MoranProcess(object):
         elif self.mode == "db":
             # Death then birth
             i = self.death()
-            self.players[i] = None
+            if not self.incremental_scoring:
+                self.players[i] = None
             j = self.birth(i)
         # Mutate and/or replace player i with clone of player j
         self.players[i] = self.mutate(j)
+        self._forget_payoffs(i)
+        self._replace_type(i)
+        if self._scores is not None:
+            self._rescore(i)
         # Record population.
-        self.populations.append(self.population_distribution())
+        self.population_history.append(self._type_counts)
         return self
 
     def _matchup_indices(self) -> Set[Tuple[int, int]]:
@@ -344,6 +507,9 @@ class MoranProcess(object):
             A set of 2 tuples of matchup pairs: the collection of all players
             who play each other.
         """
+        # The matchups of birth-death do not change between iterations.
+        if self.mode == "bd" and self._matchups is not None:
+            return self._matchups
         indices = set()  # type: Set
         # For death-birth we only want the neighbors of the dead node
         # The other calculations are unnecessary
@@ -354,47 +520,153 @@ class MoranProcess(object):
         else:
             # birth-death is global
             sources = sorted(self.locations)
+        indptr, neighbors = self._interaction_neighbors
         for i, source in enumerate(sources):
-            for target in sorted(self.interaction_graph.out_vertices(source)):
-                j = self.index[target]
+            k = self.index[source]
+            for j in neighbors[indptr[k] : indptr[k + 1]].tolist():
                 if (self.players[i] is None) or (self.players[j] is None):
                     continue
                 # Don't duplicate matches
                 if ((i, j) in indices) or ((j, i) in indices):
                     continue
                 indices.add((i, j))
+        if self.mode == "bd":
+            self._matchups = indices
         return indices
 
-    def score_all(self) -> List:
+    def score_all(self) -> Union[List, np.ndarray]:
         """Plays the next round of the process. Every player is paired up
         against every other player and the total scores are recorded.
 
         Returns
         -------
         scores:
-            List of scores for each player
+            List of scores for each player, or an array of the kept scores
+            with incremental scoring
         """
+        if self.incremental_scoring:
+            if self._scores is None:
+                self._scores = self._score_pairs()
+            return self._scores
         N = len(self.players)
         scores = [0] * N
         for i, j in self._matchup_indices():
-            player1 = self.players[i]
-            player2 = self.players[j]
-            match = self.match_class(
-                (player1, player2),
-                turns=self.turns,
-                prob_end=self.prob_end,
-                noise=self.noise,
-                game=self.game,
-                deterministic_cache=self.deterministic_cache,
-                seed=next(self._bulk_random),
-            )
-            match.play()
-            match_scores = match.final_score_per_turn()
+            match_scores = self._match_scores(i, j)
             scores[i] += match_scores[0]
             scores[j] += match_scores[1]
         self.score_history.append(scores)
         return scores
 
+    def _score_pairs(self) -> np.ndarray:
+        """
+        Plays the matches of every pair of neighbors in the interaction graph
+        and keeps their scores, for incremental scoring. Returns the total
+        score of each player.
+
+        Each pair p is played once, with the score of its first player at
+        position 2p and that of its second player at position 2p + 1 of
+        `_pair_scores`. The positions of the scores of each player are stored
+        in a compressed sparse row structure so that the score of a player
+        and the pairs of a replaced player can be found without going through
+        the whole graph.
+        """
+        N = len(self.players)
+        indptr, neighbors = self._interaction_neighbors
+        seen = set()  # type: Set
+        pairs = []
+        for i in range(N):
+            for j in neighbors[indptr[i] : indptr[i + 1]].tolist():
+                if ((i, j) in seen) or ((j, i) in seen):
+                    continue
+                seen.add((i, j))
+                pairs.append((i, j))
+        self._pairs = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+        endpoints = self._pairs.ravel()
+        self._pair_positions = np.argsort(endpoints, kind="stable")
+        self._pair_indptr = np.zeros(N + 1, dtype=np.intp)  # type: np.ndarray
+        self._pair_indptr[1:] = np.cumsum(np.bincount(endpoints, minlength=N))
+        self._pair_scores = np.zeros(
+            len(endpoints), dtype=float
+        )  # type: np.ndarray
+        for p, (i, j) in enumerate(pairs):
+            self._pair_scores[2 * p : 2 * p + 2] = self._match_scores(i, j)
+        return np.array([self._player_score(i) for i in range(N)])
+
+    def _player_score(self, index: int) -> float:
+        """Returns the total of the kept scores of the player at index."""
+        positions = self._pair_positions[
+            self._pair_indptr[index] : self._pair_indptr[index + 1]
+        ]
+        return float(np.sum(self._pair_scores[positions]))
+
+    def _rescore(self, index: int) -> None:
+        """Replays the matches of the player at index, which has been
+        replaced, and updates the scores of the player and its neighbors."""
+        positions = self._pair_positions[
+            self._pair_indptr[index] : self._pair_indptr[index + 1]
+        ]
+        players = {index}
+        for p in np.unique(positions // 2).tolist():
+            i, j = self._pairs[p].tolist()
+            self._pair_scores[2 * p : 2 * p + 2] = self._match_scores(i, j)
+            players.update((i, j))
+        assert self._scores is not None
+        for i in players:
+            self._scores[i] = self._player_score(i)
+
+    def _payoff_key(self, i: int, j: int) -> Optional[Tuple]:
+        """
+        Returns the key of the payoffs of the match between the players at
+        indices i and j, or None if the match is stochastic.
+
+        With transition mutation, players of the same type behave identically
+        so payoffs are kept between types. With atomic mutation, they are kept
+        between individuals and forgotten when an individual is replaced.
+        """
+        players = (self.players[i], self.players[j])
+        if self.prob_end or is_stochastic(players, self.noise):
+            return None
+        if self.mutation_method == "transition":
+            return str(players[0]), str(players[1])
+        return i, j
+
+    def _forget_payoffs(self, index: int) -> None:
+        """Forgets the payoffs of the individual at index, which has been
+        replaced."""
+        if self.mutation_method == "atomic":
+            for key in [key for key in self._payoffs if index in key]:
+                del self._payoffs[key]
+
+    def _match_scores(self, i: int, j: int) -> Tuple:
+        """
+        Returns the scores per turn of the match between the players at
+        indices i and j.
+
+        The payoffs of deterministic matches do not change, so they are kept
+        and only the matches of individuals that have not played yet are
+        played. A seed is drawn for every match, so that the seeds of the
+        other matches are those of a process which plays every match.
+        """
+        seed = next(self._bulk_random)
+        key = self._payoff_key(i, j)
+        if key in self._payoffs:
+            return self._payoffs[key]
+
+        match = self.match_class(
+            (self.players[i], self.players[j]),
+            turns=self.turns,
+            prob_end=self.prob_end,
+            noise=self.noise,
+            game=self.game,
+            deterministic_cache=self.deterministic_cache,
+            seed=seed,
+        )
+        match.play()
+        match_scores = match.final_score_per_turn()
+        if key is not None:
+            self._payoffs[key] = match_scores
+        return match_scores
+
     def population_distribution(self) -> Counter:
         """Returns the population distribution of the last iteration.
 
@@ -403,9 +675,13 @@ class MoranProcess(object):
         counter:
             The counts of each strategy in the population of the last iteration
         """
-        player_names = [str(player) for player in self.players]
-        counter = Counter(player_names)
-        return counter
+        return Counter(
+            {
+                self.population_history.type_names[type_id]: int(count)
+                for type_id, count in enumerate(self._type_counts)
+                if count
+            }
+        )
 
     def __iter__(self) -> object:
         """
@@ -415,10 +691,18 @@ class MoranProcess(object):
         """
         return self
 
+    def set_seed(self, seed: Optional[int]) -> None:
+        """Reseeds the process, for instance before replaying it after a
+        reset."""
+        self._random = RandomGenerator(seed=seed)
+        self._bulk_random = BulkRandomGenerator(self._random.random_seed_int())
+
     def reset(self) -> None:
         """Reset the process to replay."""
         self.winning_strategy_name = None
         self.score_history = []
+        self._payoffs = dict()
+        self._scores = None
         # Reset all the players
         self.set_players()
 
@@ -450,7 +734,7 @@ class MoranProcess(object):
         -------
             The length of the Moran process: the number of populations
         """
-        return len(self.populations)
+        return len(self.population_history)
 
     def populations_plot(self, ax=None):
         """
@@ -532,7 +816,14 @@ class ApproximateMoranProcess(MoranProcess):
         for player in self.initial_players:
             player.reset()
             self.players.append(player)
-        self.populations = [self.population_distribution()]
+        self._count_types()
+
+    def set_seed(self, seed: Optional[int]) -> None:
+        """Reseeds the process and the distributions of the cached
+        outcomes."""
+        super(ApproximateMoranProcess, self).set_seed(seed)
+        for _, pdf in sorted(self.cached_outcomes.items()):
+            pdf._random = RandomGenerator(seed=self._random.random_seed_int())
 
     def score_all(self) -> List:
         """Plays the next round of the process. Every player is paired up
@@ -577,3 +868,581 @@ class ApproximateMoranProcess(MoranProcess):
         except KeyError:  # If players are stored in opposite order
             match_scores = self.cached_outcomes[player_names[::-1]].sample()
             return match_scores[::-1]
+
+
+def type_payoff_matrix(
+    players: List[Player],
+    turns: int = DEFAULT_TURNS,
+    prob_end: float = None,
+    noise: float = 0,
+    game: Game = None,
+    repetitions: int = 10,
+    processes: int = None,
+    seed: Optional[int] = None,
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Estimates the expected payoff per turn between every pair of player
+    types, by playing a tournament between one player of each type.
+
+    Parameters
+    ----------
+    players:
+        The players, of which one of each type is used
+    turns:
+        The number of turns in each pairwise interaction
+    prob_end :
+        The probability of a given turn ending a match
+    noise:
+        The background noise, if any
+    game: axelrod.Game
+        The game object used to score matches
+    repetitions:
+        The number of matches played between each pair of types
+    processes:
+        The number of processes used to play the matches
+    seed: int
+        A random seed for reproducibility
+
+    Returns
+    -------
+    types:
+        The sorted names of the types
+    payoffs:
+        An array whose element [i, j] is the mean payoff per turn of type i
+        against type j
+    """
+    representatives = {str(player): player for player in players}
+    types = sorted(representatives)
+    tournament = Tournament(
+        [representatives[name].clone() for name in types],
+        turns=turns,
+        prob_end=prob_end,
+        noise=noise,
+        game=game,
+        repetitions=repetitions,
+        seed=seed,
+    )
+    results = tournament.play(
+        processes=processes, progress_bar=False, array_mode=True
+    )
+    return types, results.payoff_matrix
+
+
+def fixation_probability(
+    payoffs,
+    population_size: int,
+    initial_mutants: int = 1,
+    mode: str = "bd",
+    fitness_transformation: Callable = None,
+) -> float:
+    """
+    The exact probability that a mutant type fixates in a Moran process
+    without mutation on a complete graph with a resident type.
+
+    The fitness of an individual is its total payoff against all other
+    individuals, as in MoranProcess. With i mutants, the process moves to
+    i + 1 and i - 1 mutants with probabilities T+(i) and T-(i), and the
+    fixation probability is
+
+        (1 + sum_{k=1}^{i-1} prod_{j=1}^{k} T-(j) / T+(j)) /
+        (1 + sum_{k=1}^{N-1} prod_{j=1}^{k} T-(j) / T+(j))
+
+    Parameters
+    ----------
+    payoffs:
+        A 2 by 2 array of payoffs per turn: the first row and column are for
+        the mutant type and the second for the resident type
+    population_size:
+        The number of individuals N
+    initial_mutants:
+        The initial number of mutants i
+    mode:
+        Birth-Death (bd) or Death-Birth (db)
+    fitness_transformation:
+        A function mapping a score to a (non-negative) float
+
+    Returns
+    -------
+    The fixation probability of the mutant type.
+    """
+    mode = mode.lower()
+    if mode not in ["bd", "db"]:
+        raise ValueError("Invalid mode {}".format(mode))
+    if not 0 < initial_mutants < population_size:
+        raise ValueError(
+            "The initial number of mutants must be between 0 and the "
+            "population size."
+        )
+    if fitness_transformation is None:
+        fitness_transformation = float
+    N = population_size
+    (a, b), (c, d) = payoffs
+
+    def fitnesses(mutants, residents):
+        """The fitnesses of a mutant and of a resident."""
+        mutant = (mutants - 1) * a + residents * b
+        resident = mutants * c + (residents - 1) * d
+        return fitness_transformation(mutant), fitness_transformation(resident)
+
+    def birth_of_mutant(mutants, residents):
+        """The probability that the reproducing individual is a mutant,
+        proportionally to the counts if all fitnesses are 0."""
+        f, g = fitnesses(mutants, residents)
+        total = mutants * f + residents * g
+        if total <= 0:
+            return mutants / (mutants + residents)
+        return mutants * f / total
+
+    def transitions(i):
+        """The probabilities T+(i) and T-(i)."""
+        if mode == "bd":
+            birth = birth_of_mutant(i, N - i)
+            return birth * (N - i) / N, (1 - birth) * i / N
+        # Death-birth: the reproducing individual is chosen among the
+        # individuals left after the death.
+        return (
+            (N - i) / N * birth_of_mutant(i, N - i - 1),
+            i / N * (1 - birth_of_mutant(i - 1, N - i)),
+        )
+
+    T = {k: transitions(k) for k in range(1, N)}
+    # The mutants cannot fixate if they cannot grow from a number reached
+    # from the initial one, and cannot go extinct if they cannot shrink.
+    if any(T[k][0] == 0 for k in range(initial_mutants, N)):
+        return 0.0
+    if any(T[k][1] == 0 for k in range(1, initial_mutants + 1)):
+        return 1.0
+    # Mutants that cannot grow from fewer mutants go extinct from there, and
+    # mutants that cannot shrink from more mutants fixate from there.
+    lower = max(
+        [k for k in range(1, initial_mutants) if T[k][0] == 0], default=0
+    )
+    upper = min(
+        [k for k in range(initial_mutants + 1, N) if T[k][1] == 0], default=N
+    )
+
+    total, product, numerator = 1, 1, 1
+    for k in range(lower + 1, upper):
+        product *= T[k][1] / T[k][0]
+        total += product
+        if k < initial_mutants:
+            numerator += product
+    return numerator / total
+
+
+class TypeMoranProcess(object):
+    """
+    A Moran process on a complete graph in which fitness only depends on the
+    counts of each player type.
+
+    The expected payoffs per turn between types are computed once, so the
+    process does not play any matches and each iteration only updates the
+    counts of the types. This requires the players not to be evolvable and
+    mutation to be between the initial types, as in MoranProcess with the
+    "transition" mutation method.
+    """
+
+    def __init__(
+        self,
+        players: List[Player],
+        turns: int = DEFAULT_TURNS,
+        prob_end: float = None,
+        noise: float = 0,
+        game: Game = None,
+        payoffs=None,
+        repetitions: int = 10,
+        processes: int = None,
+        mutation_rate: float = 0.0,
+        mode: str = "bd",
+        fitness_transformation: Callable = None,
+        stop_on_fixation=True,
+        seed=None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        players
+        turns:
+            The number of turns in each pairwise interaction
+        prob_end :
+            The probability of a given turn ending a match
+        noise:
+            The background noise, if any. Randomly flips plays with probability
+            `noise`.
+        game: axelrod.Game
+            The game object used to score matches.
+        payoffs:
+            An optional array of the mean payoffs per turn between the types,
+            ordered by name, as returned by `type_payoff_matrix`. By default
+            these are computed.
+        repetitions:
+            The number of matches played between each pair of types to
+            compute the payoffs
+        processes:
+            The number of processes used to compute the payoffs
+        mutation_rate:
+            The rate of mutation. Replicating players are mutated with
+            probability `mutation_rate`
+        mode:
+            Birth-Death (bd) or Death-Birth (db)
+        fitness_transformation:
+            A function mapping a score to a (non-negative) float
+        stop_on_fixation:
+            A bool indicating if the process should stop on fixation
+        seed: int
+            A random seed for reproducibility
+        """
+        assert (mutation_rate >= 0) and (mutation_rate <= 1)
+        mode = mode.lower()
+        assert mode in ["bd", "db"]
+        if any(isinstance(player, EvolvablePlayer) for player in players):
+            raise TypeError("Players must not be evolvable.")
+        self.mode = mode
+        self.mutation_rate = mutation_rate
+        self.fitness_transformation = fitness_transformation
+        self.stop_on_fixation = stop_on_fixation
+        self.initial_players = players
+        self._random = RandomGenerator(seed=seed)
+
+        if payoffs is None:
+            self.types, payoffs = type_payoff_matrix(
+                players,
+                turns=turns,
+                prob_end=prob_end,
+                noise=noise,
+                game=game,
+                repetitions=repetitions,
+                processes=processes,
+                seed=self._random.random_seed_int(),
+            )
+        else:
+            self.types = sorted(set(str(player) for player in players))
+        self.payoffs = np.array(payoffs, dtype=float)
+        if self.payoffs.shape != (len(self.types), len(self.types)):
+            raise ValueError("There must be one row and column per type.")
+
+        self.winning_strategy_name = None  # type: Optional[str]
+        self.set_players()
+
+    def set_players(self) -> None:
+        """Set the counts of the types to those of the initial players."""
+        counter = Counter(str(player) for player in self.initial_players)
+        self.counts = np.array([counter[name] for name in self.types])
+        self.population_history = PopulationHistory(self.types)
+        self.population_history.append(self.counts)
+        self.fixated = self.fixation_check()
+
+    @property
+    def populations(self) -> List[Counter]:
+        """The list of the population distributions of all iterations."""
+        return self.population_history.populations
+
+    def population_distribution(self) -> Counter:
+        """Returns the population distribution of the last iteration."""
+        return Counter(
+            {
+                name: int(count)
+                for name, count in zip(self.types, self.counts)
+                if count
+            }
+        )
+
+    def fixation_check(self) -> bool:
+        """
+        Checks if the population is all of a single type
+
+        Returns
+        -------
+        Boolean:
+            True if fixation has occurred (population all of a single type)
+        """
+        present = np.flatnonzero(self.counts)
+        self.fixated = len(present) == 1
+        if self.fixated:
+            self.winning_strategy_name = self.types[present[0]]
+        return self.fixated
+
+    def fitnesses(self) -> np.ndarray:
+        """Returns the fitness of an individual of each type: its total
+        payoff against all other individuals, possibly transformed."""
+        scores = self.payoffs @ self.counts - np.diag(self.payoffs)
+        if self.fitness_transformation is not None:
+            scores = np.array(
+                [self.fitness_transformation(score) for score in scores]
+            )
+        return scores
+
+    def _select(self, weights: np.ndarray) -> int:
+        """Randomly selects a type proportionally to weights, or to the
+        counts if all weights are 0."""
+        csums = np.cumsum(weights)
+        if csums[-1] <= 0:
+            csums = np.cumsum(self.counts)
+        r = self._random.random() * csums[-1]
+        return int(np.searchsorted(csums, r, side="right"))
+
+    def _offspring_type(self, parent: int) -> int:
+        """Returns the type of the offspring of a parent, possibly
+        mutated to another of the types."""
+        if self.mutation_rate > 0:
+            r = self._random.random()
+            if r < self.mutation_rate:
+                j = self._random.randrange(0, len(self.types) - 1)
+                return j if j < parent else j + 1
+        return parent
+
+    def __next__(self) -> object:
+        """
+        Iterate the population: choose a type to reproduce proportionally to
+        the total fitness of its individuals, choose a type to be replaced
+        proportionally to its count and update the counts.
+
+        Returns
+        -------
+        TypeMoranProcess:
+            Returns itself with a new population
+        """
+        if self.stop_on_fixation and self.fixation_check():
+            raise StopIteration
+        if self.mode == "bd":
+            parent = self._select(self.counts * self.fitnesses())
+            dead = self._select(self.counts)
+        else:
+            dead = self._select(self.counts)
+            self.counts[dead] -= 1
+            parent = self._select(self.counts * self.fitnesses())
+            self.counts[dead] += 1
+        self.counts[dead] -= 1
+        self.counts[self._offspring_type(parent)] += 1
+        self.population_history.append(self.counts)
+        return self
+
+    def fixation_probabilities(self) -> dict:
+        """
+        The exact fixation probabilities of the two types of a process
+        without mutation, from the initial population.
+
+        Returns
+        -------
+        Mapping the names of the types to their fixation probabilities.
+        """
+        if len(self.types) != 2 or self.mutation_rate > 0:
+            raise ValueError(
+                "Exact fixation probabilities require two types and no "
+                "mutation."
+            )
+        counter = Counter(str(player) for player in self.initial_players)
+        probabilities = {}
+        for mutant, resident in ((0, 1), (1, 0)):
+            order = [mutant, resident]
+            probabilities[self.types[mutant]] = fixation_probability(
+                self.payoffs[np.ix_(order, order)],
+                population_size=len(self.initial_players),
+                initial_mutants=counter[self.types[mutant]],
+                mode=self.mode,
+                fitness_transformation=self.fitness_transformation,
+            )
+        return probabilities
+
+    def __iter__(self) -> object:
+        return self
+
+    def reset(self) -> None:
+        """Reset the process to replay."""
+        self.winning_strategy_name = None
+        self.set_players()
+
+    def play(self) -> List[Counter]:
+        """
+        Play the process out to completion. If played with mutation this will
+        not terminate.
+
+        Returns
+        -------
+         populations:
+            Returns a list of all the populations
+        """
+        if not self.stop_on_fixation or self.mutation_rate != 0:
+            raise ValueError(
+                "TypeMoranProcess.play() will never exit if mutation_rate is"
+                "nonzero or stop_on_fixation is False. Use iteration instead."
+            )
+        while True:
+            try:
+                self.__next__()
+            except StopIteration:
+                break
+        return self.populations
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+            The length of the Moran process: the number of populations
+        """
+        return len(self.population_history)
+
+    populations_plot = MoranProcess.populations_plot
+
+
+class MoranEnsembleResults(object):
+    """
+    A summary of independent replicates of a Moran process.
+
+    Attributes
+    ----------
+    repetitions : int
+        The number of replicates
+    fixation_counts : collections.Counter
+        The number of replicates won by each strategy
+    fixation_probabilities : dict
+        The proportion of replicates won by each strategy
+    fixation_times : numpy.ndarray
+        The number of steps to fixation of each replicate
+    winners : list
+        The name of the winning strategy of each replicate
+    """
+
+    def __init__(self, winners: List[str], fixation_times: List[int]) -> None:
+        self.winners = winners
+        self.repetitions = len(winners)
+        self.fixation_counts = Counter(winners)
+        self.fixation_probabilities = {
+            name: count / self.repetitions
+            for name, count in sorted(self.fixation_counts.items())
+        }
+        self.fixation_times = np.array(fixation_times, dtype=int)
+
+    def fixation_time_statistics(self, strategy: str = None) -> Optional[dict]:
+        """
+        Returns the mean, standard deviation, median, minimum and maximum of
+        the fixation times, optionally only of the replicates won by a given
+        strategy.
+
+        Parameters
+        ----------
+        strategy:
+            The name of a strategy
+
+        Returns
+        -------
+        A dictionary of the statistics, or None if no replicate fixated on
+        the strategy.
+        """
+        times = self.fixation_times
+        if strategy is not None:
+            times = times[np.array(self.winners) == strategy]
+        if len(times) == 0:
+            return None
+        return {
+            "mean": float(np.mean(times)),
+            "std": float(np.std(times)),
+            "median": float(np.median(times)),
+            "min": int(np.min(times)),
+            "max": int(np.max(times)),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            "MoranEnsembleResults(repetitions={}, fixation_counts={})".format(
+                self.repetitions, dict(self.fixation_counts)
+            )
+        )
+
+
+# The Moran process replicated by a worker of play_moran_processes.
+_worker_process = None  # type: Optional[MoranProcess]
+
+
+def _initialise_moran_worker(process):
+    """Stores the Moran process in a worker of an executor."""
+    global _worker_process
+    _worker_process = process
+
+
+def _play_replicates(seeds, process=None):
+    """Plays a Moran process once for each seed, returning the winning
+    strategy and the number of steps to fixation of each replicate."""
+    if process is None:
+        process = _worker_process
+    outcomes = []
+    for seed in seeds:
+        process.set_seed(seed)
+        process.reset()
+        process.play()
+        outcomes.append((process.winning_strategy_name, len(process) - 1))
+    return outcomes
+
+
+def play_moran_processes(
+    process: MoranProcess,
+    repetitions: int,
+    processes: int = None,
+    seed: int = None,
+    chunk_size: int = None,
+) -> MoranEnsembleResults:
+    """
+    Plays independent, seeded replicates of a Moran process, possibly over a
+    pool of processes, and summarises how each of them fixated.
+
+    Each worker receives the process, including its deterministic cache, once
+    and only sends back the winner and the fixation time of its replicates,
+    not their populations. The results do not depend on the number of
+    processes.
+
+    Parameters
+    ----------
+    process:
+        A MoranProcess or ApproximateMoranProcess without mutation that stops
+        on fixation. It is reset and reseeded by each replicate.
+    repetitions:
+        The number of replicates
+    processes:
+        The number of processes to use, if None the replicates are played in
+        this process and if 0 all available CPUs are used.
+    seed:
+        A random seed from which the seeds of the replicates are drawn
+    chunk_size:
+        The number of replicates sent to a worker at a time
+
+    Returns
+    -------
+    MoranEnsembleResults
+    """
+    if not process.stop_on_fixation or process.mutation_rate != 0:
+        raise ValueError(
+            "A Moran process only fixates if mutation_rate is 0 and "
+            "stop_on_fixation is True."
+        )
+    random = RandomGenerator(seed=seed)
+    seeds = [random.random_seed_int() for _ in range(repetitions)]
+
+    if processes is None:
+        outcomes = _play_replicates(seeds, process=process)
+    else:
+        if processes <= 0 or processes > cpu_count():
+            processes = cpu_count()
+        if chunk_size is None:
+            chunk_size = max(1, -(-repetitions // (4 * processes)))
+        context = None
+        if "fork" in get_all_start_methods():
+            context = get_context("fork")
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_initialise_moran_worker,
+            initargs=(process,),
+        ) as executor:
+            outcomes = []
+            for chunk in executor.map(
+                _play_replicates,
+                [
+                    seeds[start : start + chunk_size]
+                    for start in range(0, repetitions, chunk_size)
+                ],
+            ):
+                outcomes.extend(chunk)
+
+    winners = [winner for winner, _ in outcomes]
+    fixation_times = [time for _, time in outcomes]
+    return MoranEnsembleResults(winners, fixation_times)
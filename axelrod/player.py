@@ -259,6 +259,28 @@ class Player(object, metaclass=PostInitCaller):
     def update_history(self, play, coplay):
         self.history.append(play, coplay)
 
+    def state_key(self):
+        """Returns a hashable description of the state of the player.
+
+        Together with the state key of its opponent, this should determine
+        all future actions of a deterministic player. It is used by
+        axelrod.Match to detect cycles of play. By default, for a player with
+        a finite memory depth, it is the last `memory_depth` plays and
+        coplays. Players with an infinite memory depth can override this
+        method to describe their internal state.
+
+        Returns None if the state cannot be described (yet).
+        """
+        depth = self.classifier.get("memory_depth", float("inf"))
+        if depth == float("inf") or len(self.history) < depth:
+            return None
+        if depth == 0:
+            return ()
+        return (
+            tuple(self.history[-depth:]),
+            tuple(self.history.coplays[-depth:]),
+        )
+
     @property
     def history(self):
         return self._history
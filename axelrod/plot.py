@@ -5,7 +5,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.transforms as transforms
 import tqdm
-from numpy import arange, median, nan_to_num
+from numpy import arange, asarray, ix_, median, nan_to_num
 
 from .load_data_ import axl_filename
 from .result_set import ResultSet
@@ -62,10 +62,8 @@ class Plot(object):
 
     @property
     def _boxplot_dataset(self):
-        return [
-            list(nan_to_num(self.result_set.normalised_scores[ir]))
-            for ir in self.result_set.ranking
-        ]
+        normalised_scores = asarray(self.result_set.normalised_scores)
+        return nan_to_num(normalised_scores[self.result_set.ranking]).tolist()
 
     @property
     def _boxplot_xticks_locations(self):
@@ -87,15 +85,15 @@ class Plot(object):
     @property
     def _winplot_dataset(self):
         # Sort wins by median
-        wins = self.result_set.wins
-        medians = map(median, wins)
+        wins = asarray(self.result_set.wins)
+        medians = median(wins, axis=1)
         medians = sorted(
             [(m, i) for (i, m) in enumerate(medians)], reverse=True
         )
         # Reorder and grab names
-        wins = [wins[x[-1]] for x in medians]
-        ranked_names = [str(self.players[x[-1]]) for x in medians]
-        return wins, ranked_names
+        ordering = [x[-1] for x in medians]
+        ranked_names = [str(self.players[i]) for i in ordering]
+        return wins[ordering].tolist(), ranked_names
 
     def winplot(
         self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
@@ -116,12 +114,9 @@ class Plot(object):
     @property
     def _sdv_plot_dataset(self):
         ordering = self._sd_ordering
-        diffs = [
-            [score_diff for opponent in player for score_diff in opponent]
-            for player in self.result_set.score_diffs
-        ]
+        score_diffs = asarray(self.result_set.score_diffs)
         # Reorder and grab names
-        diffs = [diffs[i] for i in ordering]
+        diffs = score_diffs.reshape(self.num_players, -1)[ordering].tolist()
         ranked_names = [str(self.players[i]) for i in ordering]
         return diffs, ranked_names
 
@@ -136,11 +131,12 @@ class Plot(object):
 
     @property
     def _lengthplot_dataset(self):
-        match_lengths = self.result_set.match_lengths
-        return [
-            [length for rep in match_lengths for length in rep[playeri]]
-            for playeri in self.result_set.ranking
-        ]
+        match_lengths = asarray(self.result_set.match_lengths)
+        # One row per player of their match lengths in each repetition.
+        match_lengths = match_lengths.transpose(1, 0, 2).reshape(
+            self.num_players, -1
+        )
+        return match_lengths[self.result_set.ranking].tolist()
 
     def lengthplot(
         self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
@@ -153,19 +149,17 @@ class Plot(object):
 
     @property
     def _payoff_dataset(self):
-        pm = self.result_set.payoff_matrix
-        return [
-            [pm[r1][r2] for r2 in self.result_set.ranking]
-            for r1 in self.result_set.ranking
-        ]
+        pm = asarray(self.result_set.payoff_matrix)
+        ranking = self.result_set.ranking
+        return pm[ix_(ranking, ranking)].tolist()
 
     @property
     def _pdplot_dataset(self):
         # Order like the sdv_plot
         ordering = self._sd_ordering
-        pdm = self.result_set.payoff_diffs_means
+        pdm = asarray(self.result_set.payoff_diffs_means)
         # Reorder and grab names
-        matrix = [[pdm[r1][r2] for r2 in ordering] for r1 in ordering]
+        matrix = pdm[ix_(ordering, ordering)].tolist()
         players = self.result_set.players
         ranked_names = [str(players[i]) for i in ordering]
         return matrix, ranked_names
@@ -228,7 +222,7 @@ class Plot(object):
         ax: matplotlib.axes.SubplotBase = None,
     ) -> matplotlib.figure.Figure:
 
-        populations = eco.population_sizes
+        populations = asarray(eco.population_sizes)
 
         if ax is None:
             _, ax = plt.subplots()
@@ -237,10 +231,7 @@ class Plot(object):
 
         figure = ax.get_figure()
         turns = range(len(populations))
-        pops = [
-            [populations[iturn][ir] for iturn in turns]
-            for ir in self.result_set.ranking
-        ]
+        pops = populations[:, self.result_set.ranking].T
         ax.stackplot(turns, *pops)
 
         ax.yaxis.tick_left()
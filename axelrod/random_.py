@@ -38,6 +38,9 @@ class RandomGenerator(object):
     def uniform(self, *args, **kwargs):
         return self._random.uniform(*args, **kwargs)
 
+    def normal(self, *args, **kwargs):
+        return self._random.normal(*args, **kwargs)
+
     def random_choice(self, p: float = 0.5) -> Action:
         """
         Return C with probability `p`, else return D
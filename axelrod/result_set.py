@@ -1,47 +1,154 @@
+import copy
 import csv
-import itertools
 import warnings
 from collections import Counter, namedtuple
-from multiprocessing import cpu_count
 from typing import List
 
-import dask as da
-import dask.dataframe as dd
 import numpy as np
+import pandas as pd
 import tqdm
 
+import axelrod.interaction_utils as iu
 from axelrod.action import Action
 
 from . import eigen
 
 C, D = Action.C, Action.D
 
+# The number of rows of an interactions file aggregated at once.
+_CHUNK_SIZE = 2**18
 
-def update_progress_bar(method):
-    """A decorator to update a progress bar if it exists"""
+_STATES = [(C, C), (C, D), (D, C), (D, D)]
 
-    def wrapper(*args, **kwargs):
-        """Run the method and update the progress bar if it exists"""
-        output = method(*args, **kwargs)
 
-        try:
-            args[0].progress_bar.update(1)
-        except AttributeError:
-            pass
+class _ResultAttribute(object):
+    """
+    An attribute of a ResultSet, built by the `_build_<name>` method of the
+    result set when first accessed and then cached.
+
+    Unless the result set is in array mode, arrays are converted with
+    `to_list`. If `to_list` is None the value is not converted.
+    """
+
+    def __init__(self, to_list=np.ndarray.tolist):
+        self.to_list = to_list
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, result_set, owner=None):
+        if result_set is None:
+            return self
+        value = result_set._result(self.name)
+        if self.to_list is not None and not result_set.array_mode:
+            value = self.to_list(value)
+        result_set.__dict__[self.name] = value
+        return value
 
-        return output
 
-    return wrapper
+def _to_ragged_list(array):
+    """Converts an array to nested lists, leaving out the NaN entries of the
+    last dimension."""
+    return [
+        [row[~np.isnan(row)].tolist() for row in matrix] for matrix in array
+    ]
+
+
+def _to_counters(array):
+    """
+    Converts an array of state, or state to action, distributions indexed by
+    player and opponent to a list of lists of Counter objects mapping the
+    states, or the states and actions, to the positive entries.
+    """
+    if array.ndim == 3:
+        keys = _STATES
+    else:
+        keys = [(state, action) for state in _STATES for action in (C, D)]
+    num_players = array.shape[0]
+    array = array.reshape(num_players, num_players, len(keys))
+    counters = [
+        [Counter() for opponent_index in range(num_players)]
+        for player_index in range(num_players)
+    ]
+    for player_index, opponent_index, key_index in zip(*np.nonzero(array > 0)):
+        counters[player_index][opponent_index][keys[key_index]] = array[
+            player_index, opponent_index, key_index
+        ].item()
+    return counters
+
+
+def _normalise_counts(counts):
+    """Divides counts by their totals over the last dimension, giving zero
+    where the total is zero."""
+    totals = counts.sum(axis=-1, keepdims=True)
+    return np.divide(
+        counts, totals, out=np.zeros(counts.shape), where=totals > 0
+    )
 
 
 class ResultSet:
     """
     A class to hold the results of a tournament. Reads in a CSV file produced
-    by the tournament class.
+    by the tournament class, or is built from a ResultAccumulator with
+    `ResultSet.from_accumulator`. The file is read once, in chunks of rows
+    which are aggregated by a ResultAccumulator.
+
+    Only the aggregates of the interactions are computed when the result set
+    is created: each result is computed from them when first accessed, and
+    then cached.
+
+    The results are built as NumPy arrays. By default, they are converted to
+    nested lists, and lists of lists of Counter objects for the state
+    distributions, when first accessed. In array mode the attributes are the
+    arrays themselves:
+
+    - `payoffs` and `score_diffs` are indexed by player, opponent and
+      repetition. Payoffs of matches that were not played are NaN.
+    - `match_lengths` is indexed by repetition, player and opponent.
+    - `wins`, `scores` and `normalised_scores` are indexed by player and
+      repetition.
+    - `state_distribution` and `normalised_state_distribution` are indexed by
+      player, opponent and state, in the order CC, CD, DC, DD.
+    - `state_to_action_distribution` and
+      `normalised_state_to_action_distribution` are indexed by player,
+      opponent, state and action, in the order C, D.
+    - the other matrices and ratings have the shape of the lists.
     """
 
+    payoffs = _ResultAttribute(_to_ragged_list)
+    score_diffs = _ResultAttribute()
+    match_lengths = _ResultAttribute()
+    wins = _ResultAttribute()
+    scores = _ResultAttribute()
+    normalised_scores = _ResultAttribute()
+    cooperation = _ResultAttribute()
+    good_partner_matrix = _ResultAttribute()
+    state_distribution = _ResultAttribute(_to_counters)
+    normalised_state_distribution = _ResultAttribute(_to_counters)
+    state_to_action_distribution = _ResultAttribute(_to_counters)
+    normalised_state_to_action_distribution = _ResultAttribute(_to_counters)
+    initial_cooperation_count = _ResultAttribute()
+    initial_cooperation_rate = _ResultAttribute()
+    good_partner_rating = _ResultAttribute()
+    normalised_cooperation = _ResultAttribute()
+    ranking = _ResultAttribute()
+    ranked_names = _ResultAttribute(to_list=None)
+    payoff_matrix = _ResultAttribute()
+    payoff_stddevs = _ResultAttribute()
+    payoff_diffs_means = _ResultAttribute()
+    cooperating_rating = _ResultAttribute()
+    vengeful_cooperation = _ResultAttribute()
+    eigenjesus_rating = _ResultAttribute()
+    eigenmoses_rating = _ResultAttribute()
+
     def __init__(
-        self, filename, players, repetitions, processes=None, progress_bar=True
+        self,
+        filename,
+        players,
+        repetitions,
+        processes=None,
+        progress_bar=True,
+        array_mode=False,
     ):
         """
         Parameters
@@ -55,421 +162,265 @@ class ResultSet:
                 The number of repetitions of each match. If not know will be
                 efficiently read from file.
             processes : integer
-                The number of processes to be used for parallel processing
+                Not used: the file is read in a single pass. Kept for
+                compatibility.
             progress_bar: boolean
-                If a progress bar will be shown.
+                If a progress bar of the rows read will be shown.
+            array_mode: boolean
+                If the results are NumPy arrays rather than lists.
         """
         self.filename = filename
         self.players, self.repetitions = players, repetitions
         self.num_players = len(self.players)
+        self.array_mode = array_mode
 
         if progress_bar:
-            self.progress_bar = tqdm.tqdm(total=25, desc="Analysing")
+            self.progress_bar = tqdm.tqdm(desc="Analysing", unit=" rows")
 
-        df = dd.read_csv(filename)
-        dask_tasks = self._build_tasks(df)
+        accumulator = ResultAccumulator(players, repetitions)
+        for df in _read_interactions_chunks(filename):
+            accumulator.add_rows(df)
+            if progress_bar:
+                self.progress_bar.update(len(df))
 
-        if processes == 0:
-            processes = cpu_count()
-
-        out = self._compute_tasks(tasks=dask_tasks, processes=processes)
-
-        self._reshape_out(*out)
+        self._set_aggregates(accumulator)
 
         if progress_bar:
             self.progress_bar.close()
 
-    def _reshape_out(
-        self,
-        mean_per_reps_player_opponent_df,
-        sum_per_player_opponent_df,
-        sum_per_player_repetition_df,
-        normalised_scores_series,
-        initial_cooperation_count_series,
-        interactions_count_series,
-    ):
+    @classmethod
+    def from_accumulator(cls, accumulator, progress_bar=True, array_mode=False):
         """
-        Reshape the various pandas series objects to be of the required form and
-        set the corresponding attributes.
-        """
-
-        self.payoffs = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Score per turn"],
-            first_dimension=range(self.num_players),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.repetitions),
-            key_order=[2, 0, 1],
-        )
+        Builds a result set from results accumulated in memory, without
+        reading a file.
 
-        self.score_diffs = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Score difference per turn"],
-            first_dimension=range(self.num_players),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.repetitions),
-            key_order=[2, 0, 1],
-            alternative=0,
-        )
-
-        self.match_lengths = self._reshape_three_dim_list(
-            mean_per_reps_player_opponent_df["Turns"],
-            first_dimension=range(self.repetitions),
-            second_dimension=range(self.num_players),
-            third_dimension=range(self.num_players),
-            alternative=0,
-        )
-
-        self.wins = self._reshape_two_dim_list(
-            sum_per_player_repetition_df["Win"]
-        )
-        self.scores = self._reshape_two_dim_list(
-            sum_per_player_repetition_df["Score"]
-        )
-        self.normalised_scores = self._reshape_two_dim_list(
-            normalised_scores_series
-        )
+        Parameters
+        ----------
+            accumulator : axelrod.ResultAccumulator
+                The accumulated results of the matches of a tournament
+            progress_bar: boolean
+                Not used: there is nothing to read. Kept for compatibility.
+            array_mode: boolean
+                If the results are NumPy arrays rather than lists.
+        """
+        result_set = cls.__new__(cls)
+        result_set.filename = None
+        result_set.players = accumulator.players
+        result_set.repetitions = accumulator.repetitions
+        result_set.num_players = len(result_set.players)
+        result_set.array_mode = array_mode
+        result_set._set_aggregates(accumulator)
+        return result_set
+
+    def _set_aggregates(self, accumulator):
+        """
+        Sets the accumulator of the results, kept so that result sets can be
+        merged, and the aggregates returned by its `summaries` method, from
+        which the results are built when first accessed.
+        """
+        self._accumulator = accumulator
+        self._aggregates = accumulator.summaries()
+        self._results = {}
 
-        self.cooperation = self._build_cooperation(
-            sum_per_player_opponent_df["Cooperation count"]
-        )
-        self.good_partner_matrix = self._build_good_partner_matrix(
-            sum_per_player_opponent_df["Good partner"]
-        )
+    def merge(self, other):
+        """
+        Merges the results with those of another result set of the same
+        players and repetitions: for example one of another shard of the
+        matches of a tournament, split by player pairs. Each match should
+        only be in one of the result sets.
 
-        columns = ["CC count", "CD count", "DC count", "DD count"]
-        self.state_distribution = self._build_state_distribution(
-            sum_per_player_opponent_df[columns]
-        )
-        self.normalised_state_distribution = (
-            self._build_normalised_state_distribution()
-        )
+        Parameters
+        ----------
+            other : axelrod.ResultSet
+                The result set to merge with.
 
-        columns = [
-            "CC to C count",
-            "CC to D count",
-            "CD to C count",
-            "CD to D count",
-            "DC to C count",
-            "DC to D count",
-            "DD to C count",
-            "DD to D count",
-        ]
-        self.state_to_action_distribution = (
-            self._build_state_to_action_distribution(
-                sum_per_player_opponent_df[columns]
-            )
-        )
-        self.normalised_state_to_action_distribution = (
-            self._build_normalised_state_to_action_distribution()
+        Returns
+        -------
+            A new axelrod.ResultSet of the results of both result sets, in
+            the array mode of this one.
+        """
+        accumulator = copy.deepcopy(self._accumulator)
+        accumulator.merge(other._accumulator)
+        return ResultSet.from_accumulator(
+            accumulator, progress_bar=False, array_mode=self.array_mode
         )
 
-        self.initial_cooperation_count = self._build_initial_cooperation_count(
-            initial_cooperation_count_series
-        )
-        self.initial_cooperation_rate = self._build_initial_cooperation_rate(
-            interactions_count_series
-        )
-        self.good_partner_rating = self._build_good_partner_rating(
-            interactions_count_series
-        )
+    def concatenate(self, other):
+        """
+        Concatenates the repetitions of another result set of the same
+        players after those of this one: for example the results of further
+        repetitions of a tournament.
 
-        self.normalised_cooperation = self._build_normalised_cooperation()
-        self.ranking = self._build_ranking()
-        self.ranked_names = self._build_ranked_names()
+        Parameters
+        ----------
+            other : axelrod.ResultSet
+                The result set whose repetitions are appended.
 
-        self.payoff_matrix = self._build_summary_matrix(self.payoffs)
-        self.payoff_stddevs = self._build_summary_matrix(
-            self.payoffs, func=np.std
+        Returns
+        -------
+            A new axelrod.ResultSet with the repetitions of both result sets,
+            in the array mode of this one.
+        """
+        accumulator = copy.deepcopy(self._accumulator)
+        accumulator.extend(other._accumulator)
+        return ResultSet.from_accumulator(
+            accumulator, progress_bar=False, array_mode=self.array_mode
         )
 
-        self.payoff_diffs_means = self._build_payoff_diffs_means()
-        self.cooperating_rating = self._build_cooperating_rating()
-        self.vengeful_cooperation = self._build_vengeful_cooperation()
-        self.eigenjesus_rating = self._build_eigenjesus_rating()
-        self.eigenmoses_rating = self._build_eigenmoses_rating()
+    def _result(self, name):
+        """
+        Returns the result with the given name, building it with the
+        corresponding `_build_` method if it has not been built yet.
+        """
+        try:
+            return self._results[name]
+        except KeyError:
+            result = self._results[name] = getattr(self, "_build_" + name)()
+            return result
 
-    @update_progress_bar
-    def _reshape_three_dim_list(
-        self,
-        series,
-        first_dimension,
-        second_dimension,
-        third_dimension,
-        alternative=None,
-        key_order=[0, 1, 2],
-    ):
+    def _reshape_three_dim_array(self, column, alternative=np.nan):
         """
         Parameters
         ----------
-            series : pandas.Series
-            first_dimension : iterable
-            second_dimension : iterable
-            third_dimension : iterable
-            alternative : int
-                What to do if there is no entry at given position
-            key_order : list
-                Indices re-ording the dimensions to the correct keys in the
-                series
+            column : string
+                One of the columns in _MEAN_COLUMNS
+            alternative : float
+                The value for matches that were not played.
 
         Returns:
         --------
-            A three dimensional list across the three dimensions
-        """
-        series_dict = series.to_dict()
-        output = []
-        for first_index in first_dimension:
-            matrix = []
-            for second_index in second_dimension:
-                row = []
-                for third_index in third_dimension:
-                    key = (first_index, second_index, third_index)
-                    key = tuple([key[order] for order in key_order])
-                    if key in series_dict:
-                        row.append(series_dict[key])
-                    elif alternative is not None:
-                        row.append(alternative)
-                matrix.append(row)
-            output.append(matrix)
-        return output
-
-    @update_progress_bar
-    def _reshape_two_dim_list(self, series):
+            The means of the column for each player, opponent and repetition.
         """
-        Parameters
-        ----------
-            series : pandas.Series
+        means = self._aggregates.match_means.transpose(1, 2, 0, 3)
+        played = self._aggregates.played.transpose(1, 2, 0)
+        return np.where(
+            played, means[..., _MEAN_COLUMNS.index(column)], alternative
+        )
 
-        Returns:
-        --------
-            A two dimensional list across repetitions and opponents
+    def _pair_sums(self, first_column, last_column=None):
         """
-        series_dict = series.to_dict()
-        out = [
-            [
-                series_dict.get((player_index, repetition), 0)
-                for repetition in range(self.repetitions)
-            ]
-            for player_index in range(self.num_players)
-        ]
-        return out
-
-    @update_progress_bar
-    def _build_cooperation(self, cooperation_series):
-        cooperation_dict = cooperation_series.to_dict()
-        cooperation = []
-        for player_index in range(self.num_players):
-            row = []
-            for opponent_index in range(self.num_players):
-                count = cooperation_dict.get((player_index, opponent_index), 0)
-                if player_index == opponent_index:
-                    # Address double count
-                    count = int(count / 2)
-                row.append(count)
-            cooperation.append(row)
-        return cooperation
+        Returns the sums of a column in _SUMMED_COLUMNS, or of the columns from
+        `first_column` to `last_column`, for each player and opponent.
+        """
+        first = _SUMMED_COLUMNS.index(first_column)
+        if last_column is None:
+            return self._aggregates.pair_sums[..., first]
+        last = _SUMMED_COLUMNS.index(last_column)
+        return self._aggregates.pair_sums[..., first : last + 1]
+
+    def _remove_self_interactions(self, counts):
+        """Returns a copy of counts indexed by player and opponent, with zero
+        counts for self interactions."""
+        counts = counts.copy()
+        counts[np.diag_indices(self.num_players)] = 0
+        return counts
+
+    def _build_payoffs(self):
+        return self._reshape_three_dim_array("Score per turn")
+
+    def _build_score_diffs(self):
+        return self._reshape_three_dim_array(
+            "Score difference per turn", alternative=0
+        )
 
-    @update_progress_bar
-    def _build_good_partner_matrix(self, good_partner_series):
-        good_partner_dict = good_partner_series.to_dict()
-        good_partner_matrix = []
-        for player_index in range(self.num_players):
-            row = []
-            for opponent_index in range(self.num_players):
-                if player_index == opponent_index:
-                    # The reduce operation implies a double count of self
-                    # interactions.
-                    row.append(0)
-                else:
-                    row.append(
-                        good_partner_dict.get((player_index, opponent_index), 0)
-                    )
-            good_partner_matrix.append(row)
-        return good_partner_matrix
-
-    @update_progress_bar
-    def _build_summary_matrix(self, attribute, func=np.mean):
-        matrix = [
-            [0 for opponent_index in range(self.num_players)]
-            for player_index in range(self.num_players)
-        ]
+    def _build_match_lengths(self):
+        turns = self._aggregates.match_means[..., _MEAN_COLUMNS.index("Turns")]
+        return np.where(self._aggregates.played, turns, 0)
+
+    def _build_wins(self):
+        return self._aggregates.wins
+
+    def _build_scores(self):
+        return self._aggregates.scores
 
-        pairs = itertools.product(range(self.num_players), repeat=2)
+    def _build_normalised_scores(self):
+        return self._aggregates.normalised_scores
 
-        for player_index, opponent_index in pairs:
-            utilities = attribute[player_index][opponent_index]
-            if utilities:
-                matrix[player_index][opponent_index] = func(utilities)
+    def _build_cooperation(self):
+        cooperation = self._pair_sums("Cooperation count").copy()
+        # Address double count
+        np.fill_diagonal(cooperation, np.diagonal(cooperation) // 2)
+        return cooperation
 
-        return matrix
+    def _build_good_partner_matrix(self):
+        # The reduce operation implies a double count of self interactions.
+        return self._remove_self_interactions(self._pair_sums("Good partner"))
+
+    def _build_payoff_matrix(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return np.nan_to_num(np.nanmean(self._result("payoffs"), axis=-1))
+
+    def _build_payoff_stddevs(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return np.nan_to_num(np.nanstd(self._result("payoffs"), axis=-1))
 
-    @update_progress_bar
     def _build_payoff_diffs_means(self):
-        payoff_diffs_means = [
-            [np.mean(diff) for diff in player] for player in self.score_diffs
-        ]
+        return np.mean(self._result("score_diffs"), axis=-1)
 
-        return payoff_diffs_means
-
-    @update_progress_bar
-    def _build_state_distribution(self, state_distribution_series):
-        state_key_map = {
-            "CC count": (C, C),
-            "CD count": (C, D),
-            "DC count": (D, C),
-            "DD count": (D, D),
-        }
-        state_distribution = [
-            [
-                create_counter_dict(
-                    state_distribution_series,
-                    player_index,
-                    opponent_index,
-                    state_key_map,
-                )
-                for opponent_index in range(self.num_players)
-            ]
-            for player_index in range(self.num_players)
-        ]
-        return state_distribution
+    def _build_state_distribution(self):
+        return self._remove_self_interactions(
+            self._pair_sums("CC count", "DD count")
+        )
 
-    @update_progress_bar
     def _build_normalised_state_distribution(self):
         """
         Returns:
         --------
-            norm : list
-
-            Normalised state distribution. A list of lists of counter objects:
+            norm : numpy.ndarray
 
-            Dictionary where the keys are the states and the values are a
-            normalized counts of the number of times that state occurs.
+            Normalised state distribution: for each player and opponent, the
+            counts of the number of times each state occurs divided by their
+            total.
         """
-        normalised_state_distribution = []
-        for player in self.state_distribution:
-            counters = []
-            for counter in player:
-                total = sum(counter.values())
-                counters.append(
-                    Counter(
-                        {key: value / total for key, value in counter.items()}
-                    )
-                )
-            normalised_state_distribution.append(counters)
-        return normalised_state_distribution
+        return _normalise_counts(self._result("state_distribution"))
 
-    @update_progress_bar
-    def _build_state_to_action_distribution(
-        self, state_to_action_distribution_series
-    ):
-        state_to_action_key_map = {
-            "CC to C count": ((C, C), C),
-            "CC to D count": ((C, C), D),
-            "CD to C count": ((C, D), C),
-            "CD to D count": ((C, D), D),
-            "DC to C count": ((D, C), C),
-            "DC to D count": ((D, C), D),
-            "DD to C count": ((D, D), C),
-            "DD to D count": ((D, D), D),
-        }
-        state_to_action_distribution = [
-            [
-                create_counter_dict(
-                    state_to_action_distribution_series,
-                    player_index,
-                    opponent_index,
-                    state_to_action_key_map,
-                )
-                for opponent_index in range(self.num_players)
-            ]
-            for player_index in range(self.num_players)
-        ]
-        return state_to_action_distribution
+    def _build_state_to_action_distribution(self):
+        counts = self._pair_sums("CC to C count", "DD to D count")
+        return self._remove_self_interactions(
+            counts.reshape(self.num_players, self.num_players, len(_STATES), 2)
+        )
 
-    @update_progress_bar
     def _build_normalised_state_to_action_distribution(self):
         """
         Returns:
         --------
-            norm : list
-
-            A list of lists of counter objects.
-
-            Dictionary where the keys are the states and the values are a
-            normalized counts of the number of times that state goes to a given
-            action.
-        """
-        normalised_state_to_action_distribution = []
-        for player in self.state_to_action_distribution:
-            counters = []
-            for counter in player:
-                norm_counter = Counter()
-                for state in [(C, C), (C, D), (D, C), (D, D)]:
-                    total = counter[(state, C)] + counter[(state, D)]
-                    if total > 0:
-                        for action in [C, D]:
-                            if counter[(state, action)] > 0:
-                                norm_counter[(state, action)] = (
-                                    counter[(state, action)] / total
-                                )
-                counters.append(norm_counter)
-            normalised_state_to_action_distribution.append(counters)
-        return normalised_state_to_action_distribution
-
-    @update_progress_bar
-    def _build_initial_cooperation_count(
-        self, initial_cooperation_count_series
-    ):
-        initial_cooperation_count_dict = (
-            initial_cooperation_count_series.to_dict()
-        )
-        initial_cooperation_count = [
-            initial_cooperation_count_dict.get(player_index, 0)
-            for player_index in range(self.num_players)
-        ]
-        return initial_cooperation_count
+            norm : numpy.ndarray
+
+            Normalised state to action distribution: for each player, opponent
+            and state, the counts of the number of times that state goes to
+            each action divided by their total.
+        """
+        return _normalise_counts(self._result("state_to_action_distribution"))
+
+    def _build_initial_cooperation_count(self):
+        return self._aggregates.initial_cooperations
 
-    @update_progress_bar
     def _build_normalised_cooperation(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            normalised_cooperation = [
-                list(np.nan_to_num(row))
-                for row in np.array(self.cooperation)
-                / sum(map(np.array, self.match_lengths))
-            ]
-            return normalised_cooperation
+            return np.nan_to_num(
+                self._result("cooperation")
+                / self._result("match_lengths").sum(axis=0)
+            )
 
-    @update_progress_bar
-    def _build_initial_cooperation_rate(self, interactions_series):
-        interactions_array = np.array(
-            [
-                interactions_series.get(player_index, 0)
-                for player_index in range(self.num_players)
-            ]
-        )
+    def _build_initial_cooperation_rate(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            initial_cooperation_rate = list(
-                np.nan_to_num(
-                    np.array(self.initial_cooperation_count)
-                    / interactions_array
-                )
+            return np.nan_to_num(
+                self._result("initial_cooperation_count")
+                / self._aggregates.interaction_counts
             )
-            return initial_cooperation_rate
 
-    @update_progress_bar
     def _build_ranking(self):
-        ranking = sorted(
-            range(self.num_players),
-            key=lambda i: -np.nanmedian(self.normalised_scores[i]),
-        )
-        return ranking
+        medians = np.nanmedian(self._result("normalised_scores"), axis=1)
+        return np.argsort(-medians, kind="stable")
 
-    @update_progress_bar
     def _build_ranked_names(self):
-        ranked_names = [str(self.players[i]) for i in self.ranking]
+        ranked_names = [str(self.players[i]) for i in self._result("ranking")]
         return ranked_names
 
-    @update_progress_bar
     def _build_eigenmoses_rating(self):
         """
         Returns:
@@ -478,12 +429,11 @@ class ResultSet:
         http://www.scottaaronson.com/morality.pdf
         """
         eigenvector, eigenvalue = eigen.principal_eigenvector(
-            self.vengeful_cooperation
+            self._result("vengeful_cooperation")
         )
 
-        return eigenvector.tolist()
+        return eigenvector
 
-    @update_progress_bar
     def _build_eigenjesus_rating(self):
         """
         Returns:
@@ -492,51 +442,33 @@ class ResultSet:
         http://www.scottaaronson.com/morality.pdf
         """
         eigenvector, eigenvalue = eigen.principal_eigenvector(
-            self.normalised_cooperation
+            self._result("normalised_cooperation")
         )
 
-        return eigenvector.tolist()
+        return eigenvector
 
-    @update_progress_bar
     def _build_cooperating_rating(self):
         """
         Returns:
         --------
-            The list of cooperation ratings
-            List of the form:
-
-            [ML1, ML2, ML3..., MLn]
+            The array of cooperation ratings, of the form:
 
-            Where n is the number of players and MLi is a list of the form:
+            [p1, p2, p3, ..., pn]
 
-            [pi1, pi2, pi3, ..., pim]
-
-            Where pij is the total number of cooperations divided by the total
-            number of turns over all repetitions played by player i against
-            player j.
+            Where n is the number of players and pi is the total number of
+            cooperations divided by the total number of turns over all
+            repetitions played by player i against other players.
         """
-
-        plist = list(range(self.num_players))
-        total_length_v_opponent = [
-            zip(*[rep[player_index] for rep in self.match_lengths])
-            for player_index in plist
-        ]
-        lengths = [
-            [sum(e) for j, e in enumerate(row) if i != j]
-            for i, row in enumerate(total_length_v_opponent)
-        ]
-
-        cooperation = [
-            [col for j, col in enumerate(row) if i != j]
-            for i, row in enumerate(self.cooperation)
-        ]
+        opponents = ~np.eye(self.num_players, dtype=bool)
+        lengths = self._result("match_lengths").sum(axis=0)
+        cooperations = np.sum(
+            self._result("cooperation"), axis=1, where=opponents
+        )
         # Max is to deal with edge cases of matches that have no turns
-        cooperating_rating = [
-            sum(cs) / max(1, sum(ls)) for cs, ls in zip(cooperation, lengths)
-        ]
-        return cooperating_rating
+        return cooperations / np.maximum(
+            1, np.sum(lengths, axis=1, where=opponents)
+        )
 
-    @update_progress_bar
     def _build_vengeful_cooperation(self):
         """
         Returns:
@@ -546,90 +478,17 @@ class ResultSet:
 
                 Dij = 2(Cij - 0.5)
         """
-        vengeful_cooperation = [
-            [2 * (element - 0.5) for element in row]
-            for row in self.normalised_cooperation
-        ]
-        return vengeful_cooperation
+        return 2 * (self._result("normalised_cooperation") - 0.5)
 
-    @update_progress_bar
-    def _build_good_partner_rating(self, interactions_series):
+    def _build_good_partner_rating(self):
         """
-        At the end of a read of the data, build the good partner rating
-        attribute
+        Returns:
+        --------
+            The number of matches in which each player cooperated at least as
+            much as their opponent, divided by the number of matches played.
         """
-        interactions_dict = interactions_series.to_dict()
-        good_partner_rating = [
-            sum(self.good_partner_matrix[player])
-            / max(1, interactions_dict.get(player, 0))
-            for player in range(self.num_players)
-        ]
-        return good_partner_rating
-
-    def _compute_tasks(self, tasks, processes):
-        """
-        Compute all dask tasks
-        """
-        if processes is None:
-            out = da.compute(*tasks, scheduler="single-threaded")
-        else:
-            out = da.compute(*tasks, num_workers=processes)
-        return out
-
-    def _build_tasks(self, df):
-        """
-        Returns a tuple of dask tasks
-        """
-        groups = ["Repetition", "Player index", "Opponent index"]
-        columns = ["Turns", "Score per turn", "Score difference per turn"]
-        mean_per_reps_player_opponent_task = df.groupby(groups)[columns].mean()
-
-        groups = ["Player index", "Opponent index"]
-        columns = [
-            "Cooperation count",
-            "CC count",
-            "CD count",
-            "DC count",
-            "DD count",
-            "CC to C count",
-            "CC to D count",
-            "CD to C count",
-            "CD to D count",
-            "DC to C count",
-            "DC to D count",
-            "DD to C count",
-            "DD to D count",
-            "Good partner",
-        ]
-        sum_per_player_opponent_task = df.groupby(groups)[columns].sum()
-
-        ignore_self_interactions_task = (
-            df["Player index"] != df["Opponent index"]
-        )
-        adf = df[ignore_self_interactions_task]
-
-        groups = ["Player index", "Repetition"]
-        columns = ["Win", "Score"]
-        sum_per_player_repetition_task = adf.groupby(groups)[columns].sum()
-
-        groups = ["Player index", "Repetition"]
-        column = "Score per turn"
-        normalised_scores_task = adf.groupby(groups)[column].mean()
-
-        groups = ["Player index"]
-        column = "Initial cooperation"
-        initial_cooperation_count_task = adf.groupby(groups)[column].sum()
-        interactions_count_task = adf.groupby("Player index")[
-            "Player index"
-        ].count()
-
-        return (
-            mean_per_reps_player_opponent_task,
-            sum_per_player_opponent_task,
-            sum_per_player_repetition_task,
-            normalised_scores_task,
-            initial_cooperation_count_task,
-            interactions_count_task,
+        return self._result("good_partner_matrix").sum(axis=1) / np.maximum(
+            1, self._aggregates.interaction_counts
         )
 
     def __eq__(self, other):
@@ -653,25 +512,36 @@ class ResultSet:
                     return False
             return True
 
+        def as_list(result_set, name):
+            """Returns an attribute of a result set, as a list in array
+            mode."""
+            value = getattr(result_set, name)
+            if isinstance(value, np.ndarray):
+                value = getattr(ResultSet, name).to_list(value)
+            return value
+
+        names = [
+            "wins",
+            "match_lengths",
+            "scores",
+            "normalised_scores",
+            "ranking",
+            "payoffs",
+            "payoff_matrix",
+            "payoff_stddevs",
+            "score_diffs",
+            "payoff_diffs_means",
+            "cooperation",
+            "normalised_cooperation",
+            "vengeful_cooperation",
+            "cooperating_rating",
+            "good_partner_matrix",
+            "good_partner_rating",
+        ]
         return all(
-            [
-                self.wins == other.wins,
-                self.match_lengths == other.match_lengths,
-                self.scores == other.scores,
-                self.normalised_scores == other.normalised_scores,
-                self.ranking == other.ranking,
-                self.ranked_names == other.ranked_names,
-                self.payoffs == other.payoffs,
-                self.payoff_matrix == other.payoff_matrix,
-                self.payoff_stddevs == other.payoff_stddevs,
-                self.score_diffs == other.score_diffs,
-                self.payoff_diffs_means == other.payoff_diffs_means,
-                self.cooperation == other.cooperation,
-                self.normalised_cooperation == other.normalised_cooperation,
-                self.vengeful_cooperation == other.vengeful_cooperation,
-                self.cooperating_rating == other.cooperating_rating,
-                self.good_partner_matrix == other.good_partner_matrix,
-                self.good_partner_rating == other.good_partner_rating,
+            [self.ranked_names == other.ranked_names]
+            + [as_list(self, name) == as_list(other, name) for name in names]
+            + [
                 list_equal_with_nans(
                     self.eigenmoses_rating, other.eigenmoses_rating
                 ),
@@ -705,9 +575,8 @@ class ResultSet:
             [[player name, median score, cooperation_rating],...]
 
         """
-
-        median_scores = map(np.nanmedian, self.normalised_scores)
-        median_wins = map(np.nanmedian, self.wins)
+        median_scores = np.nanmedian(self._result("normalised_scores"), axis=1)
+        median_wins = np.nanmedian(self._result("wins"), axis=1)
 
         self.player = namedtuple(
             "Player",
@@ -729,49 +598,36 @@ class ResultSet:
             ],
         )
 
-        states = [(C, C), (C, D), (D, C), (D, D)]
-        state_prob = []
-        for i, player in enumerate(self.normalised_state_distribution):
-            counts = []
-            for state in states:
-                p = sum([opp[state] for j, opp in enumerate(player) if i != j])
-                counts.append(p)
-            try:
-                counts = [c / sum(counts) for c in counts]
-            except ZeroDivisionError:
-                counts = [0 for c in counts]
-            state_prob.append(counts)
-
-        state_to_C_prob = []
-        for player in self.normalised_state_to_action_distribution:
-            rates = []
-            for state in states:
-                counts = [
-                    counter[(state, C)]
-                    for counter in player
-                    if counter[(state, C)] > 0
-                ]
-
-                if len(counts) > 0:
-                    rate = np.mean(counts)
-                else:
-                    rate = 0
+        state_prob = _normalise_counts(
+            self._result("normalised_state_distribution").sum(axis=1)
+        )
 
-                rates.append(rate)
-            state_to_C_prob.append(rates)
+        # The mean of the positive rates of going from each state to C.
+        to_C_rates = self._result("normalised_state_to_action_distribution")[
+            ..., 0
+        ]
+        positive_counts = np.sum(to_C_rates > 0, axis=1)
+        state_to_C_prob = np.divide(
+            to_C_rates.sum(axis=1),
+            positive_counts,
+            out=np.zeros(positive_counts.shape),
+            where=positive_counts > 0,
+        )
 
         summary_measures = list(
             zip(
                 self.players,
-                median_scores,
-                self.cooperating_rating,
-                median_wins,
-                self.initial_cooperation_rate,
+                median_scores.tolist(),
+                self._result("cooperating_rating").tolist(),
+                median_wins.tolist(),
+                self._result("initial_cooperation_rate").tolist(),
             )
         )
+        state_prob = state_prob.tolist()
+        state_to_C_prob = state_to_C_prob.tolist()
 
         summary_data = []
-        for rank, i in enumerate(self.ranking):
+        for rank, i in enumerate(self._result("ranking")):
             data = (
                 list(summary_measures[i]) + state_prob[i] + state_to_C_prob[i]
             )
@@ -798,28 +654,404 @@ class ResultSet:
                 writer.writerow(player)
 
 
-def create_counter_dict(df, player_index, opponent_index, key_map):
+# The columns averaged for each repetition, player and opponent.
+_MEAN_COLUMNS = ["Turns", "Score per turn", "Score difference per turn"]
+
+# The columns summed over all repetitions for each player and opponent.
+_SUMMED_COLUMNS = [
+    "Cooperation count",
+    "CC count",
+    "CD count",
+    "DC count",
+    "DD count",
+    "CC to C count",
+    "CC to D count",
+    "CD to C count",
+    "CD to D count",
+    "DC to C count",
+    "DC to D count",
+    "DD to C count",
+    "DD to D count",
+    "Good partner",
+]
+
+
+ResultSummaries = namedtuple(
+    "ResultSummaries",
+    [
+        "match_means",
+        "played",
+        "pair_sums",
+        "wins",
+        "scores",
+        "normalised_scores",
+        "initial_cooperations",
+        "interaction_counts",
+    ],
+)
+
+
+class ResultAccumulator(object):
+    """
+    Accumulates the results of the matches of a tournament as they are
+    played, so that a ResultSet can be built without writing and reading an
+    interactions file.
+
+    The accumulated quantities are the aggregates of the rows of the
+    interactions file used by ResultSet: for every match, there is one row
+    from the point of view of each player. Sums of floats use the same
+    compensated summation as pandas so the results are identical to those
+    obtained from a binary interactions file.
+
+    Accumulators of different shards of the matches of a tournament can be
+    combined with `merge`, and accumulators of different repetitions with
+    `extend`.
     """
-    Create a Counter object mapping states (corresponding to columns of df) for
-    players given by player_index, opponent_index. Renaming the variables with
-    `key_map`. Used by `ResultSet._reshape_out`
-
-    Parameters
-    ----------
-        df : a multiindex pandas df
-        player_index: int
-        opponent_index: int
-        key_map : a dict
-            maps cols of df to strings
-
-    Returns
-    -------
-        A counter dictionary
+
+    def __init__(self, players, repetitions):
+        """
+        Parameters
+        ----------
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+        """
+        self.players = players
+        self.repetitions = repetitions
+        n, r = len(players), repetitions
+
+        # Per repetition, player and opponent: Turns, Score per turn and
+        # Score difference per turn.
+        self._match_sums = np.zeros((r, n, n, 3))
+        self._match_counts = np.zeros((r, n, n), dtype=np.int64)
+
+        # Per player and opponent, over repetitions.
+        self._pair_sums = np.zeros((n, n, len(_SUMMED_COLUMNS)), dtype=np.int64)
+        self._pair_counts = np.zeros((n, n), dtype=np.int64)
+
+        # Per player and repetition, ignoring self interactions.
+        self._wins = np.zeros((n, r), dtype=np.int64)
+        self._scores = np.zeros((n, r))
+        self._score_compensations = np.zeros((n, r))
+        self._integer_scores = True
+        self._score_per_turn_sums = np.zeros((n, r))
+        self._score_per_turn_compensations = np.zeros((n, r))
+        self._repetition_counts = np.zeros((n, r), dtype=np.int64)
+
+        # Per player, ignoring self interactions.
+        self._initial_cooperations = np.zeros(n, dtype=np.int64)
+        self._interaction_counts = np.zeros(n, dtype=np.int64)
+
+    def add_results(self, results):
+        """
+        Adds the results of matches.
+
+        Parameters
+        ----------
+            results : dict
+                Mapping player index pairs to lists of interactions, results
+                and repetition indices as returned by
+                `Tournament._play_matches`.
+        """
+        for index_pair, interactions in results.items():
+            for _, match_results, repetition in interactions:
+                self._add_match(index_pair, repetition, match_results)
+
+    def merge(self, other):
+        """
+        Adds the results accumulated by another accumulator of the same
+        players and repetitions, for example of another shard of the matches
+        of a tournament.
+
+        Parameters
+        ----------
+            other : axelrod.ResultAccumulator
+                The accumulator whose results are added.
+        """
+        self._check_players(other)
+        if other.repetitions != self.repetitions:
+            raise ValueError(
+                "Only accumulators of the same repetitions can be merged."
+            )
+
+        self._match_sums += other._match_sums
+        self._match_counts += other._match_counts
+        self._pair_sums += other._pair_sums
+        self._pair_counts += other._pair_counts
+
+        self._wins += other._wins
+        _compensated_add(
+            self._scores,
+            self._score_compensations,
+            ...,
+            other._scores - other._score_compensations,
+        )
+        self._integer_scores &= other._integer_scores
+        _compensated_add(
+            self._score_per_turn_sums,
+            self._score_per_turn_compensations,
+            ...,
+            other._score_per_turn_sums - other._score_per_turn_compensations,
+        )
+        self._repetition_counts += other._repetition_counts
+
+        self._initial_cooperations += other._initial_cooperations
+        self._interaction_counts += other._interaction_counts
+
+    def extend(self, other):
+        """
+        Appends the repetitions accumulated by another accumulator of the
+        same players after the repetitions of this one, for example those of
+        further repetitions of a tournament.
+
+        Parameters
+        ----------
+            other : axelrod.ResultAccumulator
+                The accumulator whose repetitions are appended.
+        """
+        self._check_players(other)
+        self.repetitions += other.repetitions
+
+        # Indexed by repetition first.
+        for name in ["_match_sums", "_match_counts"]:
+            arrays = getattr(self, name), getattr(other, name)
+            setattr(self, name, np.concatenate(arrays, axis=0))
+
+        # Indexed by player and repetition.
+        for name in [
+            "_wins",
+            "_scores",
+            "_score_compensations",
+            "_score_per_turn_sums",
+            "_score_per_turn_compensations",
+            "_repetition_counts",
+        ]:
+            arrays = getattr(self, name), getattr(other, name)
+            setattr(self, name, np.concatenate(arrays, axis=1))
+        self._integer_scores &= other._integer_scores
+
+        # Summed over repetitions.
+        self._pair_sums += other._pair_sums
+        self._pair_counts += other._pair_counts
+        self._initial_cooperations += other._initial_cooperations
+        self._interaction_counts += other._interaction_counts
+
+    def _check_players(self, other):
+        if list(other.players) != list(self.players):
+            raise ValueError(
+                "Only accumulators of the same players can be combined."
+            )
+
+    def add_rows(self, df):
+        """
+        Adds rows of an interactions file.
+
+        Parameters
+        ----------
+            df : pandas.DataFrame
+                Rows of an interactions file with results, with at least the
+                columns used by ResultSet, in the order in which they were
+                written.
+        """
+        players = df["Player index"].to_numpy(dtype=np.int64)
+        opponents = df["Opponent index"].to_numpy(dtype=np.int64)
+        repetitions = df["Repetition"].to_numpy(dtype=np.int64)
+
+        key = (repetitions, players, opponents)
+        np.add.at(
+            self._match_sums,
+            key,
+            df[_MEAN_COLUMNS].to_numpy(dtype=float),
+        )
+        np.add.at(self._match_counts, key, 1)
+
+        key = (players, opponents)
+        np.add.at(
+            self._pair_sums, key, df[_SUMMED_COLUMNS].to_numpy(dtype=np.int64)
+        )
+        np.add.at(self._pair_counts, key, 1)
+
+        rows = players != opponents
+        players, repetitions = players[rows], repetitions[rows]
+
+        key = (players, repetitions)
+        np.add.at(self._wins, key, df["Win"].to_numpy(dtype=np.int64)[rows])
+        scores = df["Score"].to_numpy(dtype=float)[rows]
+        _compensated_add_at(
+            self._scores, self._score_compensations, key, scores
+        )
+        self._integer_scores &= bool(np.all(np.mod(scores, 1) == 0))
+        _compensated_add_at(
+            self._score_per_turn_sums,
+            self._score_per_turn_compensations,
+            key,
+            df["Score per turn"].to_numpy(dtype=float)[rows],
+        )
+        np.add.at(self._repetition_counts, key, 1)
+
+        np.add.at(
+            self._initial_cooperations,
+            players,
+            df["Initial cooperation"].to_numpy(dtype=np.int64)[rows],
+        )
+        np.add.at(self._interaction_counts, players, 1)
+
+    def _add_match(self, index_pair, repetition, match_results):
+        (
+            scores,
+            _,
+            turns,
+            score_per_turns,
+            score_diffs_per_turns,
+            initial_cooperation,
+            cooperations,
+            state_distribution,
+            state_to_action_distributions,
+            winner_index,
+        ) = match_results
+
+        for index, player_index in enumerate(index_pair):
+            opponent_index = index_pair[index - 1]
+
+            key = (repetition, player_index, opponent_index)
+            self._match_sums[key] += (
+                turns,
+                score_per_turns[index],
+                score_diffs_per_turns[index],
+            )
+            self._match_counts[key] += 1
+
+            states = [(C, C), (C, D), (D, C), (D, D)]
+            if index == 1:
+                states = [state[::-1] for state in states]
+            row = [cooperations[index]]
+            row.extend(state_distribution[state] for state in states)
+            for state in states:
+                for action in (C, D):
+                    row.append(
+                        state_to_action_distributions[index][(state, action)]
+                    )
+            row.append(int(cooperations[index] >= cooperations[index - 1]))
+            self._pair_sums[player_index, opponent_index] += row
+            self._pair_counts[player_index, opponent_index] += 1
+
+            if player_index == opponent_index:
+                continue
+
+            key = (player_index, repetition)
+            self._wins[key] += int(winner_index is index)
+            _compensated_add(
+                self._scores, self._score_compensations, key, scores[index]
+            )
+            self._integer_scores &= float(scores[index]).is_integer()
+            _compensated_add(
+                self._score_per_turn_sums,
+                self._score_per_turn_compensations,
+                key,
+                score_per_turns[index],
+            )
+            self._repetition_counts[key] += 1
+
+            self._initial_cooperations[player_index] += initial_cooperation[
+                index
+            ]
+            self._interaction_counts[player_index] += 1
+
+    def summaries(self):
+        """
+        Returns the aggregates that ResultSet is built from, as copies of
+        arrays indexed by players, opponents and repetitions.
+
+        Returns
+        -------
+            A ResultSummaries named tuple of:
+
+            match_means : numpy.ndarray
+                The mean Turns, Score per turn and Score difference per turn of
+                the rows of each repetition, player and opponent.
+            played : numpy.ndarray
+                Whether each repetition, player and opponent has any rows.
+            pair_sums : numpy.ndarray
+                The sums of the columns in _SUMMED_COLUMNS for each player
+                and opponent.
+            wins, scores, normalised_scores : numpy.ndarray
+                The wins, scores and mean scores per turn of each player in
+                each repetition, ignoring self interactions.
+            initial_cooperations, interaction_counts : numpy.ndarray
+                The initial cooperations and the number of rows of each
+                player, ignoring self interactions.
+        """
+        played = self._match_counts > 0
+        match_means = np.zeros(self._match_sums.shape)
+        match_means[played] = (
+            self._match_sums[played] / self._match_counts[played][:, None]
+        )
+
+        scores = self._scores
+        if self._integer_scores:
+            scores = scores.astype(np.int64)
+        normalised_scores = np.zeros(self._score_per_turn_sums.shape)
+        rows = self._repetition_counts > 0
+        normalised_scores[rows] = (
+            self._score_per_turn_sums[rows] / self._repetition_counts[rows]
+        )
+
+        return ResultSummaries(
+            match_means,
+            played,
+            self._pair_sums.copy(),
+            self._wins.copy(),
+            np.array(scores),
+            normalised_scores,
+            self._initial_cooperations.copy(),
+            self._interaction_counts.copy(),
+        )
+
+
+def _compensated_add(sums, compensations, key, value):
+    """Adds value to sums[key] using Kahan summation, as pandas does."""
+    value = value - compensations[key]
+    total = sums[key] + value
+    compensations[key] = total - sums[key] - value
+    sums[key] = total
+
+
+def _compensated_add_at(sums, compensations, key, values):
+    """Adds each value to sums at the corresponding index of key using Kahan
+    summation, in order, as `_compensated_add` does for single values.
+
+    The values added to the same index are added in successive vectorised
+    steps: the first value of every index, then the second and so on.
     """
-    counter = Counter()
-    if player_index != opponent_index:
-        if (player_index, opponent_index) in df.index:
-            for key, value in df.loc[player_index, opponent_index].items():
-                if value > 0:
-                    counter[key_map[key]] = value
-    return counter
+    indices = np.ravel_multi_index(key, sums.shape)
+    order = np.argsort(indices, kind="stable")
+    sorted_indices = indices[order]
+    starts = np.flatnonzero(np.diff(sorted_indices, prepend=-1))
+    occurrences = np.arange(len(indices)) - np.repeat(
+        starts, np.diff(np.append(starts, len(indices)))
+    )
+    flat_sums, flat_compensations = sums.reshape(-1), compensations.reshape(-1)
+    for occurrence in range(occurrences.max(initial=-1) + 1):
+        rows = order[occurrences == occurrence]
+        _compensated_add(
+            flat_sums, flat_compensations, indices[rows], values[rows]
+        )
+
+
+def _read_interactions_chunks(filename):
+    """Yields the rows of an interactions file, in either format, as pandas
+    DataFrames of at most _CHUNK_SIZE rows with the columns used by
+    ResultSet."""
+    columns = (
+        ["Player index", "Opponent index", "Repetition"]
+        + _MEAN_COLUMNS
+        + _SUMMED_COLUMNS
+        + ["Win", "Score", "Initial cooperation"]
+    )
+    if iu.is_binary_interactions_file(filename):
+        df = iu.read_binary_interactions(filename, columns=columns)
+        for start in range(0, len(df), _CHUNK_SIZE):
+            yield df.iloc[start : start + _CHUNK_SIZE]
+    else:
+        yield from pd.read_csv(filename, usecols=columns, chunksize=_CHUNK_SIZE)
@@ -1,5 +1,7 @@
 import itertools
-from typing import Any, Dict, List, Sequence, Text, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Text, Tuple
+
+import numpy as np
 
 from axelrod.action import Action
 from axelrod.evolvable_player import (
@@ -7,11 +9,13 @@ from axelrod.evolvable_player import (
     InsufficientParametersError,
     copy_lists,
 )
+from axelrod.game import Game
 from axelrod.player import Player
 
 C, D = Action.C, Action.D
 actions = (C, D)
 Transition = Tuple[int, Action, int, Action]
+CompiledFSM = Tuple[np.ndarray, np.ndarray, Dict[int, int]]
 
 
 class SimpleFSM(object):
@@ -36,6 +40,7 @@ class SimpleFSM(object):
             (current_state, input_action): (next_state, output_action)
             for current_state, input_action, next_state, output_action in transitions
         }  # type: dict
+        self._compiled = None  # type: Optional[CompiledFSM]
 
         self._raise_error_for_bad_input()
 
@@ -74,6 +79,40 @@ class SimpleFSM(object):
             [x[0], x[1], y[0], y[1]] for x, y in self._state_transitions.items()
         ]
 
+    def compile(self) -> CompiledFSM:
+        """Returns the transitions as integer arrays.
+
+        States are relabelled 0, 1, ... in increasing order and actions are
+        represented by their values (0 for C and 1 for D).
+
+        Returns
+        -------
+        next_states : numpy.ndarray
+            next_states[state, action] is the state reached from `state` when
+            the opponent played `action`.
+        next_actions : numpy.ndarray
+            next_actions[state, action] is the response to `action` in `state`.
+        indices : dict
+            Mapping the original states to their labels in the arrays.
+        """
+        if self._compiled is None:
+            states = sorted(set(state for state, _ in self._state_transitions))
+            indices = {state: index for index, state in enumerate(states)}
+            next_states = np.empty(
+                (len(states), 2), dtype=int
+            )  # type: np.ndarray
+            next_actions = np.empty(
+                (len(states), 2), dtype=np.uint8
+            )  # type: np.ndarray
+            for (state, action), (
+                next_state,
+                next_action,
+            ) in self._state_transitions.items():
+                next_states[indices[state], action.value] = indices[next_state]
+                next_actions[indices[state], action.value] = next_action.value
+            self._compiled = next_states, next_actions, indices
+        return self._compiled
+
     def move(self, opponent_action: Action) -> Action:
         """Computes the response move and changes state."""
         next_state, next_action = self._state_transitions[
@@ -128,6 +167,16 @@ class FSMPlayer(Player):
         else:
             return self.fsm.move(opponent.history[-1])
 
+    def state_key(self):
+        """The future actions of a finite state machine only depend on its
+        state and the last action of its opponent."""
+        if type(self).strategy is not FSMPlayer.strategy:
+            # The strategy has been transformed.
+            return super().state_key()
+        if len(self.history) == 0:
+            return None
+        return self.fsm.state, self.history.coplays[-1]
+
 
 class EvolvableFSMPlayer(FSMPlayer, EvolvablePlayer):
     """Abstract base class for evolvable finite state machine players."""
@@ -336,6 +385,105 @@ class EvolvableFSMPlayer(FSMPlayer, EvolvablePlayer):
         return lb, ub
 
 
+def _compiled_player(player: FSMPlayer) -> Tuple[list, list, int]:
+    """Returns the compiled transitions of a player as lists, along with the
+    label of its initial state."""
+    if type(player).strategy is not FSMPlayer.strategy:
+        raise TypeError("{} is not a finite state machine.".format(player))
+    next_states, next_actions, indices = player.fsm.compile()
+    return (
+        next_states.tolist(),
+        next_actions.tolist(),
+        indices[player.initial_state],
+    )
+
+
+def fsm_match_cycle(
+    player1: FSMPlayer, player2: FSMPlayer
+) -> Tuple[List[Tuple[Action, Action]], List[Tuple[Action, Action]]]:
+    """Returns the interactions of a match between two finite state machine
+    players as a prefix followed by a cycle that repeats indefinitely.
+
+    After the first turn, the joint state of the match is given by the
+    states of both machines and the last actions of both players. This walk
+    of the product of both machines stops as soon as a joint state repeats,
+    so it takes at most 4 times the product of the numbers of states of the
+    machines.
+
+    Parameters
+    ----------
+    player1, player2 : axelrod.FSMPlayer
+
+    Returns
+    -------
+    prefix : list
+        The interactions before the cycle starts.
+    cycle : list
+        The interactions that then repeat.
+    """
+    next_states_1, next_actions_1, state_1 = _compiled_player(player1)
+    next_states_2, next_actions_2, state_2 = _compiled_player(player2)
+    action_1 = player1.initial_action.value
+    action_2 = player2.initial_action.value
+
+    plays = [(action_1, action_2)]
+    seen = {}  # type: Dict[Tuple[int, int, int, int], int]
+    joint_state = (state_1, state_2, action_1, action_2)
+    while joint_state not in seen:
+        # The joint state includes the last actions so the turn that led to
+        # it is the first turn of the cycle when it repeats.
+        seen[joint_state] = len(plays) - 1
+        state_1, action_1, state_2, action_2 = (
+            next_states_1[state_1][action_2],
+            next_actions_1[state_1][action_2],
+            next_states_2[state_2][action_1],
+            next_actions_2[state_2][action_1],
+        )
+        plays.append((action_1, action_2))
+        joint_state = (state_1, state_2, action_1, action_2)
+
+    # The last turn played is the first turn of the second cycle.
+    start = seen[joint_state]
+    interactions = [(Action(a1), Action(a2)) for a1, a2 in plays[:-1]]
+    return interactions[:start], interactions[start:]
+
+
+def fsm_match_interactions(
+    player1: FSMPlayer, player2: FSMPlayer, turns: int
+) -> List[Tuple[Action, Action]]:
+    """Returns the interactions of a match between two finite state machine
+    players, identical to those given by axelrod.Match."""
+    prefix, cycle = fsm_match_cycle(player1, player2)
+    if turns <= len(prefix):
+        return prefix[:turns]
+    repeats, remainder = divmod(turns - len(prefix), len(cycle))
+    return prefix + cycle * repeats + cycle[:remainder]
+
+
+def fsm_match_final_score(
+    player1: FSMPlayer, player2: FSMPlayer, turns: int, game: Game = None
+) -> Tuple[float, float]:
+    """Returns the final score of a match between two finite state machine
+    players without building all of its interactions: the score of the cycle
+    is extrapolated to the number of turns."""
+    if game is None:
+        game = Game()
+    prefix, cycle = fsm_match_cycle(player1, player2)
+
+    def total(interactions):
+        scores = [game.score(plays) for plays in interactions]
+        return np.sum(scores, axis=0) if scores else np.zeros(2)
+
+    if turns <= len(prefix):
+        scores = total(prefix[:turns])
+    else:
+        repeats, remainder = divmod(turns - len(prefix), len(cycle))
+        scores = (
+            total(prefix) + repeats * total(cycle) + total(cycle[:remainder])
+        )
+    return tuple(scores.tolist())
+
+
 class Fortress3(FSMPlayer):
     """Finite state machine player specified in http://DOI.org/10.1109/CEC.2006.1688322.
 
@@ -83,6 +83,13 @@ class ForgetfulGrudger(Player):
             return D
         return C
 
+    def state_key(self):
+        """The grudge may have started more than `memory_depth` turns ago so
+        the state includes it explicitly."""
+        if len(self.history) == 0:
+            return None
+        return self.grudged, self.grudge_memory, self.history.coplays[-1]
+
 
 class OppositeGrudger(Player):
     """
@@ -50,6 +50,17 @@ class OnceBitten(Player):
             return D
         return C
 
+    def state_key(self):
+        """The grudge may have started more than `memory_depth` turns ago so
+        the state includes it explicitly."""
+        if len(self.history) < 2:
+            return None
+        return (
+            self.grudged,
+            self.grudge_memory,
+            tuple(self.history.coplays[-2:]),
+        )
+
 
 class FoolMeOnce(Player):
     """
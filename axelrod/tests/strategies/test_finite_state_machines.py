@@ -11,6 +11,9 @@ from axelrod.strategies.finite_state_machines import (
     EvolvableFSMPlayer,
     FSMPlayer,
     SimpleFSM,
+    fsm_match_cycle,
+    fsm_match_final_score,
+    fsm_match_interactions,
 )
 
 from .test_evolvable_player import PartialClass, TestEvolvablePlayer
@@ -105,6 +108,98 @@ class TestSimpleFSM(unittest.TestCase):
             error_msg, "state: 5 does not have values for both C and D"
         )
 
+    def test_compile(self):
+        next_states, next_actions, indices = self.two_state.compile()
+        self.assertEqual(indices, {0: 0, 1: 1})
+        self.assertEqual(next_states.tolist(), [[1, 1], [0, 0]])
+        self.assertEqual(
+            next_actions.tolist(), [[D.value, C.value], [C.value, D.value]]
+        )
+        self.assertIs(self.two_state.compile()[0], next_states)
+
+    def test_compile_relabels_states(self):
+        fsm = SimpleFSM(
+            transitions=(
+                (5, C, 9, C),
+                (5, D, 5, D),
+                (9, C, 9, C),
+                (9, D, 5, D),
+            ),
+            initial_state=5,
+        )
+        next_states, next_actions, indices = fsm.compile()
+        self.assertEqual(indices, {5: 0, 9: 1})
+        self.assertEqual(next_states.tolist(), [[1, 0], [1, 0]])
+        self.assertEqual(next_actions.tolist(), [[0, 1], [0, 1]])
+
+
+class TestFSMMatch(unittest.TestCase):
+    """Tests the play of matches between finite state machines using their
+    compiled transitions."""
+
+    players = [
+        s()
+        for s in axl.strategies
+        if issubclass(s, FSMPlayer) and s.strategy is FSMPlayer.strategy
+    ]
+
+    def test_cycle(self):
+        prefix, cycle = fsm_match_cycle(axl.Fortress3(), axl.Fortress3())
+        self.assertEqual(prefix, [(D, D), (D, D)])
+        self.assertEqual(cycle, [(C, C)])
+
+    def test_agrees_with_match(self):
+        for player1 in self.players:
+            for player2 in self.players:
+                for turns in [0, 1, 2, 3, 200]:
+                    match = axl.Match(
+                        (player1.clone(), player2.clone()), turns=turns
+                    )
+                    interactions = match.play()
+                    self.assertEqual(
+                        fsm_match_interactions(player1, player2, turns),
+                        interactions,
+                    )
+                    if turns:
+                        self.assertEqual(
+                            fsm_match_final_score(player1, player2, turns),
+                            match.final_score(),
+                        )
+
+    def test_final_score_with_game(self):
+        game = axl.Game(r=4, s=0, t=6, p=2)
+        match = axl.Match((axl.Predator(), axl.Raider()), turns=500, game=game)
+        match.play()
+        self.assertEqual(
+            fsm_match_final_score(axl.Predator(), axl.Raider(), 500, game),
+            match.final_score(),
+        )
+
+    def test_long_match(self):
+        self.assertEqual(
+            fsm_match_final_score(axl.Fortress3(), axl.Fortress3(), 10**9),
+            (2 + 3 * (10**9 - 2), 2 + 3 * (10**9 - 2)),
+        )
+
+    def test_state_key(self):
+        player = axl.Fortress3()
+        self.assertIsNone(player.state_key())
+        axl.Match((player, axl.Alternator()), turns=3).play()
+        self.assertEqual(player.state_key(), (player.fsm.state, C))
+
+        transformed = axl.strategy_transformers.DualTransformer()(
+            axl.Fortress3
+        )()
+        self.assertIsNone(transformed.state_key())
+
+    def test_not_finite_state_machine(self):
+        for player in [
+            axl.TitForTat(),
+            axl.MockPlayer([C]),
+        ]:
+            with self.assertRaises(TypeError):
+                fsm_match_cycle(player, axl.Fortress3())
+
 
 class TestSampleFSMPlayer(TestPlayer):
     """Test a few sample tables to make sure that the finite state machines are
@@ -72,6 +72,12 @@ class TestForgetfulGrudger(TestPlayer):
         attrs = {"grudged": False, "mem_length": 10, "grudge_memory": 0}
         self.versus_test(opponent, expected_actions=actions, attrs=attrs)
 
+    def test_state_key(self):
+        player = self.player()
+        self.assertIsNone(player.state_key())
+        axl.Match((player, axl.Defector()), turns=3).play()
+        self.assertEqual(player.state_key(), (True, 2, D))
+
 
 class TestOppositeGrudger(TestPlayer):
 
@@ -72,6 +72,13 @@ class TestOnceBitten(TestPlayer):
         p1.reset()
         self.assertFalse(p1.grudged)
 
+    def test_state_key(self):
+        player = self.player()
+        axl.Match((player, axl.Cooperator()), turns=1).play()
+        self.assertIsNone(player.state_key())
+        axl.Match((player, axl.Defector()), turns=4).play()
+        self.assertEqual(player.state_key(), (True, 1, (D, D)))
+
 
 class TestFoolMeOnce(TestPlayer):
 
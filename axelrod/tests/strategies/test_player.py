@@ -147,6 +147,19 @@ class TestPlayerClass(unittest.TestCase):
             self.assertEqual(len(player1.history), turns)
             self.assertEqual(player1.history, player2.history)
 
+    def test_state_key(self):
+        self.assertIsNone(self.player().state_key())
+
+        player = axl.TitFor2Tats()
+        player.update_history(C, D)
+        self.assertIsNone(player.state_key())
+        player.update_history(D, C)
+        player.update_history(C, C)
+        self.assertEqual(player.state_key(), ((D, C), (C, C)))
+
+        player = axl.Cooperator()
+        self.assertEqual(player.state_key(), ())
+
     def test_equality(self):
         """Test the equality method for some bespoke cases"""
         # Check repr
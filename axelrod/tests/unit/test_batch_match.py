@@ -0,0 +1,218 @@
+"""Tests for the BatchMatch class."""
+
+import unittest
+
+import numpy as np
+
+import axelrod as axl
+from axelrod.batch_match import memory_one_parameters
+from axelrod.strategy_transformers import JossAnnTransformer
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestMemoryOneParameters(unittest.TestCase):
+    def test_memory_one_player(self):
+        player = axl.MemoryOnePlayer((0.1, 0.2, 0.3, 0.4), initial=D)
+        four_vector, initial = memory_one_parameters(player)
+        np.testing.assert_array_equal(four_vector, [0.1, 0.2, 0.3, 0.4])
+        self.assertEqual(initial, D)
+
+    def test_known_deterministic_players(self):
+        expected = [
+            (axl.Cooperator(), [1, 1, 1, 1], C),
+            (axl.Defector(), [0, 0, 0, 0], D),
+            (axl.TitForTat(), [1, 0, 1, 0], C),
+            (axl.WinStayLoseShift(), [1, 0, 0, 1], C),
+        ]
+        for player, expected_vector, expected_initial in expected:
+            four_vector, initial = memory_one_parameters(player)
+            np.testing.assert_array_equal(four_vector, expected_vector)
+            self.assertEqual(initial, expected_initial)
+
+    def test_game_dependent_players(self):
+        player = axl.GTFT()
+        player.set_match_attributes(game=axl.Game())
+        four_vector, initial = memory_one_parameters(player)
+        np.testing.assert_allclose(four_vector, [1, 1 / 3, 1, 1 / 3])
+        self.assertEqual(initial, C)
+
+    def test_reactive_player(self):
+        player = axl.ReactivePlayer((0.8, 0.2))
+        four_vector, _ = memory_one_parameters(player)
+        np.testing.assert_array_equal(four_vector, [0.8, 0.2, 0.8, 0.2])
+
+    def test_not_memory_one(self):
+        for player in [
+            axl.Grudger(),
+            axl.TitFor2Tats(),
+            JossAnnTransformer((0.1, 0.1))(axl.TitForTat)(),
+        ]:
+            with self.assertRaises(TypeError):
+                memory_one_parameters(player)
+
+
+class TestBatchMatch(unittest.TestCase):
+    def test_init(self):
+        pairs = [(axl.TitForTat(), axl.Defector())]
+        batch = axl.BatchMatch(pairs, turns=5, repetitions=3)
+        self.assertEqual(batch.turns, 5)
+        self.assertEqual(batch.prob_end, 0)
+        self.assertEqual(batch.noise, 0)
+        self.assertEqual(batch.repetitions, 3)
+        self.assertEqual(batch.game.RPST(), (3, 1, 0, 5))
+        self.assertIsNone(batch.result)
+
+    def test_default_turns(self):
+        batch = axl.BatchMatch([(axl.TitForTat(), axl.Defector())])
+        self.assertEqual(batch.turns, axl.DEFAULT_TURNS)
+        batch.play()
+        self.assertEqual(batch.result.shape, (1, 1, axl.DEFAULT_TURNS, 2))
+
+    def test_infinite_turns(self):
+        with self.assertRaises(ValueError):
+            axl.BatchMatch(
+                [(axl.TitForTat(), axl.Defector())], turns=float("inf")
+            )
+
+    def test_deterministic_players_agree_with_match(self):
+        players = [
+            axl.Cooperator(),
+            axl.Defector(),
+            axl.TitForTat(),
+            axl.WinStayLoseShift(),
+            axl.WinShiftLoseStay(),
+            axl.GTFT(p=0),
+        ]
+        pairs = [(p1, p2) for p1 in players for p2 in players]
+        batch = axl.BatchMatch(pairs, turns=20, repetitions=2)
+        batch.play()
+        final_scores = batch.final_score()
+        for index, (p1, p2) in enumerate(pairs):
+            match = axl.Match((p1.clone(), p2.clone()), turns=20)
+            match.play()
+            for repetition in range(2):
+                self.assertEqual(
+                    batch.interactions(index, repetition), match.result
+                )
+                self.assertEqual(
+                    tuple(final_scores[index, repetition]),
+                    match.final_score(),
+                )
+
+    def test_seed_reproducibility(self):
+        pairs = [(axl.GTFT(), axl.MemoryOnePlayer((0.5, 0.5, 0.5, 0.5)))]
+        results = []
+        for _ in range(2):
+            batch = axl.BatchMatch(
+                pairs, turns=50, noise=0.1, repetitions=10, seed=5
+            )
+            results.append(batch.play())
+        np.testing.assert_array_equal(results[0], results[1])
+
+        batch = axl.BatchMatch(
+            pairs, turns=50, noise=0.1, repetitions=10, seed=6
+        )
+        self.assertFalse(np.array_equal(results[0], batch.play()))
+
+    def test_noise_flips_deterministic_play(self):
+        pairs = [(axl.Cooperator(), axl.Cooperator())]
+        batch = axl.BatchMatch(pairs, turns=100, noise=1, repetitions=2)
+        batch.play()
+        np.testing.assert_array_equal(batch.cooperation(), [[[0, 0], [0, 0]]])
+
+    def test_agrees_with_match_in_distribution(self):
+        pairs = [
+            (axl.WinStayLoseShift(), axl.TitForTat()),
+            (axl.GTFT(), axl.ZDExtort2()),
+            (
+                axl.MemoryOnePlayer((0.9, 0.1, 0.5, 0.3)),
+                axl.ReactivePlayer((0.8, 0.2)),
+            ),
+        ]
+        batch = axl.BatchMatch(
+            pairs, turns=100, noise=0.05, repetitions=2000, seed=0
+        )
+        batch.play()
+        batch_scores = batch.final_score_per_turn().mean(axis=1)
+        for index, pair in enumerate(pairs):
+            scores = []
+            for seed in range(200):
+                match = axl.Match(pair, turns=100, noise=0.05, seed=seed)
+                match.play()
+                scores.append(match.final_score_per_turn())
+            np.testing.assert_allclose(
+                batch_scores[index], np.mean(scores, axis=0), atol=0.05
+            )
+
+    def test_prob_end(self):
+        pairs = [(axl.TitForTat(), axl.Defector())]
+        batch = axl.BatchMatch(pairs, prob_end=0.5, repetitions=500, seed=1)
+        self.assertEqual(batch.turns, float("inf"))
+        batch.play()
+        self.assertEqual(batch.lengths.shape, (1, 500))
+        self.assertAlmostEqual(batch.lengths.mean(), 2, delta=0.2)
+        self.assertEqual(batch.result.shape[2], batch.lengths.max())
+
+        # Scores only count the turns of each match.
+        for repetition, length in enumerate(batch.lengths[0]):
+            interactions = batch.interactions(0, repetition)
+            self.assertEqual(len(interactions), length)
+            self.assertEqual(
+                tuple(batch.final_score()[0, repetition]),
+                axl.interaction_utils.compute_final_score(interactions)
+                or (0, 0),
+            )
+            self.assertEqual(
+                tuple(batch.cooperation()[0, repetition]),
+                (1 if length else 0, 0),
+            )
+
+    def test_prob_end_and_turns(self):
+        pairs = [(axl.TitForTat(), axl.Defector())]
+        batch = axl.BatchMatch(
+            pairs, turns=3, prob_end=0.1, repetitions=100, seed=1
+        )
+        batch.play()
+        self.assertLessEqual(batch.lengths.max(), 3)
+
+    def test_prob_end_one(self):
+        pairs = [(axl.TitForTat(), axl.Defector())]
+        batch = axl.BatchMatch(pairs, prob_end=1, repetitions=5)
+        batch.play()
+        np.testing.assert_array_equal(batch.lengths, [[1] * 5])
+
+    def test_summary_methods(self):
+        pairs = [(axl.TitForTat(), axl.WinStayLoseShift())]
+        batch = axl.BatchMatch(pairs, turns=4)
+        batch.play()
+        match = axl.Match((axl.TitForTat(), axl.WinStayLoseShift()), turns=4)
+        match.play()
+        self.assertEqual(
+            tuple(batch.final_score_per_turn()[0, 0]),
+            match.final_score_per_turn(),
+        )
+        self.assertEqual(tuple(batch.cooperation()[0, 0]), match.cooperation())
+        self.assertEqual(
+            tuple(batch.normalised_cooperation()[0, 0]),
+            match.normalised_cooperation(),
+        )
+        distribution = match.state_distribution()
+        self.assertEqual(
+            list(batch.state_distribution()[0, 0]),
+            [distribution[state] for state in [(C, C), (C, D), (D, C), (D, D)]],
+        )
+
+    def test_game(self):
+        game = axl.Game(r=4, s=0, t=6, p=2)
+        pairs = [(axl.Cooperator(), axl.Defector())]
+        batch = axl.BatchMatch(pairs, turns=3, game=game)
+        batch.play()
+        np.testing.assert_array_equal(batch.final_score(), [[[0, 18]]])
+
+    def test_zero_length_matches(self):
+        pairs = [(axl.TitForTat(), axl.Defector())]
+        batch = axl.BatchMatch(pairs, turns=0, repetitions=2)
+        result = batch.play()
+        self.assertEqual(result.shape, (1, 2, 0, 2))
+        self.assertEqual(batch.interactions(0, 1), [])
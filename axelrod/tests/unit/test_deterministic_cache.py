@@ -111,3 +111,157 @@ class TestDeterministicCache(unittest.TestCase):
         self.assertTrue(self.test_key in self.cache)
         del self.cache[self.test_key]
         self.assertFalse(self.test_key in self.cache)
+
+
+class TestPersistentDeterministicCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_key = (axl.TitForTat(), axl.Defector())
+        cls.test_value = [(C, D), (D, D), (D, D)]
+        path = pathlib.Path("test_outputs/test_persistent_cache.sqlite")
+        cls.test_file = str(axl_filename(path))
+        load_path = pathlib.Path("test_outputs/test_persistent_cache_load.txt")
+        cls.test_load_file = axl_filename(load_path)
+        with open(cls.test_load_file, "wb") as f:
+            pickle.dump({("Tit For Tat", "Defector"): cls.test_value}, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.test_load_file)
+
+    def setUp(self):
+        self.cache = axl.PersistentDeterministicCache(self.test_file)
+
+    def tearDown(self):
+        self.cache.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.test_file + suffix):
+                os.remove(self.test_file + suffix)
+
+    def test_basic_init(self):
+        self.assertTrue(self.cache.mutable)
+        self.assertEqual(len(self.cache), 0)
+        self.assertFalse(self.test_key in self.cache)
+
+    def test_setitem(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertEqual(list(self.cache), [("Tit For Tat", "Defector")])
+        self.assertEqual(len(self.cache), 1)
+
+    def test_getitem_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.cache[self.test_key]
+
+    def test_setitem_invalid_key_stochastic_player(self):
+        invalid_key = (axl.Random(), axl.TitForTat())
+        with self.assertRaises(ValueError):
+            self.cache[invalid_key] = self.test_value
+
+    def test_setitem_invalid_value_not_list(self):
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = 5
+
+    def test_entries_are_persisted(self):
+        self.cache[self.test_key] = self.test_value
+        cache = axl.PersistentDeterministicCache(self.test_file)
+        self.assertEqual(cache[self.test_key], self.test_value)
+        cache.close()
+
+    def test_entries_are_only_replaced_by_longer_entries(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache[self.test_key] = self.test_value[:2]
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+        longer_value = self.test_value + [(D, C)] * 7
+        self.cache[self.test_key] = longer_value
+        self.assertEqual(self.cache[self.test_key], longer_value)
+
+    def test_entries_read_are_bounded(self):
+        self.cache.max_entries = 2
+        keys = [(axl.Cycler("C" * n + "D"), axl.Defector()) for n in range(4)]
+        for key in keys:
+            self.cache[key] = self.test_value
+        for key in keys:
+            self.assertEqual(self.cache[key], self.test_value)
+            self.assertLessEqual(len(self.cache._entries), 2)
+        self.assertIn(keys[0], self.cache)
+        self.assertEqual(len(self.cache._entries), 2)
+
+    def test_immutable_cache(self):
+        self.cache[self.test_key] = self.test_value
+        cache = axl.PersistentDeterministicCache(self.test_file, mutable=False)
+        self.assertEqual(cache[self.test_key], self.test_value)
+        with self.assertRaises(ValueError):
+            cache[self.test_key] = self.test_value
+        with self.assertRaises(ValueError):
+            del cache[self.test_key]
+        cache.close()
+
+    def test_pickle(self):
+        self.cache[self.test_key] = self.test_value
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache.file_name, self.test_file)
+        self.assertEqual(cache[self.test_key], self.test_value)
+        cache.close()
+
+    def test_del_item(self):
+        self.cache[self.test_key] = self.test_value
+        del self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        with self.assertRaises(KeyError):
+            del self.cache[self.test_key]
+
+    def test_load(self):
+        self.cache.load(self.test_load_file)
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_load_with_immutable_cache(self):
+        cache = axl.PersistentDeterministicCache(self.test_file, mutable=False)
+        with self.assertRaises(ValueError):
+            cache.load(self.test_load_file)
+        cache.close()
+
+    def test_key_distinguishes_players_of_the_same_strategy(self):
+        key = (axl.Cycler("CCD"), axl.Defector())
+        self.cache[key] = self.test_value
+        self.assertIn(key, self.cache)
+        self.assertNotIn((axl.Cycler("CD"), axl.Defector()), self.cache)
+
+    def test_tournament_with_players_of_the_same_strategy(self):
+        """Players of the same strategy with different parameters share a
+        name but not cache entries."""
+        expected = [[3, 0.8, 3], [1.8, 1, 5], [3, 0, 3]]
+        for cache in (self.cache, axl.DeterministicCache()):
+            players = [
+                axl.MemoryOnePlayer((1, 0, 1, 0)),
+                axl.MemoryOnePlayer((0, 0, 0, 0), D),
+                axl.Cooperator(),
+            ]
+            tournament = axl.Tournament(
+                players, turns=5, repetitions=1, deterministic_cache=cache
+            )
+            results = tournament.play(progress_bar=False)
+            self.assertEqual(results.payoff_matrix, expected)
+
+    def test_key_includes_used_match_attributes(self):
+        player = axl.BackStabber()
+        key = (player, axl.Defector())
+        player.set_match_attributes(length=3)
+        self.cache[key] = self.test_value
+        self.assertIn(key, self.cache)
+
+        player.set_match_attributes(length=4)
+        self.assertNotIn(key, self.cache)
+
+    def test_match_uses_cached_prefix(self):
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, turns=10, deterministic_cache=self.cache)
+        expected = match.play()
+
+        cache = axl.PersistentDeterministicCache(self.test_file, mutable=False)
+        self.assertEqual(cache[players], expected)
+        cache[players][0] = (D, D)
+        match = axl.Match(players, turns=5, deterministic_cache=cache)
+        self.assertEqual(match.play(), [(D, D)] + expected[1:5])
+        cache.close()
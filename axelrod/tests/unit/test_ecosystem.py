@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 import axelrod as axl
 
 
@@ -45,7 +47,7 @@ class TestEcosystem(unittest.TestCase):
         self.assertEqual(len(pops), 1)
         self.assertEqual(len(pops[0]), 4)
         self.assertAlmostEqual(sum(pops[0]), 1.0)
-        self.assertEqual(pops[0], [0.7, 0.25, 0.03, 0.02])
+        self.assertEqual(pops[0].tolist(), [0.7, 0.25, 0.03, 0.02])
 
     def test_population_normalization(self):
         eco = axl.Ecosystem(self.res_cooperators, population=[70, 25, 3, 2])
@@ -54,7 +56,7 @@ class TestEcosystem(unittest.TestCase):
         self.assertEqual(len(pops), 1)
         self.assertEqual(len(pops[0]), 4)
         self.assertAlmostEqual(sum(pops[0]), 1.0)
-        self.assertEqual(pops[0], [0.7, 0.25, 0.03, 0.02])
+        self.assertEqual(pops[0].tolist(), [0.7, 0.25, 0.03, 0.02])
 
     def test_results_and_population_of_different_sizes(self):
         self.assertRaises(
@@ -100,3 +102,95 @@ class TestEcosystem(unittest.TestCase):
         self.assertAlmostEqual(last[1], 0.0)
         self.assertAlmostEqual(last[2], 0.0)
         self.assertAlmostEqual(last[3], 1.0)
+
+    def test_population_sizes_array(self):
+        eco = axl.Ecosystem(self.res_defector_wins)
+        eco.reproduce(10)
+        eco.reproduce(5)
+        self.assertIsInstance(eco.population_sizes, np.ndarray)
+        self.assertEqual(eco.population_sizes.shape, (16, 4))
+        np.testing.assert_allclose(eco.population_sizes.sum(axis=1), 1)
+
+    def test_seed_reproducibility(self):
+        results = axl.Tournament(
+            players=[axl.TitForTat(), axl.Random(), axl.Defector()],
+            turns=10,
+            repetitions=5,
+            seed=0,
+        ).play(progress_bar=False)
+        populations = []
+        for seed in (1, 1, 2):
+            eco = axl.Ecosystem(results, seed=seed)
+            eco.reproduce(20)
+            populations.append(eco.population_sizes)
+        np.testing.assert_array_equal(populations[0], populations[1])
+        self.assertFalse(np.array_equal(populations[0], populations[2]))
+
+    def test_replicator_dynamics_cooperators_are_stationary(self):
+        eco = axl.Ecosystem(self.res_cooperators)
+        solution = eco.replicator_dynamics(10)
+        self.assertEqual(solution.convergence_times, 0)
+        np.testing.assert_allclose(solution.stationary_points, [0.25] * 4)
+        np.testing.assert_allclose(solution.populations, 0.25)
+        # No integration steps are taken.
+        self.assertEqual(len(solution.times), 1)
+        self.assertEqual(solution.populations.shape, (1, 4))
+
+        populations = [[1, 1, 1, 1], [1, 0, 0, 0]]
+        solution = eco.replicator_dynamics(10, populations=populations)
+        self.assertEqual(len(solution.times), 1)
+        np.testing.assert_array_equal(solution.convergence_times, [0, 0])
+        np.testing.assert_allclose(
+            solution.stationary_points, [[0.25] * 4, [1, 0, 0, 0]]
+        )
+
+    def test_replicator_dynamics_defector_wins(self):
+        eco = axl.Ecosystem(self.res_defector_wins)
+        solution = eco.replicator_dynamics(1000, tolerance=1e-6)
+        self.assertEqual(solution.times[0], 0)
+        self.assertEqual(solution.populations.shape, (len(solution.times), 4))
+        np.testing.assert_allclose(solution.populations[0], [0.25] * 4)
+        np.testing.assert_allclose(solution.populations.sum(axis=1), 1)
+        self.assertLess(solution.convergence_times, 1000)
+        self.assertEqual(solution.times[-1], solution.convergence_times)
+        np.testing.assert_allclose(
+            solution.stationary_points, [0, 0, 0, 1], atol=1e-5
+        )
+
+    def test_replicator_dynamics_does_not_converge(self):
+        eco = axl.Ecosystem(self.res_defector_wins)
+        solution = eco.replicator_dynamics(1, tolerance=1e-6)
+        self.assertEqual(solution.convergence_times, np.inf)
+        self.assertTrue(np.isnan(solution.stationary_points).all())
+        self.assertEqual(solution.times[-1], 1)
+
+    def test_replicator_dynamics_batch(self):
+        eco = axl.Ecosystem(self.res_defector_wins)
+        populations = [[1, 1, 1, 1], [0, 0, 1, 1], [1, 1, 1, 0]]
+        solution = eco.replicator_dynamics(1000, populations=populations)
+        self.assertEqual(
+            solution.populations.shape, (len(solution.times), 3, 4)
+        )
+        np.testing.assert_allclose(
+            solution.populations[0],
+            [[0.25] * 4, [0, 0, 0.5, 0.5], [1 / 3, 1 / 3, 1 / 3, 0]],
+        )
+        np.testing.assert_allclose(
+            solution.stationary_points,
+            [[0, 0, 0, 1], [0, 0, 0, 1], [1 / 3, 1 / 3, 1 / 3, 0]],
+            atol=1e-5,
+        )
+        self.assertEqual(solution.convergence_times[2], 0)
+        single = eco.replicator_dynamics(1000, populations=populations[0])
+        self.assertAlmostEqual(
+            single.convergence_times, solution.convergence_times[0], delta=1
+        )
+
+    def test_replicator_dynamics_invalid_populations(self):
+        eco = axl.Ecosystem(self.res_cooperators)
+        self.assertRaises(
+            TypeError, eco.replicator_dynamics, 10, populations=[1, 1, 1]
+        )
+        self.assertRaises(
+            TypeError, eco.replicator_dynamics, 10, populations=[1, -1, 1, 1]
+        )
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import matplotlib.pyplot
 import numpy as np
+import pandas as pd
 from hypothesis import given, settings
 
 import axelrod as axl
@@ -126,12 +127,22 @@ class TestFingerprint(unittest.TestCase):
         )  # x + y > 1
 
     def test_fingerprint_interactions_cooperator(self):
+        path = pathlib.Path("test_outputs/test_fingerprint.csv")
+        filename = axl_filename(path)
         af = AshlockFingerprint(axl.Cooperator())
-        af.fingerprint(turns=5, repetitions=3, step=0.5, progress_bar=False)
+        af.fingerprint(
+            turns=5,
+            repetitions=3,
+            step=0.5,
+            progress_bar=False,
+            filename=filename,
+        )
+        with self.assertWarns(DeprecationWarning):
+            interactions = af.interactions
 
         # The keys are edges between players, values are repetitions.
         self.assertCountEqual(
-            af.interactions.keys(),
+            interactions.keys(),
             [
                 (0, 1),
                 (0, 2),
@@ -144,10 +155,10 @@ class TestFingerprint(unittest.TestCase):
                 (0, 9),
             ],
         )
-        self.assertEqual(len(af.interactions.values()), 9)
+        self.assertEqual(len(interactions.values()), 9)
 
         # Each edge has 3 repetitions with 5 turns each.
-        repetitions = af.interactions.values()
+        repetitions = interactions.values()
         self.assertTrue(all(len(rep) == 3 for rep in repetitions))
         for iturn in range(3):
             self.assertTrue(all(len(rep[iturn]) == 5 for rep in repetitions))
@@ -158,7 +169,7 @@ class TestFingerprint(unittest.TestCase):
         # Player 4 is Point(0.5, 0.0).
         # Player 7 is Point(1.0, 0.0).
         for iplayer in (1, 4, 7):
-            for turns in af.interactions[(0, iplayer)]:
+            for turns in interactions[(0, iplayer)]:
                 self.assertEqual(len(turns), 5)
                 self.assertTrue(all(t == (C, C) for t in turns))
         self.assertEqual(af.data[Point(0.0, 0.0)], 3.0)
@@ -167,14 +178,24 @@ class TestFingerprint(unittest.TestCase):
 
         # Player 3 is Point(0.0, 1.0), which means constant defection
         # from the probe. But the Cooperator doesn't change and score is zero.
-        for turns in af.interactions[(0, 3)]:
+        for turns in interactions[(0, 3)]:
             self.assertEqual(len(turns), 5)
             self.assertTrue(all(t == (C, D) for t in turns))
         self.assertEqual(af.data[Point(0.0, 1.0)], 0.0)
 
     def test_fingerprint_interactions_titfortat(self):
+        path = pathlib.Path("test_outputs/test_fingerprint.csv")
+        filename = axl_filename(path)
         af = AshlockFingerprint(axl.TitForTat())
-        af.fingerprint(turns=5, repetitions=3, step=0.5, progress_bar=False)
+        af.fingerprint(
+            turns=5,
+            repetitions=3,
+            step=0.5,
+            progress_bar=False,
+            filename=filename,
+        )
+        with self.assertWarns(DeprecationWarning):
+            interactions = af.interactions
 
         # Tit-for-Tats will always cooperate if left to their own devices,
         # so interactions are invariant for any points where y is zero,
@@ -183,7 +204,7 @@ class TestFingerprint(unittest.TestCase):
         # Player 4 is Point(0.5, 0.0).
         # Player 7 is Point(1.0, 0.0).
         for iplayer in (1, 4, 7):
-            for turns in af.interactions[(0, iplayer)]:
+            for turns in interactions[(0, iplayer)]:
                 self.assertEqual(len(turns), 5)
                 self.assertTrue(all(t == (C, C) for t in turns))
         self.assertEqual(af.data[Point(0.0, 0.0)], 3.0)
@@ -193,11 +214,18 @@ class TestFingerprint(unittest.TestCase):
         # Player 3 is Point(0.0, 1.0) which implies defection after the
         # first turn since Tit-for-Tat is playing, and a score of 0.8
         # since we get zero on first turn and one point per turn later.
-        for turns in af.interactions[(0, 3)]:
+        for turns in interactions[(0, 3)]:
             self.assertEqual(len(turns), 5)
             self.assertTrue(all(t == (D, D) for t in turns[1:]))
         self.assertAlmostEqual(af.data[Point(0.0, 1.0)], 0.8)
 
+    def test_interactions_without_filename(self):
+        af = AshlockFingerprint(axl.Cooperator())
+        af.fingerprint(turns=5, repetitions=3, step=0.5, progress_bar=False)
+        with self.assertWarns(DeprecationWarning):
+            with self.assertRaises(AttributeError):
+                af.interactions
+
     def test_progress_bar_fingerprint(self):
         af = AshlockFingerprint(axl.TitForTat)
         data = af.fingerprint(
@@ -205,26 +233,31 @@ class TestFingerprint(unittest.TestCase):
         )
         self.assertEqual(sorted(data.keys()), self.points_when_using_half_step)
 
-    @patch("axelrod.fingerprint.mkstemp", RecordedMksTemp.mkstemp)
-    def test_temp_file_creation(self):
-
+    @patch("axelrod.tournament.mkstemp", RecordedMksTemp.mkstemp)
+    def test_no_temp_file_creation(self):
         RecordedMksTemp.reset_record()
         af = AshlockFingerprint(axl.TitForTat)
-        path = pathlib.Path("test_outputs/test_fingerprint.csv")
-        filename = axl_filename(path)
-
-        self.assertEqual(RecordedMksTemp.record, [])
-
-        # Temp file is created and destroyed.
         af.fingerprint(
             turns=1, repetitions=1, step=0.5, progress_bar=False, filename=None
         )
+        self.assertEqual(RecordedMksTemp.record, [])
 
-        self.assertEqual(len(RecordedMksTemp.record), 1)
-        filename = RecordedMksTemp.record[0][1]
-        self.assertIsInstance(filename, str)
-        self.assertNotEqual(filename, "")
-        self.assertFalse(os.path.isfile(filename))
+    def test_fingerprint_with_filename_agrees(self):
+        path = pathlib.Path("test_outputs/test_fingerprint.csv")
+        filename = axl_filename(path)
+        af = AshlockFingerprint(axl.WinStayLoseShift)
+        data = af.fingerprint(
+            turns=10,
+            repetitions=2,
+            step=0.5,
+            progress_bar=False,
+            filename=filename,
+            seed=1,
+        )
+        self.assertEqual(
+            data,
+            af.fingerprint(turns=10, repetitions=2, step=0.5, seed=1),
+        )
 
     def test_fingerprint_with_filename(self):
         path = pathlib.Path("test_outputs/test_fingerprint.csv")
@@ -240,16 +273,30 @@ class TestFingerprint(unittest.TestCase):
         with open(filename, "r") as out:
             data = out.read()
             self.assertEqual(len(data.split("\n")), 20)
+        # The file only holds the interactions.
+        self.assertEqual(
+            list(pd.read_csv(filename).columns),
+            [
+                "Interaction index",
+                "Player index",
+                "Opponent index",
+                "Repetition",
+                "Player name",
+                "Opponent name",
+                "Actions",
+            ],
+        )
 
     def test_serial_fingerprint(self):
         af = AshlockFingerprint(axl.TitForTat)
         data = af.fingerprint(
             turns=10, repetitions=2, step=0.5, progress_bar=False
         )
-        edge_keys = sorted(list(af.interactions.keys()))
         coord_keys = sorted(list(data.keys()))
         self.assertEqual(af.step, 0.5)
-        self.assertEqual(edge_keys, self.edges_when_using_half_step)
+        self.assertEqual(
+            af.spatial_tournament.edges, self.edges_when_using_half_step
+        )
         self.assertEqual(coord_keys, self.points_when_using_half_step)
 
     def test_parallel_fingerprint(self):
@@ -257,10 +304,11 @@ class TestFingerprint(unittest.TestCase):
         af.fingerprint(
             turns=10, repetitions=2, step=0.5, processes=2, progress_bar=False
         )
-        edge_keys = sorted(list(af.interactions.keys()))
         coord_keys = sorted(list(af.data.keys()))
         self.assertEqual(af.step, 0.5)
-        self.assertEqual(edge_keys, self.edges_when_using_half_step)
+        self.assertEqual(
+            af.spatial_tournament.edges, self.edges_when_using_half_step
+        )
         self.assertEqual(coord_keys, self.points_when_using_half_step)
 
     def test_plot_data(self):
@@ -459,6 +507,60 @@ class TestFingerprint(unittest.TestCase):
         self.assertEqual(data, data2)
 
 
+class TestExactFingerprint(unittest.TestCase):
+    def test_cooperator(self):
+        af = AshlockFingerprint(axl.Cooperator, axl.TitForTat)
+        data = af.fingerprint(
+            turns=10, step=0.25, progress_bar=False, exact=True
+        )
+        self.assertEqual(len(data), 25)
+        # Against a cooperator, the probe (or its dual above the diagonal)
+        # cooperates with probability 1 - y.
+        for (x, y), score in data.items():
+            self.assertAlmostEqual(score, 3 - 3 * y)
+
+    def test_deterministic_corners_agree_with_tournament(self):
+        for strategy in (axl.Fortress3(), axl.EvolvedLookerUp2_2_2()):
+            exact = AshlockFingerprint(strategy).fingerprint(
+                turns=20, step=1, progress_bar=False, exact=True
+            )
+            sampled = AshlockFingerprint(strategy).fingerprint(
+                turns=20, repetitions=1, step=1, progress_bar=False
+            )
+            for point, score in exact.items():
+                self.assertAlmostEqual(score, sampled[point])
+
+    def test_agrees_with_tournament(self):
+        for strategy, probe in (
+            (axl.GTFT, axl.TitForTat),
+            (axl.PSOGambler1_1_1, axl.WinStayLoseShift),
+        ):
+            exact = AshlockFingerprint(strategy, probe).fingerprint(
+                turns=10, step=0.5, progress_bar=False, exact=True
+            )
+            sampled = AshlockFingerprint(strategy, probe).fingerprint(
+                turns=10,
+                repetitions=500,
+                step=0.5,
+                progress_bar=False,
+                seed=1,
+            )
+            for point, score in exact.items():
+                self.assertAlmostEqual(score, sampled[point], delta=0.15)
+
+    def test_plot(self):
+        af = AshlockFingerprint(axl.WinStayLoseShift, axl.TitForTat)
+        af.fingerprint(turns=10, step=0.1, progress_bar=False, exact=True)
+        self.assertEqual(len(af.data), 121)
+        p = af.plot()
+        self.assertIsInstance(p, matplotlib.pyplot.Figure)
+
+    def test_not_finite_state(self):
+        af = AshlockFingerprint(axl.Grudger, axl.TitForTat)
+        with self.assertRaises(TypeError):
+            af.fingerprint(turns=10, step=0.5, progress_bar=False, exact=True)
+
+
 class TestTransitiveFingerprint(unittest.TestCase):
     def test_init(self):
         player = axl.TitForTat()
@@ -550,6 +652,35 @@ class TestTransitiveFingerprint(unittest.TestCase):
         )
         self.assertTrue(np.array_equal(data, expected_data))
 
+    def test_fingerprint_agrees_with_file_analysis(self):
+        opponents = [axl.Random(p) for p in np.linspace(0, 1, 5)]
+        tf = TransitiveFingerprint(axl.TitForTat(), opponents=opponents)
+        data = tf.fingerprint(
+            turns=10, repetitions=4, progress_bar=False, seed=1
+        )
+        self.assertEqual(data.shape, (5, 10))
+
+        for file_format in ("csv", "npz"):
+            file_descriptor, filename = mkstemp()
+            tournament = axl.Tournament(
+                players=[axl.TitForTat()] + opponents,
+                edges=[(0, k + 1) for k in range(5)],
+                turns=10,
+                repetitions=4,
+                seed=1,
+            )
+            tournament.play(
+                build_results=False,
+                filename=filename,
+                file_format=file_format,
+                progress_bar=False,
+            )
+            np.testing.assert_array_equal(
+                tf.analyse_cooperation_ratio(filename), data
+            )
+            os.close(file_descriptor)
+            os.remove(filename)
+
     def test_plot(self):
         """
         Test that plot is created with various arguments.
@@ -341,3 +341,55 @@ class TestAttachedComplete(unittest.TestCase):
             ],
         )
         self.assertEqual(g.directed, False)
+
+
+class TestLattice(unittest.TestCase):
+    def test_periodic(self):
+        g = axl.graph.lattice(3, 3)
+        self.assertEqual(sorted(g.vertices), list(range(9)))
+        self.assertEqual(len(g.edges), 36)
+        self.assertEqual(sorted(g.out_vertices(0)), [1, 2, 3, 6])
+        self.assertEqual(sorted(g.out_vertices(4)), [1, 3, 5, 7])
+
+    def test_not_periodic(self):
+        g = axl.graph.lattice(3, 2, periodic=False)
+        self.assertEqual(len(g.edges), 14)
+        self.assertEqual(sorted(g.out_vertices(0)), [1, 3])
+        self.assertEqual(sorted(g.out_vertices(4)), [1, 3, 5])
+
+    def test_with_loops(self):
+        g = axl.graph.lattice(3, 3, loops=True)
+        self.assertEqual(len(g.edges), 45)
+        self.assertEqual(sorted(g.out_vertices(0)), [0, 1, 2, 3, 6])
+
+    def test_directed(self):
+        g = axl.graph.lattice(3, 3, directed=True)
+        self.assertEqual(len(g.edges), 18)
+        self.assertEqual(sorted(g.out_vertices(0)), [1, 3])
+
+
+class TestCSR(unittest.TestCase):
+    def test_undirected(self):
+        g = axl.graph.cycle(4)
+        indptr, indices = g.to_csr()
+        self.assertEqual(list(indptr), [0, 2, 4, 6, 8])
+        self.assertEqual(list(indices), [1, 3, 0, 2, 1, 3, 0, 2])
+
+    def test_directed(self):
+        g = axl.graph.Graph([(0, 1), (2, 0), (1, 2), (0, 2)], directed=True)
+        indptr, indices = g.to_csr()
+        self.assertEqual(list(indptr), [0, 2, 3, 4])
+        self.assertEqual(list(indices), [1, 2, 2, 0])
+
+    def test_vertex_order(self):
+        g = axl.graph.attached_complete_graphs(2, loops=False)
+        vertices = ["1:1", "1:0", "0:1", "0:0"]
+        indptr, indices = g.to_csr(vertices)
+        self.assertEqual(list(indptr), [0, 1, 3, 4, 6])
+        self.assertEqual(list(indices), [1, 0, 3, 3, 1, 2])
+
+    def test_vertex_without_out_edges(self):
+        g = axl.graph.Graph([(0, 1)], directed=True)
+        indptr, indices = g.to_csr([0, 1])
+        self.assertEqual(list(indptr), [0, 1, 1])
+        self.assertEqual(list(indices), [1])
@@ -1,8 +1,16 @@
 import unittest
 from collections import Counter
 
+import numpy as np
+
 import axelrod as axl
-from axelrod.history import History, LimitedHistory
+from axelrod.history import (
+    ActionArray,
+    ArrayHistory,
+    History,
+    LimitedArrayHistory,
+    LimitedHistory,
+)
 
 C, D = axl.Action.C, axl.Action.D
 
@@ -64,6 +72,20 @@ class TestHistory(unittest.TestCase):
         self.assertEqual(h3.cooperations, 2)
         self.assertEqual(h3.defections, 2)
 
+    def test_repeat_cycle(self):
+        h = History([C, D, C, D, D], [C, C, D, D, C])
+        h.repeat_cycle(2, 10)
+        expected = History(
+            [C, D, C, D, D, D, D, D, D, D], [C, C, D, D, C, D, C, D, C, D]
+        )
+        self.assertEqual(h, expected)
+        self.assertEqual(h.cooperations, expected.cooperations)
+        self.assertEqual(h.state_distribution, expected.state_distribution)
+
+        h = History([C, D, D], [D, D, C])
+        h.repeat_cycle(3, 3)
+        self.assertEqual(h, History([C, D, D], [D, D, C]))
+
     def test_flip_plays(self):
         player = axl.Alternator()
         opponent = axl.Cooperator()
@@ -123,3 +145,182 @@ class TestLimitedHistory(unittest.TestCase):
             h.state_distribution,
             Counter({(D, D): 1, (C, D): 1, (D, C): 1, (C, C): 0}),
         )
+
+
+class TestActionArray(unittest.TestCase):
+    def test_sequence(self):
+        actions = ArrayHistory([D, C, C], [C, D, D]).coplays
+        self.assertIsInstance(actions, ActionArray)
+        self.assertEqual(len(actions), 3)
+        self.assertEqual(actions[0], C)
+        self.assertEqual(actions[-1], D)
+        self.assertEqual(actions[1:], [D, D])
+        self.assertEqual(list(actions), [C, D, D])
+        self.assertEqual(actions.count(D), 2)
+        self.assertIn(C, actions)
+        self.assertEqual(actions, [C, D, D])
+        with self.assertRaises(IndexError):
+            actions[3]
+        self.assertEqual(repr(actions), "[C, D, D]")
+        np.testing.assert_array_equal(actions.values, [0, 1, 1])
+
+    def test_follows_history(self):
+        h = ArrayHistory(length=1)
+        coplays = h.coplays
+        h.extend([C, D, D], [D, C, D])
+        self.assertIs(h.coplays, coplays)
+        self.assertEqual(coplays, [D, C, D])
+        self.assertEqual(coplays[::-1], [D, C, D])
+        self.assertEqual(coplays[::2], [D, D])
+        self.assertEqual(h[::-2], [D, C])
+        self.assertEqual(h[1:100], [D, D])
+        with self.assertRaises(IndexError):
+            h[3]
+        # Long slices are converted to actions by indexing an array.
+        h.extend([C, D] * 50, [D, D] * 50)
+        self.assertEqual(h[3:], [C, D] * 50)
+        self.assertEqual(coplays[-100:], [D] * 100)
+
+
+class TestArrayHistory(unittest.TestCase):
+    def test_agrees_with_history(self):
+        plays = [C, D, D, C, C, D, C]
+        coplays = [D, D, C, C, D, C, C]
+        expected = History(plays, coplays)
+        h = ArrayHistory(length=2)
+        for play, coplay in zip(plays, coplays):
+            h.append(play, coplay)
+        for history in (h, ArrayHistory(plays, coplays)):
+            self.assertEqual(history, expected)
+            self.assertEqual(expected, history)
+            self.assertEqual(len(history), 7)
+            self.assertEqual(history[-1], C)
+            self.assertEqual(history[-3:], [C, D, C])
+            self.assertEqual(history.coplays, coplays)
+            self.assertEqual(history.coplays[-1], C)
+            self.assertEqual(history.cooperations, 4)
+            self.assertEqual(history.defections, 3)
+            self.assertEqual(
+                history.state_distribution, expected.state_distribution
+            )
+            self.assertEqual(str(history), "CDDCCDC")
+
+    def test_arrays_are_views(self):
+        h = ArrayHistory([C, D], [D, D], length=10)
+        plays = h.plays_array
+        np.testing.assert_array_equal(plays, [0, 1])
+        np.testing.assert_array_equal(h.coplays_array, [1, 1])
+        self.assertIs(plays.base, h.plays_array.base)
+
+    def test_reserve(self):
+        h = ArrayHistory([C, D], [D, D], length=2)
+        h.reserve(100)
+        self.assertEqual(len(h._play_values), 100)
+        self.assertEqual(h, [C, D])
+        h.reserve(float("inf"))
+        self.assertEqual(len(h._play_values), 100)
+
+    def test_append_without_capacity(self):
+        h = ArrayHistory(length=0)
+        self.assertEqual(len(h._play_values), 0)
+        h.append(C, D)
+        h.append(D, D)
+        self.assertEqual(h, History([C, D], [D, D]))
+        self.assertEqual(h.state_distribution, Counter({(C, D): 1, (D, D): 1}))
+
+    def test_extend_and_repeat_cycle(self):
+        h = ArrayHistory([C, D], [D, D], length=2)
+        h.extend([C, C, D], [C, D, C])
+        h.repeat_cycle(2, 9)
+        expected = History(
+            [C, D, C, C, D, C, D, C, D], [D, D, C, D, C, D, C, D, C]
+        )
+        self.assertEqual(h, expected)
+        self.assertEqual(h.state_distribution, expected.state_distribution)
+
+    def test_reset_copy_and_flip(self):
+        h = ArrayHistory([C, D], [D, D])
+        self.assertEqual(h.copy(), h)
+        flipped = h.flip_plays()
+        self.assertIsInstance(flipped, ArrayHistory)
+        self.assertEqual(flipped, History([D, C], [D, D]))
+        h.reset()
+        self.assertEqual(len(h), 0)
+        self.assertEqual(h.cooperations, 0)
+        self.assertEqual(h.state_distribution, Counter())
+
+    def test_match(self):
+        players = (axl.TitForTat(), axl.Random())
+        match = axl.Match(players, turns=50, noise=0.1, seed=3)
+        expected = match.play()
+        expected_histories = [player.history.copy() for player in players]
+        match = axl.Match(
+            players, turns=50, noise=0.1, seed=3, history_class=ArrayHistory
+        )
+        self.assertEqual(match.play(), expected)
+        for player, history in zip(players, expected_histories):
+            self.assertIsInstance(player.history, ArrayHistory)
+            self.assertEqual(player.history, history)
+            self.assertGreaterEqual(len(player.history._play_values), 50)
+
+
+class TestLimitedArrayHistory(unittest.TestCase):
+    def test_agrees_with_limited_history(self):
+        plays = [C, D, D, C, C, D, C]
+        coplays = [D, D, C, C, D, C, C]
+        expected = LimitedHistory(3)
+        h = LimitedArrayHistory(3)
+        for play, coplay in zip(plays, coplays):
+            expected.append(play, coplay)
+            h.append(play, coplay)
+            self.assertEqual(h, expected)
+            self.assertEqual(len(h), len(expected))
+            self.assertEqual(h.coplays, expected.coplays)
+            self.assertEqual(h[0], expected[0])
+            self.assertEqual(h.coplays[-1], expected.coplays[-1])
+            self.assertEqual(h[-2:], expected[-2:])
+            self.assertEqual(h.cooperations, expected.cooperations)
+            self.assertEqual(h.state_distribution, expected.state_distribution)
+        self.assertEqual(len(h._play_values), 6)
+        np.testing.assert_array_equal(h.plays_array, [0, 1, 0])
+
+    def test_repeat_cycle(self):
+        h = LimitedArrayHistory(3, [C, D, C], [D, D, C])
+        h.repeat_cycle(2, 6)
+        self.assertEqual(h, History([D, C, D], [D, C, D]))
+
+    def test_repeat_cycle_longer_than_memory(self):
+        plays, coplays = [C, C, D, C, D], [D, C, C, D, C]
+        h = LimitedArrayHistory(2, plays, coplays)
+        h.repeat_cycle(3, 11)
+        expected = LimitedArrayHistory(2, plays, coplays)
+        expected.extend(plays[2:] * 2, coplays[2:] * 2)
+        self.assertEqual(h, expected)
+        self.assertEqual(h.coplays, expected.coplays)
+        self.assertEqual(h.state_distribution, expected.state_distribution)
+        self.assertEqual(h._total, 11)
+        h.append(C, C)
+        expected.append(C, C)
+        self.assertEqual(h, expected)
+        with self.assertRaises(ValueError):
+            h.repeat_cycle(3, 13)
+
+        h = LimitedArrayHistory(0)
+        h.repeat_cycle(1, 4)
+        self.assertEqual(len(h), 0)
+
+    def test_reset_copy_and_flip(self):
+        h = LimitedArrayHistory(2, [C, D, D], [D, D, C])
+        self.assertEqual(h.copy(), h)
+        self.assertEqual(h.flip_plays(), History([C, C], [D, C]))
+        h.reset()
+        self.assertEqual(len(h), 0)
+        h.append(C, C)
+        self.assertEqual(h, [C])
+
+    def test_without_memory(self):
+        h = LimitedArrayHistory(0)
+        h.append(C, D)
+        self.assertEqual(len(h), 0)
+        self.assertEqual(h.cooperations, 0)
+        self.assertEqual(h.state_distribution, Counter())
@@ -1,6 +1,10 @@
 import tempfile
 import unittest
 from collections import Counter
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
 
 import axelrod as axl
 
@@ -182,6 +186,138 @@ class TestMatch(unittest.TestCase):
             tmp_file.name, progress_bar=False
         )
         self.assertEqual(expected_interactions, interactions)
+        interactions = axl.interaction_utils.read_interactions_from_file(
+            tmp_file.name, progress_bar=True
+        )
+        self.assertEqual(expected_interactions, interactions)
+
+    def test_read_interactions_from_binary_file(self):
+        tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+        players = [axl.Cooperator(), axl.TitForTat(), axl.Random()]
+        tournament = axl.Tournament(
+            players=players, turns=5, repetitions=3, seed=1
+        )
+        tournament.play(filename=tmp_file.name, progress_bar=False)
+        tmp_file.close()
+        expected_interactions = (
+            axl.interaction_utils.read_interactions_from_file(
+                tmp_file.name, progress_bar=False
+            )
+        )
+
+        tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+        tournament = axl.Tournament(
+            players=players, turns=5, repetitions=3, seed=1
+        )
+        tournament.play(
+            filename=tmp_file.name, progress_bar=False, file_format="npz"
+        )
+        tmp_file.close()
+        interactions = axl.interaction_utils.read_interactions_from_file(
+            tmp_file.name, progress_bar=False
+        )
+        self.assertEqual(expected_interactions, interactions)
+        interactions = axl.interaction_utils.read_interactions_from_file(
+            tmp_file.name, progress_bar=True
+        )
+        self.assertEqual(expected_interactions, interactions)
+
+    def test_binary_interactions_writer(self):
+        tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+        tmp_file.close()
+        header = [
+            "Interaction index",
+            "Player index",
+            "Opponent index",
+            "Player name",
+            "Opponent name",
+            "Actions",
+            "Score per turn",
+            "Win",
+        ]
+        rows = [
+            [0, 0, 1, "Cooperator", "Defector", "CCC", 0.0, 0],
+            [0, 1, 0, "Defector", "Cooperator", "DDD", 5.0, 1],
+            [1, 1, 1, "Defector", "Defector", "D" * 20, 1 / 3, 0],
+            [1, 1, 1, "Defector", "Defector", "", 1.0, 0],
+        ]
+        writer = axl.interaction_utils.BinaryInteractionsWriter(
+            tmp_file.name, header
+        )
+        for row in rows:
+            writer.writerow(row)
+        writer.close()
+
+        self.assertTrue(
+            axl.interaction_utils.is_binary_interactions_file(tmp_file.name)
+        )
+        expected = pd.DataFrame(rows, columns=header)
+        df = axl.interaction_utils.read_binary_interactions(tmp_file.name)
+        pd.testing.assert_frame_equal(df, expected)
+
+        df = axl.interaction_utils.read_binary_interactions(
+            tmp_file.name, columns=["Win", "Player index"]
+        )
+        pd.testing.assert_frame_equal(df, expected[["Player index", "Win"]])
+        self.assertEqual(
+            axl.interaction_utils.read_binary_interactions_header(
+                tmp_file.name
+            ),
+            header,
+        )
+
+        # Rows are converted to arrays every _BUFFER_SIZE rows, leaving no
+        # rows to convert when the writer is closed. The whole bytes of
+        # actions of each block are packed, carrying the other actions over
+        # to the next block.
+        with patch("axelrod.interaction_utils._BUFFER_SIZE", 2):
+            writer = axl.interaction_utils.BinaryInteractionsWriter(
+                tmp_file.name, header
+            )
+            for row in rows:
+                writer.writerow(row)
+            self.assertEqual(writer._rows, [])
+            self.assertEqual([len(a) for a in writer._actions], [0, 3])
+            self.assertEqual(writer._actions[1].dtype, np.uint8)
+            np.testing.assert_array_equal(writer._action_bits, [True, True])
+            writer.close()
+        df = axl.interaction_utils.read_binary_interactions(tmp_file.name)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_read_action_arrays(self):
+        players = [axl.Cooperator(), axl.TitForTat(), axl.Random()]
+        for file_format in ("csv", "npz"):
+            tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+            tournament = axl.Tournament(
+                players=players, turns=5, repetitions=3, seed=1
+            )
+            tournament.play(
+                filename=tmp_file.name,
+                build_results=False,
+                progress_bar=False,
+                file_format=file_format,
+            )
+            tmp_file.close()
+            if file_format == "csv":
+                df = pd.read_csv(tmp_file.name)
+            else:
+                df = axl.interaction_utils.read_binary_interactions(
+                    tmp_file.name
+                )
+            (
+                player_indices,
+                opponent_indices,
+                lengths,
+                defections,
+            ) = axl.interaction_utils.read_action_arrays(tmp_file.name)
+            np.testing.assert_array_equal(player_indices, df["Player index"])
+            np.testing.assert_array_equal(
+                opponent_indices, df["Opponent index"]
+            )
+            np.testing.assert_array_equal(lengths, [5] * len(df))
+            self.assertEqual(
+                "".join("CD"[d] for d in defections), "".join(df["Actions"])
+            )
 
     def test_string_to_interactions(self):
         string = "CDCDDD"
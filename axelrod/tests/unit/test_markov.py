@@ -0,0 +1,308 @@
+"""Tests for the exact computation of memory-one match outcomes."""
+
+import unittest
+
+import numpy as np
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+
+import axelrod as axl
+from axelrod import markov
+
+C, D = axl.Action.C, axl.Action.D
+
+
+class TestTransitionMatrix(unittest.TestCase):
+    def test_deterministic_players(self):
+        # Tit For Tat against Win Stay Lose Shift.
+        matrix = markov.transition_matrix((1, 0, 1, 0), (1, 0, 0, 1))
+        expected = np.array(
+            [
+                [1, 0, 0, 0],  # CC -> CC
+                [0, 0, 0, 1],  # CD -> DD
+                [0, 1, 0, 0],  # DC -> CD (the coplayer was in state CD)
+                [0, 0, 1, 0],  # DD -> DC
+            ]
+        )
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_noise(self):
+        matrix = markov.transition_matrix((1, 1, 1, 1), (0, 0, 0, 0), noise=0.1)
+        for row in matrix:
+            np.testing.assert_allclose(row, [0.09, 0.81, 0.01, 0.09])
+
+    @given(
+        vector_1=floats(min_value=0, max_value=1),
+        vector_2=floats(min_value=0, max_value=1),
+        noise=floats(min_value=0, max_value=1),
+    )
+    def test_stochastic(self, vector_1, vector_2, noise):
+        four_vector_1 = (vector_1, 1 - vector_1, vector_1 / 2, 1)
+        four_vector_2 = (0, vector_2, 1, vector_2 / 3)
+        matrix = markov.transition_matrix(
+            four_vector_1, four_vector_2, noise=noise
+        )
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertTrue(np.all(matrix >= 0))
+        np.testing.assert_allclose(matrix.sum(axis=1), np.ones(4))
+
+
+class TestInitialDistribution(unittest.TestCase):
+    def test_initial_distribution(self):
+        np.testing.assert_array_equal(
+            markov.initial_distribution(C, D), [0, 1, 0, 0]
+        )
+        np.testing.assert_array_equal(
+            markov.initial_distribution(D, D), [0, 0, 0, 1]
+        )
+        np.testing.assert_allclose(
+            markov.initial_distribution(C, C, noise=0.5), [0.25] * 4
+        )
+
+
+class TestMeanStateDistribution(unittest.TestCase):
+    def setUp(self):
+        self.matrix = markov.transition_matrix(
+            (0.9, 0.1, 0.5, 0.3), (0.8, 0.2, 0.8, 0.2), noise=0.05
+        )
+        self.initial = markov.initial_distribution(C, D, noise=0.05)
+
+    @given(turns=integers(min_value=1, max_value=300))
+    @settings(max_examples=20)
+    def test_finite_turns(self, turns):
+        state, total = self.initial, np.zeros(4)
+        for _ in range(turns):
+            total += state
+            state = state @ self.matrix
+        np.testing.assert_allclose(
+            markov.mean_state_distribution(self.initial, self.matrix, turns),
+            total / turns,
+        )
+
+    def test_infinite_turns(self):
+        distribution = markov.mean_state_distribution(
+            self.initial, self.matrix, float("inf")
+        )
+        np.testing.assert_allclose(distribution @ self.matrix, distribution)
+        self.assertAlmostEqual(distribution.sum(), 1)
+
+    def test_infinite_turns_periodic_chain(self):
+        # Tit For Tat against Suspicious Tit For Tat alternate between CD
+        # and DC.
+        matrix = markov.transition_matrix((1, 0, 1, 0), (1, 0, 1, 0))
+        initial = markov.initial_distribution(C, D)
+        np.testing.assert_allclose(
+            markov.mean_state_distribution(initial, matrix, float("inf")),
+            [0, 0.5, 0.5, 0],
+        )
+
+    def test_prob_end(self):
+        # Against a coplayer that always cooperates, a player that cooperates
+        # on the first turn only is in state CC on the first turn and DC
+        # afterwards. The expected proportion of CC is the expected value
+        # of 1 / n.
+        matrix = markov.transition_matrix((0, 0, 0, 0), (1, 1, 1, 1))
+        initial = markov.initial_distribution(C, C)
+        prob_end = 0.25
+        expected = sum(
+            prob_end * (1 - prob_end) ** (n - 1) / n for n in range(1, 500)
+        )
+        distribution = markov.mean_state_distribution(
+            initial, matrix, float("inf"), prob_end
+        )
+        np.testing.assert_allclose(distribution, [expected, 0, 1 - expected, 0])
+
+    def test_prob_end_and_turns(self):
+        matrix = markov.transition_matrix((0, 0, 0, 0), (1, 1, 1, 1))
+        initial = markov.initial_distribution(C, C)
+        prob_end, turns = 0.25, 3
+        probabilities = [0.25, 0.75 * 0.25, 0.75**2]
+        expected = sum(p / n for n, p in enumerate(probabilities, start=1))
+        distribution = markov.mean_state_distribution(
+            initial, matrix, turns, prob_end
+        )
+        np.testing.assert_allclose(distribution, [expected, 0, 1 - expected, 0])
+
+    def test_prob_end_one(self):
+        distribution = markov.mean_state_distribution(
+            self.initial, self.matrix, float("inf"), 1
+        )
+        np.testing.assert_array_equal(distribution, self.initial)
+
+
+class TestExpectedOutcomes(unittest.TestCase):
+    def test_deterministic_players_agree_with_match(self):
+        players = [
+            axl.Cooperator(),
+            axl.Defector(),
+            axl.TitForTat(),
+            axl.WinStayLoseShift(),
+            axl.MemoryOnePlayer((0, 0, 1, 1), initial=D),
+        ]
+        for player1 in players:
+            for player2 in players:
+                match = axl.Match((player1, player2), turns=25)
+                match.play()
+                expected_scores = markov.expected_scores(
+                    player1, player2, turns=25
+                )
+                np.testing.assert_allclose(
+                    expected_scores, match.final_score_per_turn()
+                )
+                distribution = match.normalised_state_distribution()
+                np.testing.assert_allclose(
+                    markov.expected_state_distribution(
+                        player1, player2, turns=25
+                    ),
+                    [
+                        distribution[state]
+                        for state in [(C, C), (C, D), (D, C), (D, D)]
+                    ],
+                    atol=1e-12,
+                )
+
+    def test_default_turns(self):
+        self.assertEqual(
+            markov.expected_scores(axl.TitForTat(), axl.Defector()),
+            (0.995 * 1, 1 + 4 / axl.DEFAULT_TURNS),
+        )
+
+    def test_game(self):
+        game = axl.Game(r=4, s=0, t=6, p=2)
+        scores = markov.expected_scores(
+            axl.Cooperator(), axl.Defector(), turns=10, game=game
+        )
+        self.assertEqual(scores, (0, 6))
+
+    def test_long_run_scores(self):
+        # GTFT cooperates with probability 1 / 3 after a defection.
+        scores = markov.expected_scores(
+            axl.GTFT(), axl.Defector(), turns=float("inf")
+        )
+        self.assertAlmostEqual(scores[0], 2 / 3)
+        self.assertAlmostEqual(scores[1], 5 / 3 + 2 / 3)
+
+    def test_agrees_with_batch_match(self):
+        pairs = [
+            (axl.GTFT(), axl.ZDExtort2()),
+            (
+                axl.MemoryOnePlayer((0.9, 0.1, 0.5, 0.3)),
+                axl.ReactivePlayer((0.8, 0.2)),
+            ),
+        ]
+        batch = axl.BatchMatch(
+            pairs, turns=50, noise=0.05, repetitions=20000, seed=0
+        )
+        batch.play()
+        sampled_scores = batch.final_score_per_turn().mean(axis=1)
+        for index, pair in enumerate(pairs):
+            np.testing.assert_allclose(
+                markov.expected_scores(*pair, turns=50, noise=0.05),
+                sampled_scores[index],
+                atol=0.02,
+            )
+
+    def test_prob_end_agrees_with_batch_match(self):
+        pair = (axl.GTFT(), axl.ZDExtort2())
+        batch = axl.BatchMatch(
+            [pair], prob_end=0.1, noise=0.05, repetitions=40000, seed=0
+        )
+        batch.play()
+        sampled_scores = np.nanmean(batch.final_score_per_turn()[0], axis=0)
+        np.testing.assert_allclose(
+            markov.expected_scores(*pair, prob_end=0.1, noise=0.05),
+            sampled_scores,
+            atol=0.02,
+        )
+
+    def test_not_memory_one(self):
+        with self.assertRaises(TypeError):
+            markov.expected_scores(axl.Grudger(), axl.TitForTat())
+
+
+class TestPlayerMachine(unittest.TestCase):
+    def test_memory_one(self):
+        initial, probability, next_state = markov.player_machine(
+            axl.WinStayLoseShift()
+        )
+        self.assertEqual(probability(initial), 1)
+        self.assertEqual(
+            [probability(next_state(initial, 0, b)) for b in (0, 1)], [1, 0]
+        )
+        self.assertEqual(
+            [probability(next_state(initial, 1, b)) for b in (0, 1)], [0, 1]
+        )
+
+    def test_finite_state_machine(self):
+        player = axl.Fortress3()
+        initial, probability, next_state = markov.player_machine(player)
+        opponent = axl.Alternator()
+        state = initial
+        for action, opponent_action in axl.Match(
+            (player, opponent), turns=10
+        ).play():
+            self.assertEqual(probability(state), float(action == C))
+            state = next_state(state, action.value, opponent_action.value)
+
+    def test_lookup_table(self):
+        player = axl.EvolvedLookerUp2_2_2()
+        initial, probability, next_state = markov.player_machine(player)
+        opponent = axl.Cycler("CCDDDC")
+        state = initial
+        for action, opponent_action in axl.Match(
+            (player, opponent), turns=20
+        ).play():
+            self.assertEqual(probability(state), float(action == C))
+            state = next_state(state, action.value, opponent_action.value)
+
+    def test_gambler(self):
+        player = axl.PSOGambler1_1_1()
+        initial, probability, next_state = markov.player_machine(player)
+        self.assertEqual(probability(initial), 1)
+        table = player.lookup_dict
+        for plays in ((C,), (D,)):
+            for op_plays in ((C,), (D,)):
+                state = next_state(initial, plays[0].value, op_plays[0].value)
+                key = (plays, op_plays, op_plays)
+                self.assertEqual(probability(state), table[key])
+
+    def test_not_finite_state(self):
+        with self.assertRaises(TypeError):
+            markov.player_machine(axl.Grudger())
+
+
+class TestProductChain(unittest.TestCase):
+    def test_deterministic_players_agree_with_match(self):
+        players = (axl.Fortress3(), axl.EvolvedLookerUp2_2_2())
+        machines = [markov.player_machine(player) for player in players]
+        states, probabilities1, probabilities2, successors = (
+            markov.product_chain(*machines)
+        )
+        self.assertEqual(successors.shape, (len(states), 4))
+        self.assertTrue(np.all((probabilities1 == 0) | (probabilities1 == 1)))
+        index = 0
+        for action1, action2 in axl.Match(players, turns=30).play():
+            self.assertEqual(probabilities1[index], float(action1 == C))
+            self.assertEqual(probabilities2[index], float(action2 == C))
+            index = successors[index, 2 * action1.value + action2.value]
+
+    def test_memory_one_players(self):
+        machines = [
+            markov.player_machine(player)
+            for player in (axl.TitForTat(), axl.WinStayLoseShift())
+        ]
+        states, probabilities1, probabilities2, successors = (
+            markov.product_chain(*machines)
+        )
+        self.assertEqual(states[0], (-1, -1))
+        self.assertEqual(len(states), 5)
+        self.assertEqual(list(probabilities1), [1, 1, 0, 1, 0])
+        self.assertEqual(list(probabilities2), [1, 1, 0, 0, 1])
+
+    def test_max_states(self):
+        machines = [
+            markov.player_machine(player)
+            for player in (axl.EvolvedLookerUp2_2_2(), axl.TitForTat())
+        ]
+        with self.assertRaises(ValueError):
+            markov.product_chain(*machines, max_states=10)
@@ -209,6 +209,89 @@ class TestMatch(unittest.TestCase):
             cache[(axl.Cooperator(), axl.Defector())], expected_result_5_turn
         )
 
+    def test_detect_cycles(self):
+        players = [
+            axl.Cooperator(),
+            axl.Defector(),
+            axl.TitForTat(),
+            axl.TitFor2Tats(),
+            axl.ForgetfulGrudger(),
+            axl.Fortress3(),
+            axl.EvolvedFSM16(),
+            axl.CyclerCCD(),
+            axl.GoByMajority(5),
+        ]
+        for player1 in players:
+            for player2 in players:
+                expected = axl.Match(
+                    (player1.clone(), player2.clone()), turns=200
+                )
+                expected.play()
+                match = axl.Match(
+                    (player1.clone(), player2.clone()),
+                    turns=200,
+                    detect_cycles=True,
+                )
+                self.assertEqual(match.play(), expected.result)
+                for player, other in zip(match.players, expected.players):
+                    self.assertEqual(player.history, other.history)
+                    self.assertEqual(
+                        player.state_distribution, other.state_distribution
+                    )
+                    self.assertEqual(player.state_key(), other.state_key())
+
+    def test_detect_cycles_advances_the_players(self):
+        for turns in (100, 101, 102):
+            expected = axl.Match(
+                (axl.EvolvedFSM16(), axl.CyclerCCD()), turns=turns
+            )
+            expected.play()
+            match = axl.Match(
+                (axl.EvolvedFSM16(), axl.CyclerCCD()),
+                turns=turns,
+                detect_cycles=True,
+            )
+            self.assertEqual(match.play(), expected.result)
+            self.assertEqual(
+                match.players[0].fsm.state, expected.players[0].fsm.state
+            )
+            self.assertEqual(
+                match.players[1].strategy(match.players[0]),
+                expected.players[1].strategy(expected.players[0]),
+            )
+
+    def test_detect_cycles_stops_calling_strategy(self):
+        players = (axl.TitForTat(), axl.Alternator())
+        match = axl.Match(players, turns=100, detect_cycles=True)
+        self.assertTrue(match._cycle_detection_possible)
+        calls = []
+        strategy = players[0].strategy
+
+        def counted_strategy(opponent):
+            calls.append(opponent)
+            return strategy(opponent)
+
+        players[0].strategy = counted_strategy
+        match.play()
+        self.assertEqual(
+            match.result, [(C, C)] + [(C, D), (D, C)] * 49 + [(C, D)]
+        )
+        self.assertLess(len(calls), 10)
+
+    def test_cycle_detection_not_possible(self):
+        match = axl.Match((axl.TitForTat(), axl.Cooperator()), turns=10)
+        self.assertFalse(match._cycle_detection_possible)
+        for players, noise in [
+            ((axl.TitForTat(), axl.Random()), 0),
+            ((axl.TitForTat(), axl.Cooperator()), 0.1),
+            ((axl.TitForTat(), axl.BackStabber()), 0),
+            ((axl.TitForTat(), axl.Darwin()), 0),
+        ]:
+            match = axl.Match(
+                players, turns=10, noise=noise, detect_cycles=True
+            )
+            self.assertFalse(match._cycle_detection_possible)
+
     def test_scores(self):
         player1 = axl.TitForTat()
         player2 = axl.Defector()
@@ -4,7 +4,7 @@ from hypothesis import example, given, settings
 from hypothesis.strategies import integers
 
 import axelrod as axl
-from axelrod.match_generator import graph_is_connected
+from axelrod.match_generator import graph_is_connected, player_cost
 
 test_strategies = [
     axl.Cooperator,
@@ -261,6 +261,98 @@ class TestMatchGenerator(unittest.TestCase):
         )
         self.assertEqual(len(rr), len(list(rr.build_match_chunks())))
 
+    def balanced_match_generator(self, player_costs=None, edges=None):
+        return axl.MatchGenerator(
+            players=self.players,
+            turns=test_turns,
+            game=test_game,
+            repetitions=test_repetitions,
+            edges=edges,
+            seed=0,
+            balance_chunks=True,
+            player_costs=player_costs,
+        )
+
+    def repetition_seeds(self, match_generator):
+        seeds = {}
+        for chunk in match_generator.build_match_chunks():
+            for index_pair, _, repetitions, chunk_seeds in chunk:
+                self.assertEqual(len(repetitions), len(chunk_seeds))
+                for repetition, seed in zip(repetitions, chunk_seeds):
+                    self.assertNotIn((index_pair, repetition), seeds)
+                    seeds[(index_pair, repetition)] = seed
+        return seeds
+
+    def test_balanced_chunks_with_equal_costs(self):
+        rr = self.balanced_match_generator()
+        chunks = list(rr.build_match_chunks())
+        self.assertEqual(len(rr), len(chunks))
+        self.assertEqual(len(chunks), 15)
+        for chunk in chunks:
+            self.assertEqual(len(chunk), 1)
+            self.assertEqual(chunk[0][2], range(test_repetitions))
+
+    def test_balanced_chunks_with_expensive_player(self):
+        rr = self.balanced_match_generator(player_costs={"Defector": 50})
+        chunks = list(rr.build_match_chunks())
+        self.assertEqual(len(rr), len(chunks))
+
+        # The cheap matches are grouped together in a single chunk.
+        groups = [chunk for chunk in chunks if len(chunk) > 1]
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(len(groups[0]), 10)
+        self.assertNotIn(2, [i for pair, *_ in groups[0] for i in pair])
+
+        # The repetitions of the expensive matches are split.
+        self.assertGreater(len(chunks), 15)
+        for chunk in chunks:
+            if chunk is not groups[0]:
+                self.assertIn(2, chunk[0][0])
+                self.assertLess(len(chunk[0][2]), test_repetitions)
+
+        # Chunks are ordered from the most expensive.
+        costs = [
+            sum(
+                (
+                    player_cost(self.players[i], rr.player_costs)
+                    + player_cost(self.players[j], rr.player_costs)
+                )
+                * len(repetitions)
+                for (i, j), _, repetitions, _ in chunk
+            )
+            for chunk in chunks
+        ]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+
+    def test_balanced_chunks_seeds_do_not_depend_on_chunks(self):
+        seeds = self.repetition_seeds(self.balanced_match_generator())
+        self.assertEqual(len(seeds), 15 * test_repetitions)
+        self.assertEqual(len(set(seeds.values())), len(seeds))
+
+        for player_costs in ({"Defector": 50}, {"Grudger": 0.01}):
+            rr = self.balanced_match_generator(player_costs=player_costs)
+            self.assertEqual(self.repetition_seeds(rr), seeds)
+
+    def test_spatial_balanced_chunks(self):
+        cycle = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 1)]
+        rr = self.balanced_match_generator(
+            player_costs={"Defector": 50}, edges=cycle
+        )
+        seeds = self.repetition_seeds(rr)
+        self.assertEqual(
+            set(seeds),
+            {(pair, r) for pair in cycle for r in range(test_repetitions)},
+        )
+
+    def test_player_cost(self):
+        self.assertEqual(player_cost(axl.TitForTat()), 1)
+        self.assertEqual(
+            player_cost(axl.DBS()), axl.match_generator.LONG_RUN_TIME_COST
+        )
+        player_costs = {str(axl.DBS()): 3}
+        self.assertEqual(player_cost(axl.DBS(), player_costs), 3)
+        self.assertEqual(player_cost(axl.TitForTat(), player_costs), 1)
+
     def test_init_with_graph_edges_not_including_all_players(self):
         edges = [(0, 1), (1, 2)]
         with self.assertRaises(ValueError):
@@ -1,13 +1,16 @@
 import itertools
 import unittest
 from collections import Counter
+from unittest.mock import patch
 
 import matplotlib.pyplot as plt
+import numpy as np
 from hypothesis import example, given, settings
 from hypothesis.strategies import integers
 
 import axelrod as axl
 from axelrod import MoranProcess
+from axelrod.moran import PopulationHistory
 from axelrod.tests.property import strategy_lists
 
 C, D = axl.Action.C, axl.Action.D
@@ -375,6 +378,79 @@ class TestMoranProcess(unittest.TestCase):
         mp = axl.MoranProcess((p1, p2), deterministic_cache=cache)
         self.assertEqual(cache, mp.deterministic_cache)
 
+    def count_matches(self, players, **kwargs):
+        """Returns the number of matches played in each of 10 rounds."""
+        counts = []
+
+        class CountingMatch(axl.Match):
+            def play(self):
+                counts[-1] += 1
+                return super().play()
+
+        mp = MoranProcess(players, match_class=CountingMatch, **kwargs)
+        for _ in range(10):
+            counts.append(0)
+            next(mp)
+        return counts
+
+    def test_deterministic_payoffs_between_types_are_reused(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()] * 4
+        counts = self.count_matches(
+            players, turns=5, mutation_rate=0.1, stop_on_fixation=False, seed=1
+        )
+        # Each ordered pair of types is played at most once.
+        self.assertLessEqual(sum(counts), 9)
+        self.assertEqual(counts[1:], [0] * 9)
+
+    def test_deterministic_payoffs_between_individuals_are_reused(self):
+        players = [
+            axl.EvolvableCycler(cycle_length=3, seed=i) for i in range(6)
+        ]
+        counts = self.count_matches(
+            players, turns=5, mutation_method="atomic", seed=1
+        )
+        self.assertEqual(counts[0], 15)
+        # Only the matches of the replaced individual are played.
+        for count in counts[1:]:
+            self.assertLessEqual(count, 5)
+
+    def test_stochastic_matches_are_replayed(self):
+        players = [axl.Random(0.2), axl.Random(0.5), axl.Random(0.8)]
+        counts = self.count_matches(
+            players, turns=5, stop_on_fixation=False, seed=1
+        )
+        self.assertEqual(counts, [3] * 10)
+
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        for kwargs in ({"noise": 0.1}, {"prob_end": 0.1}):
+            counts = self.count_matches(
+                players, turns=5, stop_on_fixation=False, seed=1, **kwargs
+            )
+            self.assertEqual(counts, [3] * 10)
+
+    def test_reused_payoffs_keep_the_seeds_of_stochastic_matches(self):
+        players = [
+            axl.TitForTat(),
+            axl.Random(),
+            axl.Defector(),
+            axl.Random(),
+            axl.Cooperator(),
+            axl.GTFT(),
+        ]
+        mp = MoranProcess(players, turns=10, seed=1)
+        mp.play()
+        # The outcome of a process which plays every match.
+        self.assertEqual(mp.winning_strategy_name, "Defector")
+        self.assertEqual(len(mp.populations), 19)
+
+    def test_reset_forgets_payoffs(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        mp = MoranProcess(players, turns=5, seed=1)
+        mp.play()
+        self.assertEqual(mp._payoffs, {("Cooperator", "Defector"): (0, 5)})
+        mp.reset()
+        self.assertEqual(mp._payoffs, {})
+
     def test_iter(self):
         p1, p2 = axl.Cooperator(), axl.Defector()
         mp = axl.MoranProcess((p1, p2))
@@ -427,7 +503,7 @@ class TestMoranProcess(unittest.TestCase):
             next(mp)
         self.assertEqual(
             list(sorted(mp.populations[-1].items()))[0][0],
-            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, C), (1, C, 1, D), (1, D, 1, D)), 0, D, 2, 0.1, 2240802643",
+            "EvolvableFSMPlayer: ((0, C, 0, C), (0, D, 1, D), (1, C, 1, C), (1, D, 1, D)), 0, D, 2, 0.1, 1407878363",
         )
         self.assertEqual(len(mp.populations), 11)
         self.assertFalse(mp.fixated)
@@ -443,8 +519,11 @@ class TestMoranProcess(unittest.TestCase):
         for _ in range(rounds):
             next(mp)
         self.assertEqual(
-            list(mp.populations[-1].items())[0],
-            ("EvolvableCycler: CCDDD, 5, 0.2, 1, 1164244177", 1),
+            mp.populations[-1]["EvolvableCycler: CCDDD, 5, 0.2, 1, 1164244177"],
+            1,
+        )
+        self.assertEqual(
+            str(mp.players[0]), "EvolvableCycler: CCDDD, 5, 0.2, 1, 1164244177"
         )
         self.assertEqual(len(mp.populations), 11)
         self.assertFalse(mp.fixated)
@@ -573,6 +652,126 @@ class GraphMoranProcess(unittest.TestCase):
             self.assertEqual((winner == winner2), outcome)
 
 
+class TestIncrementalScoring(unittest.TestCase):
+    players = [
+        axl.TitForTat(),
+        axl.Defector(),
+        axl.Cooperator(),
+        axl.Grudger(),
+        axl.Alternator(),
+    ] * 4
+
+    def test_birth_death_equals_full_scoring(self):
+        graph = axl.graph.lattice(5, 4)
+        for seed in range(3):
+            mp = MoranProcess(
+                self.players, turns=10, interaction_graph=graph, seed=seed
+            )
+            incremental_mp = MoranProcess(
+                self.players,
+                turns=10,
+                interaction_graph=graph,
+                seed=seed,
+                incremental_scoring=True,
+            )
+            for _ in range(50):
+                next(mp)
+                next(incremental_mp)
+                self.assertTrue(
+                    np.allclose(mp.score_all(), incremental_mp.score_all())
+                )
+            self.assertEqual(mp.populations, incremental_mp.populations)
+            self.assertEqual(incremental_mp.score_history, [])
+
+    def test_complete_graph(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.TitForTat()]
+        mp = MoranProcess(players, seed=1)
+        incremental_mp = MoranProcess(players, seed=1, incremental_scoring=True)
+        self.assertEqual(mp.play(), incremental_mp.play())
+        self.assertEqual(
+            mp.winning_strategy_name, incremental_mp.winning_strategy_name
+        )
+
+    def test_death_birth_replaces_with_neighbor(self):
+        graph = axl.graph.cycle(20)
+        mp = MoranProcess(
+            self.players,
+            turns=10,
+            interaction_graph=graph,
+            mode="db",
+            incremental_scoring=True,
+            seed=2,
+        )
+        for _ in range(50):
+            previous = [str(player) for player in mp.players]
+            next(mp)
+            current = [str(player) for player in mp.players]
+            changed = [i for i in range(20) if previous[i] != current[i]]
+            for i in changed:
+                self.assertIn(
+                    current[i], (previous[(i - 1) % 20], previous[(i + 1) % 20])
+                )
+        for i in range(20):
+            self.assertAlmostEqual(
+                mp.score_all()[i],
+                mp._player_score(i),
+            )
+
+    def test_death_birth_without_reproduction_neighbors(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.Cooperator()]
+        players.append(axl.Defector())
+        reproduction_graph = axl.graph.Graph([(0, 1), (1, 2), (2, 0), (3, 3)])
+        mp = MoranProcess(
+            players,
+            turns=10,
+            interaction_graph=axl.graph.cycle(4),
+            reproduction_graph=reproduction_graph,
+            mode="db",
+            incremental_scoring=True,
+            stop_on_fixation=False,
+            seed=1,
+        )
+        # The isolated player can only be replaced by a copy of itself
+        self.assertEqual(mp.birth(3), 3)
+        for _ in range(20):
+            next(mp)
+            self.assertEqual(str(mp.players[3]), "Defector")
+            self.assertEqual(mp.score_all()[3], mp._player_score(3))
+
+    def test_stochastic_players(self):
+        players = [axl.Random(), axl.Defector()] * 5
+        graph = axl.graph.cycle(10)
+        populations = []
+        for _ in range(2):
+            mp = MoranProcess(
+                players,
+                turns=10,
+                interaction_graph=graph,
+                incremental_scoring=True,
+                seed=3,
+            )
+            populations.append(mp.play())
+        self.assertEqual(populations[0], populations[1])
+        self.assertEqual(sum(populations[0][-1].values()), 10)
+
+    def test_reset(self):
+        graph = axl.graph.cycle(20)
+        mp = MoranProcess(
+            self.players,
+            turns=10,
+            interaction_graph=graph,
+            incremental_scoring=True,
+            seed=4,
+        )
+        mp.play()
+        mp.reset()
+        self.assertIsNone(mp._scores)
+        scores = mp.score_all()
+        for i, player in enumerate(mp.players):
+            self.assertIs(player, self.players[i])
+            self.assertEqual(scores[i], mp._player_score(i))
+
+
 class TestApproximateMoranProcess(unittest.TestCase):
     """A suite of tests for the ApproximateMoranProcess"""
 
@@ -623,3 +822,399 @@ class TestApproximateMoranProcess(unittest.TestCase):
         self.assertEqual(scores, (0, 5))
         scores = self.amp._get_scores_from_cache(("Defector", "Cooperator"))
         self.assertEqual(scores, (5, 0))
+
+
+class TestPopulationHistory(unittest.TestCase):
+    def test_type_id(self):
+        history = PopulationHistory(["A", "B"])
+        self.assertEqual(history.type_names, ["A", "B"])
+        self.assertEqual(history.type_id("B"), 1)
+        self.assertEqual(history.type_id("C"), 2)
+        self.assertEqual(history.type_ids, {"A": 0, "B": 1, "C": 2})
+
+    def test_append(self):
+        history = PopulationHistory(["A", "B"])
+        history.append(np.array([2, 1]))
+        history.append(np.array([3, 0]))
+        history.type_id("C")
+        history.append(np.array([2, 0, 1]))
+        self.assertEqual(len(history), 3)
+        self.assertTrue(
+            np.array_equal(history.counts, [[2, 1, 0], [3, 0, 0], [2, 0, 1]])
+        )
+        self.assertEqual(
+            history.populations,
+            [
+                Counter({"A": 2, "B": 1}),
+                Counter({"A": 3}),
+                Counter({"A": 2, "C": 1}),
+            ],
+        )
+
+    def test_growth(self):
+        history = PopulationHistory()
+        for i in range(100):
+            history.type_id(str(i))
+            counts = np.zeros(i + 1, dtype=int)
+            counts[i] = 1
+            history.append(counts)
+        self.assertEqual(history.counts.shape, (100, 100))
+        self.assertTrue(np.array_equal(history.counts, np.eye(100)))
+        self.assertEqual(history.populations[50], Counter({"50": 1}))
+        self.assertEqual(len(history.populations), 100)
+        # Only the changes of the counts are stored.
+        self.assertLess(history._changes.nbytes, history.counts.nbytes / 10)
+
+    def test_populations_are_converted_once(self):
+        history = PopulationHistory(["A", "B"])
+        history.append(np.array([2, 1]))
+        first = history.populations[0]
+        history.append(np.array([1, 2]))
+        self.assertIs(history.populations[0], first)
+        self.assertEqual(history.populations[1], Counter({"A": 1, "B": 2}))
+
+    def test_moran_process_history(self):
+        players = [axl.Cooperator(), axl.Defector(), axl.Defector()]
+        mp = MoranProcess(
+            players, mutation_rate=0.2, stop_on_fixation=False, seed=1
+        )
+        for _ in range(20):
+            next(mp)
+        counts = mp.population_history.counts
+        self.assertEqual(counts.shape, (21, 2))
+        self.assertTrue(all(counts.sum(axis=1) == 3))
+        self.assertEqual(mp.population_history.type_names[0], "Cooperator")
+        self.assertEqual(
+            mp.populations[-1], Counter(str(player) for player in mp.players)
+        )
+        self.assertEqual(mp.population_distribution(), mp.populations[-1])
+
+
+class TestPlayMoranProcesses(unittest.TestCase):
+    players = [axl.TitForTat()] * 2 + [axl.Defector()] * 4
+
+    def test_play_moran_processes(self):
+        mp = MoranProcess(self.players, turns=10)
+        results = axl.play_moran_processes(mp, 20, seed=1)
+        self.assertIsInstance(results, axl.MoranEnsembleResults)
+        self.assertEqual(results.repetitions, 20)
+        self.assertEqual(len(results.winners), 20)
+        self.assertEqual(sum(results.fixation_counts.values()), 20)
+        self.assertEqual(
+            set(results.fixation_counts), {"Defector", "Tit For Tat"}
+        )
+        self.assertAlmostEqual(sum(results.fixation_probabilities.values()), 1)
+        self.assertEqual(results.fixation_times.shape, (20,))
+        self.assertTrue(all(results.fixation_times >= 2))
+
+    def test_replicates_match_seeded_processes(self):
+        mp = MoranProcess(self.players, turns=10)
+        results = axl.play_moran_processes(mp, 5, seed=2)
+        random = axl.RandomGenerator(seed=2)
+        for winner, time in zip(results.winners, results.fixation_times):
+            replicate = MoranProcess(
+                self.players, turns=10, seed=random.random_seed_int()
+            )
+            populations = replicate.play()
+            self.assertEqual(winner, replicate.winning_strategy_name)
+            self.assertEqual(time, len(populations) - 1)
+
+    def test_parallel_equals_serial(self):
+        mp = MoranProcess(self.players, turns=10)
+        serial = axl.play_moran_processes(mp, 20, seed=3)
+        parallel = axl.play_moran_processes(
+            mp, 20, processes=2, seed=3, chunk_size=3
+        )
+        self.assertEqual(serial.winners, parallel.winners)
+        self.assertTrue(
+            np.array_equal(serial.fixation_times, parallel.fixation_times)
+        )
+
+    def test_worker_replicates(self):
+        """The Moran process is stored in the module of a worker, which is
+        run here in the same process."""
+        mp = MoranProcess(self.players, turns=10)
+        expected = axl.moran._play_replicates([1, 2], process=mp)
+        with patch("axelrod.moran._worker_process", None):
+            axl.moran._initialise_moran_worker(mp)
+            self.assertIs(axl.moran._worker_process, mp)
+            self.assertEqual(axl.moran._play_replicates([1, 2]), expected)
+        self.assertIsNone(axl.moran._worker_process)
+
+    def test_parallel_with_default_chunk_size(self):
+        mp = MoranProcess(self.players, turns=10)
+        serial = axl.play_moran_processes(mp, 10, seed=5)
+        # All available CPUs are used if processes is 0.
+        parallel = axl.play_moran_processes(mp, 10, processes=0, seed=5)
+        self.assertEqual(serial.winners, parallel.winners)
+
+    def test_approximate_moran_process(self):
+        cached_outcomes = {
+            ("Random: 0.5", "Defector"): axl.Pdf(Counter([(1, 1), (0, 5)])),
+            ("Random: 0.5", "Random: 0.5"): axl.Pdf(Counter([(3, 3)])),
+            ("Defector", "Defector"): axl.Pdf(Counter([(1, 1)])),
+        }
+        players = [axl.Defector(), axl.Random(), axl.Random()]
+        amp = axl.ApproximateMoranProcess(players, cached_outcomes)
+        results = [
+            axl.play_moran_processes(amp, 10, seed=4).winners for _ in range(2)
+        ]
+        self.assertEqual(results[0], results[1])
+
+    def test_fixation_time_statistics(self):
+        results = axl.MoranEnsembleResults(["A", "B", "A"], [2, 6, 4])
+        self.assertEqual(
+            results.fixation_time_statistics(),
+            {
+                "mean": 4,
+                "std": np.std([2, 6, 4]),
+                "median": 4,
+                "min": 2,
+                "max": 6,
+            },
+        )
+        self.assertEqual(
+            results.fixation_time_statistics("A"),
+            {"mean": 3, "std": 1, "median": 3, "min": 2, "max": 4},
+        )
+        self.assertIsNone(results.fixation_time_statistics("C"))
+        self.assertEqual(
+            repr(results),
+            "MoranEnsembleResults(repetitions=3, fixation_counts="
+            "{'A': 2, 'B': 1})",
+        )
+        self.assertEqual(
+            results.fixation_probabilities, {"A": 2 / 3, "B": 1 / 3}
+        )
+
+    def test_mutation_raises(self):
+        mp = MoranProcess(self.players, mutation_rate=0.1)
+        with self.assertRaises(ValueError):
+            axl.play_moran_processes(mp, 2)
+        mp = MoranProcess(self.players, stop_on_fixation=False)
+        with self.assertRaises(ValueError):
+            axl.play_moran_processes(mp, 2)
+
+
+class TestTypeMoranProcess(unittest.TestCase):
+    """A suite of tests for the TypeMoranProcess"""
+
+    players = [axl.Cooperator(), axl.Defector(), axl.Defector()]
+
+    def test_type_payoff_matrix(self):
+        types, payoffs = axl.type_payoff_matrix(
+            self.players, turns=5, repetitions=1
+        )
+        self.assertEqual(types, ["Cooperator", "Defector"])
+        self.assertTrue(np.array_equal(payoffs, [[3, 0], [5, 1]]))
+
+    def test_init(self):
+        tp = axl.TypeMoranProcess(self.players, turns=5, repetitions=1)
+        self.assertEqual(tp.types, ["Cooperator", "Defector"])
+        self.assertTrue(np.array_equal(tp.payoffs, [[3, 0], [5, 1]]))
+        self.assertTrue(np.array_equal(tp.counts, [1, 2]))
+        self.assertEqual(
+            tp.populations, [Counter({"Cooperator": 1, "Defector": 2})]
+        )
+        self.assertFalse(tp.fixated)
+
+    def test_init_errors(self):
+        with self.assertRaises(TypeError):
+            axl.TypeMoranProcess(
+                [axl.EvolvableCycler(cycle_length=2), axl.Defector()]
+            )
+        with self.assertRaises(ValueError):
+            axl.TypeMoranProcess(self.players, payoffs=[[1, 2, 3]])
+
+    def test_fitnesses(self):
+        tp = axl.TypeMoranProcess(self.players, payoffs=[[3, 0], [5, 1]])
+        self.assertTrue(np.array_equal(tp.fitnesses(), [0, 6]))
+
+        tp = axl.TypeMoranProcess(
+            self.players,
+            payoffs=[[3, 0], [5, 1]],
+            fitness_transformation=lambda score: score + 1,
+        )
+        self.assertTrue(np.array_equal(tp.fitnesses(), [1, 7]))
+
+    def test_play(self):
+        tp = axl.TypeMoranProcess(
+            self.players, payoffs=[[3, 0], [5, 1]], seed=1
+        )
+        populations = tp.play()
+        self.assertEqual(populations, tp.populations)
+        self.assertEqual(populations[-1], Counter({"Defector": 3}))
+        self.assertEqual(tp.winning_strategy_name, "Defector")
+        self.assertTrue(tp.fixated)
+        for population in populations:
+            self.assertEqual(sum(population.values()), 3)
+
+        tp.reset()
+        self.assertEqual(len(tp), 1)
+        self.assertIsNone(tp.winning_strategy_name)
+
+    def test_population_distribution(self):
+        tp = axl.TypeMoranProcess(
+            self.players, payoffs=[[3, 0], [5, 1]], seed=1
+        )
+        self.assertEqual(
+            tp.population_distribution(),
+            Counter({"Cooperator": 1, "Defector": 2}),
+        )
+        tp.play()
+        self.assertEqual(tp.population_distribution(), Counter({"Defector": 3}))
+
+    def test_iter(self):
+        tp = axl.TypeMoranProcess(
+            self.players,
+            payoffs=[[3, 0], [5, 1]],
+            mutation_rate=0.2,
+            stop_on_fixation=False,
+            seed=1,
+        )
+        self.assertIs(iter(tp), tp)
+        for _, process in zip(range(10), tp):
+            self.assertIs(process, tp)
+        self.assertEqual(len(tp), 11)
+
+    def test_select_with_zero_fitnesses(self):
+        """If every fitness is 0, types are selected proportionally to their
+        counts."""
+        for mode in ("bd", "db"):
+            tp = axl.TypeMoranProcess(
+                self.players, payoffs=[[0, 0], [0, 0]], mode=mode, seed=2
+            )
+            self.assertTrue(np.array_equal(tp.fitnesses(), [0, 0]))
+            selected = Counter(tp._select(np.zeros(2)) for _ in range(300))
+            self.assertEqual(set(selected), {0, 1})
+            self.assertGreater(selected[1], selected[0])
+            populations = tp.play()
+            self.assertTrue(tp.fixated)
+            for population in populations:
+                self.assertEqual(sum(population.values()), 3)
+
+    def test_seeding_equality(self):
+        populations = []
+        for _ in range(2):
+            tp = axl.TypeMoranProcess(
+                [axl.Cooperator(), axl.Defector()] * 5,
+                payoffs=[[3, 0], [5, 1]],
+                mode="db",
+                seed=3,
+            )
+            populations.append(tp.play())
+        self.assertEqual(populations[0], populations[1])
+
+    def test_mutation(self):
+        tp = axl.TypeMoranProcess(
+            self.players, payoffs=[[3, 0], [5, 1]], mutation_rate=1, seed=2
+        )
+        with self.assertRaises(ValueError):
+            tp.play()
+        for _ in range(10):
+            next(tp)
+        self.assertEqual(len(tp), 11)
+        self.assertFalse(tp.fixated)
+
+    def test_fixation_probability_neutral(self):
+        payoffs = [[1, 1], [1, 1]]
+        for mode, initial_mutants in itertools.product(("bd", "db"), (1, 3)):
+            self.assertAlmostEqual(
+                axl.fixation_probability(
+                    payoffs, 5, initial_mutants=initial_mutants, mode=mode
+                ),
+                initial_mutants / 5,
+            )
+
+    def test_fixation_probability_constant_fitness(self):
+        # The fitness of a mutant relative to a resident is r.
+        r, N = 2, 6
+        payoffs = [[r, r], [1, 1]]
+        self.assertAlmostEqual(
+            axl.fixation_probability(payoffs, N),
+            (1 - 1 / r) / (1 - 1 / r**N),
+        )
+
+    def test_fixation_probability_zero_fitness(self):
+        # A Cooperator mutant among Defectors has no fitness.
+        for mode in ("bd", "db"):
+            self.assertEqual(
+                axl.fixation_probability([[3, 0], [5, 1]], 4, mode=mode), 0
+            )
+        # A Cooperator resident among Defectors has no fitness, so the
+        # Defectors fixate from N - 1 mutants.
+        payoffs = [[1, 5], [0, 3]]
+        for mode in ("bd", "db"):
+            self.assertEqual(
+                axl.fixation_probability(
+                    payoffs, 4, initial_mutants=3, mode=mode
+                ),
+                1,
+            )
+        # With three individuals, one mutant fixates once it is not
+        # replaced: T-(1) / T+(1) = 3 / 10.
+        self.assertAlmostEqual(
+            axl.fixation_probability(payoffs, 3), 1 / (1 + 3 / 10)
+        )
+        # Without any fitness, individuals reproduce proportionally to their
+        # counts, as in a neutral process.
+        for mode in ("bd", "db"):
+            self.assertAlmostEqual(
+                axl.fixation_probability([[0, 0], [0, 0]], 5, mode=mode), 1 / 5
+            )
+
+    def test_fixation_probability_errors(self):
+        with self.assertRaises(ValueError):
+            axl.fixation_probability([[1, 1], [1, 1]], 5, mode="bdb")
+        with self.assertRaises(ValueError):
+            axl.fixation_probability([[1, 1], [1, 1]], 5, initial_mutants=5)
+
+    def test_fixation_probabilities(self):
+        players = [axl.TitForTat()] * 2 + [axl.Defector()] * 4
+        for mode in ("bd", "db"):
+            tp = axl.TypeMoranProcess(
+                players, turns=10, repetitions=1, mode=mode, seed=0
+            )
+            probabilities = tp.fixation_probabilities()
+            self.assertAlmostEqual(sum(probabilities.values()), 1)
+
+            runs = 2000
+            wins = Counter()
+            for _ in range(runs):
+                tp.play()
+                wins[tp.winning_strategy_name] += 1
+                tp.reset()
+            self.assertAlmostEqual(
+                wins["Tit For Tat"] / runs,
+                probabilities["Tit For Tat"],
+                delta=0.05,
+            )
+
+    def test_fixation_probabilities_zero_fitness(self):
+        players = [axl.Cooperator()] + [axl.Defector()] * 3
+        for mode in ("bd", "db"):
+            tp = axl.TypeMoranProcess(
+                players, payoffs=[[3, 0], [5, 1]], mode=mode
+            )
+            self.assertEqual(
+                tp.fixation_probabilities(), {"Cooperator": 0, "Defector": 1}
+            )
+
+    def test_fixation_probabilities_errors(self):
+        tp = axl.TypeMoranProcess(
+            self.players, payoffs=[[3, 0], [5, 1]], mutation_rate=0.1
+        )
+        with self.assertRaises(ValueError):
+            tp.fixation_probabilities()
+
+        players = [axl.Cooperator(), axl.Defector(), axl.Alternator()]
+        tp = axl.TypeMoranProcess(players, payoffs=np.ones((3, 3)))
+        with self.assertRaises(ValueError):
+            tp.fixation_probabilities()
+
+    def test_population_plot(self):
+        tp = axl.TypeMoranProcess(self.players, payoffs=[[3, 0], [5, 1]])
+        tp.play()
+        _, ax = plt.subplots()
+        self.assertEqual(tp.populations_plot(ax=ax), ax)
+        plt.close("all")
@@ -242,6 +242,34 @@ class TestPlot(unittest.TestCase):
         self.assertEqual(axarr[1, 0].get_title(), "dummy title")
         plt.close(fig)
 
+    def test_datasets_with_array_mode(self):
+        array_result_set = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            array_mode=True,
+        )
+        plot = axl.Plot(self.test_result_set)
+        array_plot = axl.Plot(array_result_set)
+        for dataset in [
+            "_boxplot_dataset",
+            "_winplot_dataset",
+            "_sdv_plot_dataset",
+            "_lengthplot_dataset",
+            "_payoff_dataset",
+            "_pdplot_dataset",
+        ]:
+            self.assertEqual(
+                getattr(plot, dataset), getattr(array_plot, dataset)
+            )
+
+        eco = axl.Ecosystem(array_result_set)
+        eco.reproduce(10)
+        fig = array_plot.stackplot(eco)
+        self.assertIsInstance(fig, matplotlib.pyplot.Figure)
+        plt.close(fig)
+
     def test_all_plots(self):
         plot = axl.Plot(self.test_result_set)
         # Test that this method does not crash.
@@ -2,15 +2,16 @@ import csv
 import pathlib
 import unittest
 from collections import Counter
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
-from dask.dataframe.core import DataFrame
+import tqdm
 from hypothesis import given, settings
 from numpy import mean, nanmedian, std
 
 import axelrod as axl
 from axelrod.load_data_ import axl_filename
-from axelrod.result_set import create_counter_dict
 from axelrod.tests.property import prob_end_tournaments, tournaments
 
 C, D = axl.Action.C, axl.Action.D
@@ -283,9 +284,8 @@ class TestResultSet(unittest.TestCase):
         rs = axl.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=True
         )
-        self.assertTrue(rs.progress_bar)
-        self.assertEqual(rs.progress_bar.total, 25)
-        self.assertEqual(rs.progress_bar.n, rs.progress_bar.total)
+        self.assertIsInstance(rs.progress_bar, tqdm.tqdm)
+        self.assertEqual(rs.progress_bar.n, len(pd.read_csv(self.filename)))
 
     def test_match_lengths(self):
         rs = axl.ResultSet(
@@ -728,11 +728,112 @@ class TestResultSet(unittest.TestCase):
         self.assertEqual(ranked_names[0], "Name")
         self.assertEqual(ranked_names[1:], rs.ranked_names)
 
+    def test_results_built_on_first_access(self):
+        with patch(
+            "axelrod.eigen.principal_eigenvector",
+            wraps=axl.eigen.principal_eigenvector,
+        ) as principal_eigenvector:
+            rs = axl.ResultSet(
+                self.filename,
+                self.players,
+                self.repetitions,
+                progress_bar=False,
+            )
+            self.assertEqual(rs.ranked_names, self.expected_ranked_names)
+            principal_eigenvector.assert_not_called()
+
+            rating = rs.eigenmoses_rating
+            self.assertIs(rs.eigenmoses_rating, rating)
+            principal_eigenvector.assert_called_once()
+
+    def test_results_not_built_on_creation(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        for name in ["payoffs", "ranked_names", "eigenjesus_rating"]:
+            self.assertNotIn(name, vars(rs))
+        rs.summarise()
+        self.assertNotIn("payoffs", vars(rs))
+        self.assertEqual(rs.ranking, self.expected_ranking)
+        self.assertIn("ranking", vars(rs))
+
+    def test_array_mode(self):
+        rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            array_mode=True,
+        )
+        n, r = len(self.players), self.repetitions
+        shapes = {
+            "payoffs": (n, n, r),
+            "score_diffs": (n, n, r),
+            "match_lengths": (r, n, n),
+            "wins": (n, r),
+            "scores": (n, r),
+            "normalised_scores": (n, r),
+            "cooperation": (n, n),
+            "state_distribution": (n, n, 4),
+            "normalised_state_distribution": (n, n, 4),
+            "state_to_action_distribution": (n, n, 4, 2),
+            "normalised_state_to_action_distribution": (n, n, 4, 2),
+            "initial_cooperation_rate": (n,),
+            "ranking": (n,),
+            "payoff_matrix": (n, n),
+            "cooperating_rating": (n,),
+            "eigenmoses_rating": (n,),
+        }
+        for name, shape in shapes.items():
+            value = getattr(rs, name)
+            self.assertIsInstance(value, np.ndarray, msg=name)
+            self.assertEqual(value.shape, shape, msg=name)
+
+        np.testing.assert_array_equal(rs.scores, self.expected_scores)
+        np.testing.assert_array_equal(
+            rs.match_lengths, self.expected_match_lengths
+        )
+        np.testing.assert_array_equal(rs.ranking, self.expected_ranking)
+        self.assertEqual(rs.ranked_names, self.expected_ranked_names)
+        states = [(C, C), (C, D), (D, C), (D, D)]
+        for i, player in enumerate(self.expected_state_distribution):
+            for j, counter in enumerate(player):
+                self.assertEqual(
+                    rs.state_distribution[i, j].tolist(),
+                    [counter[state] for state in states],
+                )
+        for i, player in enumerate(
+            self.expected_normalised_state_to_action_distribution
+        ):
+            for j, counter in enumerate(player):
+                self.assertEqual(
+                    rs.normalised_state_to_action_distribution[i, j].tolist(),
+                    [
+                        [counter[(state, action)] for action in (C, D)]
+                        for state in states
+                    ],
+                )
 
-class TestDecorator(unittest.TestCase):
-    def test_update_progress_bar(self):
-        method = lambda x: None
-        self.assertEqual(axl.result_set.update_progress_bar(method)(1), None)
+    def test_array_mode_agrees_with_lists(self):
+        rs = axl.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        array_rs = axl.ResultSet(
+            self.filename,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            array_mode=True,
+        )
+        self.assertEqual(rs, array_rs)
+        self.assertEqual(array_rs, rs)
+        self.assertEqual(rs.summarise(), array_rs.summarise())
+        for i, player in enumerate(rs.payoffs):
+            for j, payoffs in enumerate(player):
+                played = ~np.isnan(array_rs.payoffs[i, j])
+                self.assertEqual(
+                    payoffs, array_rs.payoffs[i, j][played].tolist()
+                )
 
 
 class TestResultSetSpatialStructure(TestResultSet):
@@ -1360,19 +1461,182 @@ class TestSummary(unittest.TestCase):
             self.assertTrue(0 <= player.Initial_C_rate <= 1)
 
 
-class TestCreateCounterDict(unittest.TestCase):
-    """Separate test for a helper function"""
+class TestResultAccumulator(unittest.TestCase):
+    """Check that result sets built in memory match those read from file"""
+
+    filename = str(axl_filename(pathlib.Path("test_outputs/accumulator.npz")))
+
+    def assert_same_attributes(self, in_memory, from_file):
+        for name, value in vars(from_file).items():
+            if name == "_aggregates":
+                for field, array in value._asdict().items():
+                    np.testing.assert_array_equal(
+                        getattr(in_memory._aggregates, field),
+                        array,
+                        err_msg=field,
+                    )
+            elif name not in ("filename", "_accumulator"):
+                self.assertEqual(getattr(in_memory, name), value, msg=name)
+
+    def assert_same_result_sets(self, **tournament_kwargs):
+        players = [
+            axl.Alternator(),
+            axl.TitForTat(),
+            axl.Defector(),
+            axl.Random(),
+            axl.Grudger(),
+        ]
+        results = []
+        for filename in (None, self.filename):
+            tournament = axl.Tournament(
+                players=[player.clone() for player in players],
+                repetitions=3,
+                seed=1,
+                **tournament_kwargs,
+            )
+            results.append(
+                tournament.play(
+                    filename=filename, file_format="npz", progress_bar=False
+                )
+            )
+        in_memory, from_file = results
+
+        self.assertIsNone(in_memory.filename)
+        self.assert_same_attributes(in_memory, from_file)
 
-    def test_basic_use(self):
-        key_map = {"Col 1": "Var 1", "Col 2": "Var 2"}
-        df = pd.DataFrame(
-            {"Col 1": [10, 20, 30], "Col 2": [1, 2, 0]},
-            index=[[5, 6, 7], [1, 2, 3]],
+    def test_fixed_turns(self):
+        self.assert_same_result_sets(turns=10)
+
+    def test_noise(self):
+        self.assert_same_result_sets(turns=10, noise=0.2)
+
+    def test_prob_end(self):
+        self.assert_same_result_sets(prob_end=0.2)
+
+    def test_spatial_with_self_interaction(self):
+        self.assert_same_result_sets(
+            turns=10, edges=[(0, 1), (1, 2), (2, 2), (3, 4), (4, 0)]
         )
-        self.assertEqual(
-            create_counter_dict(df, 6, 2, key_map),
-            Counter({"Var 1": 20, "Var 2": 2}),
+
+    def test_non_integer_game(self):
+        game = axl.Game(r=3.5, s=0.1, t=5.2, p=1)
+        self.assert_same_result_sets(turns=10, noise=0.1, game=game)
+
+    @patch("axelrod.result_set._CHUNK_SIZE", 7)
+    def test_csv_file_read_in_chunks(self):
+        players = [axl.TitForTat(), axl.Random(), axl.Defector()]
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/accumulator.csv"))
+        )
+        results = []
+        for filename in (None, filename):
+            tournament = axl.Tournament(
+                players=[player.clone() for player in players],
+                repetitions=4,
+                turns=10,
+                noise=0.1,
+                seed=2,
+            )
+            results.append(
+                tournament.play(filename=filename, progress_bar=False)
+            )
+        in_memory, from_file = results
+        self.assert_same_attributes(in_memory, from_file)
+
+    def test_add_results(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        tournament = axl.Tournament(players, turns=3, repetitions=2)
+        accumulator = axl.ResultAccumulator(
+            players=[str(player) for player in players], repetitions=2
+        )
+        for chunk in tournament.match_generator.build_match_chunks():
+            accumulator.add_results(tournament._play_matches(chunk))
+
+        rs = axl.ResultSet.from_accumulator(accumulator, progress_bar=True)
+        self.assertEqual(rs.scores, [[0, 0], [15, 15]])
+        self.assertEqual(rs.wins, [[0, 0], [1, 1]])
+        self.assertEqual(rs.match_lengths, [[[3, 3], [3, 3]]] * 2)
+        self.assertEqual(rs.cooperation, [[6, 6], [0, 0]])
+        self.assertEqual(rs.initial_cooperation_count, [2, 0])
+
+    def test_merge(self):
+        players = [
+            axl.Alternator(),
+            axl.TitForTat(),
+            axl.Random(),
+            axl.Grudger(),
+        ]
+        names = [str(player) for player in players]
+        tournament = axl.Tournament(
+            players, turns=10, repetitions=3, noise=0.1, seed=3
+        )
+        # Play the matches in two shards.
+        shards = [axl.ResultAccumulator(names, 3) for _ in range(2)]
+        for index, chunk in enumerate(
+            tournament.match_generator.build_match_chunks()
+        ):
+            shards[index % 2].add_results(tournament._play_matches(chunk))
+        first, second = [
+            axl.ResultSet.from_accumulator(shard, progress_bar=False)
+            for shard in shards
+        ]
+
+        merged = first.merge(second)
+        tournament = axl.Tournament(
+            players, turns=10, repetitions=3, noise=0.1, seed=3
+        )
+        expected = tournament.play(progress_bar=False)
+        self.assertEqual(merged, expected)
+        self.assertEqual(merged.summarise(), expected.summarise())
+        self.assertNotEqual(first, expected)
+
+    def test_concatenate(self):
+        players = [axl.TitForTat(), axl.Random(), axl.Defector()]
+        first, second = [
+            axl.Tournament(
+                players, turns=10, repetitions=repetitions, seed=seed
+            ).play(progress_bar=False, array_mode=True)
+            for repetitions, seed in [(2, 1), (3, 2)]
+        ]
+
+        both = first.concatenate(second)
+        self.assertTrue(both.array_mode)
+        self.assertEqual(both.repetitions, 5)
+        np.testing.assert_array_equal(
+            both.payoffs, np.concatenate([first.payoffs, second.payoffs], 2)
+        )
+        np.testing.assert_array_equal(
+            both.match_lengths,
+            np.concatenate([first.match_lengths, second.match_lengths]),
+        )
+        np.testing.assert_array_equal(
+            both.wins, np.concatenate([first.wins, second.wins], 1)
+        )
+        np.testing.assert_array_equal(
+            both.cooperation, first.cooperation + second.cooperation
+        )
+        np.testing.assert_allclose(
+            both.payoff_matrix,
+            (2 * first.payoff_matrix + 3 * second.payoff_matrix) / 5,
+        )
+
+    def test_combine_different_players_or_repetitions(self):
+        players = [axl.Cooperator(), axl.Defector()]
+        result_sets = [
+            axl.Tournament(players, turns=3, repetitions=repetitions).play(
+                progress_bar=False
+            )
+            for repetitions in (1, 2)
+        ]
+        with self.assertRaises(ValueError):
+            result_sets[0].merge(result_sets[1])
+        result_set = axl.Tournament(players[::-1], turns=3, repetitions=1).play(
+            progress_bar=False
         )
+        with self.assertRaises(ValueError):
+            result_sets[0].merge(result_set)
+        with self.assertRaises(ValueError):
+            result_sets[0].concatenate(result_set)
         self.assertEqual(
-            create_counter_dict(df, 7, 3, key_map), Counter({"Var 1": 30})
+            result_sets[0].concatenate(result_sets[1]).repetitions, 3
         )
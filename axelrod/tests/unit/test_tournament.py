@@ -1,13 +1,15 @@
 """Tests for the main tournament class."""
 
 import io
+import itertools
 import logging
 import os
 import pathlib
 import pickle
 import unittest
 import warnings
-from multiprocessing import Queue, cpu_count
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import Queue, cpu_count, get_context
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -122,6 +124,20 @@ class TestTournament(unittest.TestCase):
         self.assertEqual(tournament.noise, 0.2)
         anonymous_tournament = axl.Tournament(players=self.players)
         self.assertEqual(anonymous_tournament.name, "axelrod")
+        self.assertFalse(anonymous_tournament.match_generator.detect_cycles)
+
+    def test_detect_cycles(self):
+        players = [axl.TitForTat(), axl.Fortress3(), axl.GoByMajority(3)]
+        results = []
+        for detect_cycles in (False, True):
+            tournament = axl.Tournament(
+                players=[player.clone() for player in players],
+                turns=200,
+                repetitions=2,
+                detect_cycles=detect_cycles,
+            )
+            results.append(tournament.play(progress_bar=False, processes=None))
+        self.assertEqual(results[0], results[1])
 
     def test_init_with_match_attributes(self):
         tournament = axl.Tournament(
@@ -199,16 +215,316 @@ class TestTournament(unittest.TestCase):
         self.assertIsNone(self.test_tournament._temp_file_descriptor)
 
         # Temp file creates file descriptor.
-        self.test_tournament.play(filename=None, progress_bar=False)
+        self.test_tournament.play(
+            filename=None, build_results=False, progress_bar=False
+        )
         self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
 
-    def test_play_tempfile_removed(self):
+        # Results are accumulated in memory without a file.
         self.test_tournament.play(filename=None, progress_bar=False)
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+        self.assertIsNone(self.test_tournament.filename)
+
+    def test_play_with_accumulator(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=5,
+            repetitions=2,
+            seed=0,
+        )
+        accumulator = axl.ResultAccumulator(
+            players=[str(p) for p in self.players], repetitions=2
+        )
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            results = tournament.play(
+                progress_bar=False, accumulator=accumulator
+            )
+        self.assertEqual(len(w), 0)
+        self.assertIsNone(results)
+        self.assertIsNone(tournament.filename)
+        self.assertIsNone(tournament._temp_file_descriptor)
+
+        expected = tournament.play(progress_bar=False)
+        self.assertEqual(
+            axl.ResultSet.from_accumulator(
+                accumulator, progress_bar=False
+            ).scores,
+            expected.scores,
+        )
+
+    def test_play_with_array_mode(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=5,
+            repetitions=2,
+            seed=0,
+        )
+        results = tournament.play(progress_bar=False, array_mode=True)
+        self.assertIsInstance(results.payoff_matrix, np.ndarray)
+        self.assertEqual(
+            results.payoffs.shape, (len(self.players), len(self.players), 2)
+        )
+        self.assertEqual(results, tournament.play(progress_bar=False))
+
+    def interrupt_play(self, tournament, chunks, **kwargs):
+        """Plays a tournament which is interrupted after playing the given
+        number of chunks."""
+        play_chunk = axl.tournament._play_chunk
+        played = []
+
+        def interrupted_play_chunk(*args, **kwargs):
+            if len(played) == chunks:
+                raise KeyboardInterrupt
+            played.append(args)
+            return play_chunk(*args, **kwargs)
+
+        with patch("axelrod.tournament._play_chunk", interrupted_play_chunk):
+            with self.assertRaises(KeyboardInterrupt):
+                tournament.play(resume=True, **kwargs)
+
+    def resume_tournament(self, **kwargs):
+        """Returns a new tournament for tests of resuming tournaments, as the
+        seeds of the matches of a tournament are only the same the first time
+        it is played."""
+        return axl.Tournament(
+            players=self.players, game=self.game, turns=5, **kwargs
+        )
+
+    def test_play_resume(self):
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=2, noise=0.1, seed=1)
+        expected = self.resume_tournament(**kwargs).play(
+            filename=self.filename, progress_bar=False
+        )
+        with open(self.filename) as f:
+            expected_rows = f.read()
+
+        self.interrupt_play(
+            self.resume_tournament(**kwargs),
+            chunks=6,
+            filename=filename,
+            progress_bar=False,
+        )
+        with open(filename + ".journal") as f:
+            self.assertEqual(len(f.readlines()), 1 + 6)
+        # Rows written after the last chunk recorded in the journal.
+        with open(filename, "a") as f:
+            f.write("0,1,2\n")
+
+        tournament = self.resume_tournament(**kwargs)
+        RecordedTQDM.reset_record()
+        with patch("tqdm.tqdm", RecordedTQDM):
+            results = tournament.play(filename=filename, resume=True)
+        self.assertEqual(
+            RecordedTQDM.record[0].n, tournament.match_generator.size
+        )
+        self.assertEqual(results, expected)
+        with open(filename) as f:
+            self.assertEqual(f.read(), expected_rows)
+        # The journal is removed once the tournament is complete.
+        self.assertFalse(os.path.exists(filename + ".journal"))
+        self.assertFalse(os.path.exists(str(self.filename) + ".journal"))
+
+    def test_play_resume_with_executor(self):
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=4, noise=0.1, seed=2, balance_chunks=True)
+        expected = self.resume_tournament(**kwargs).play(
+            filename=self.filename, progress_bar=False
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.interrupt_play(
+                self.resume_tournament(**kwargs),
+                chunks=3,
+                filename=filename,
+                progress_bar=False,
+                executor=executor,
+            )
+        # The last entry of the journal was interrupted while written.
+        with open(filename + ".journal", "a") as f:
+            f.write('{"matches": [[[0, ')
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = self.resume_tournament(**kwargs).play(
+                filename=filename,
+                progress_bar=False,
+                executor=executor,
+                resume=True,
+            )
+        self.assertEqual(results, expected)
+
+    def test_play_resume_with_different_chunks(self):
+        """The repetitions of balanced chunks are skipped whichever chunks
+        they were played in."""
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=4, seed=7, balance_chunks=True)
+        expected = self.resume_tournament(**kwargs).play(
+            filename=self.filename, progress_bar=False
+        )
+        self.interrupt_play(
+            self.resume_tournament(**kwargs),
+            chunks=5,
+            filename=filename,
+            progress_bar=False,
+        )
+        player_costs = {str(self.players[0]): 1000}
+        tournament = self.resume_tournament(player_costs=player_costs, **kwargs)
+        self.assertNotEqual(
+            tournament.match_generator._chunk_plan,
+            self.resume_tournament(**kwargs).match_generator._chunk_plan,
+        )
+        results = tournament.play(
+            filename=filename, progress_bar=False, resume=True
+        )
+        df = pd.read_csv(filename)
+        self.assertEqual(len(df), len(pd.read_csv(self.filename)))
+        df = df[df["Player index"] != df["Opponent index"]]
+        self.assertFalse(
+            df.duplicated(
+                ["Player index", "Opponent index", "Repetition"]
+            ).any()
+        )
+        self.assertEqual(results.payoff_matrix, expected.payoff_matrix)
+        self.assertEqual(results.wins, expected.wins)
+
+    def test_play_resume_in_parallel(self):
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=2, seed=3)
+        expected = self.resume_tournament(**kwargs).play(
+            filename=self.filename, progress_bar=False
+        )
+        self.interrupt_play(
+            self.resume_tournament(**kwargs),
+            chunks=4,
+            filename=filename,
+            progress_bar=False,
+        )
+        results = self.resume_tournament(**kwargs).play(
+            filename=filename, processes=2, progress_bar=False, resume=True
+        )
+        self.assertEqual(results.payoff_matrix, expected.payoff_matrix)
+        self.assertEqual(results.wins, expected.wins)
+        self.assertEqual(len(pd.read_csv(filename)), 2 * 15 * 2)
+
+    def test_play_resume_without_journal(self):
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        if os.path.exists(filename + ".journal"):
+            os.remove(filename + ".journal")
+        results = self.resume_tournament(repetitions=2, seed=4).play(
+            filename=filename, progress_bar=False, resume=True
+        )
+        expected = self.resume_tournament(repetitions=2, seed=4).play(
+            progress_bar=False
+        )
+        self.assertEqual(results, expected)
+
+    def test_play_resume_different_tournament(self):
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=2, seed=6)
+        self.interrupt_play(
+            self.resume_tournament(**kwargs),
+            chunks=4,
+            filename=filename,
+            progress_bar=False,
+        )
+        for different_kwargs in (
+            dict(repetitions=3, seed=6),
+            dict(repetitions=2, seed=7),
+            dict(repetitions=2, seed=6, noise=0.1),
+            dict(repetitions=2, seed=6, balance_chunks=True),
+            dict(repetitions=2, seed=6, detect_cycles=True),
+            dict(repetitions=2, seed=6, edges=[(0, 1), (1, 2)]),
+            dict(repetitions=2, seed=6, match_attributes={"length": -1}),
+        ):
+            with self.assertRaises(ValueError):
+                self.resume_tournament(**different_kwargs).play(
+                    filename=filename, progress_bar=False, resume=True
+                )
+        tournament = axl.Tournament(
+            players=self.players, game=axl.Game(r=4), turns=5, **kwargs
+        )
+        with self.assertRaises(ValueError):
+            tournament.play(filename=filename, progress_bar=False, resume=True)
+        with self.assertRaises(ValueError):
+            self.resume_tournament(**kwargs).play(
+                filename=filename,
+                build_results=False,
+                progress_bar=False,
+                resume=True,
+            )
+
+        # Tournaments that are not to be resumed do not write a journal.
+        os.remove(filename + ".journal")
+        with patch("axelrod.tournament.open", wraps=open) as open_:
+            self.resume_tournament(**kwargs).play(
+                filename=filename, progress_bar=False
+            )
+        self.assertEqual(open_.call_count, 1)
+        self.assertFalse(os.path.exists(filename + ".journal"))
+
+    def test_play_parallel_with_spawned_processes(self):
+        """The tournament is pickled to be sent to spawned sub-processes."""
+        filename = str(
+            axl_filename(pathlib.Path("test_outputs/test_resume.csv"))
+        )
+        kwargs = dict(repetitions=2, seed=1)
+        expected = self.resume_tournament(**kwargs).play(progress_bar=False)
+        context = get_context("spawn")
+        with patch("axelrod.tournament.Process", context.Process), patch(
+            "axelrod.tournament.Queue", context.Queue
+        ):
+            for resume in (False, True):
+                results = self.resume_tournament(**kwargs).play(
+                    filename=filename,
+                    processes=2,
+                    progress_bar=False,
+                    resume=resume,
+                )
+                self.assertEqual(results.payoff_matrix, expected.payoff_matrix)
+                self.assertEqual(results.wins, expected.wins)
+
+    def test_play_resume_invalid(self):
+        tournament = axl.Tournament(players=self.players, turns=5, seed=5)
+        with self.assertRaises(ValueError):
+            tournament.play(progress_bar=False, resume=True)
+        with self.assertRaises(ValueError):
+            tournament.play(
+                filename=self.filename,
+                file_format="npz",
+                progress_bar=False,
+                resume=True,
+            )
+        tournament = axl.Tournament(players=self.players, turns=5)
+        with self.assertRaises(ValueError):
+            tournament.play(
+                filename=self.filename, progress_bar=False, resume=True
+            )
+
+    def test_play_tempfile_removed(self):
+        self.test_tournament.play(
+            filename=None, build_results=False, progress_bar=False
+        )
 
         self.assertFalse(os.path.isfile(self.test_tournament.filename))
 
     def test_play_resets_filename_and_temp_file_descriptor_each_time(self):
-        self.test_tournament.play(progress_bar=False)
+        self.test_tournament.play(build_results=False, progress_bar=False)
         self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
         self.assertIsInstance(self.test_tournament.filename, str)
         old_filename = self.test_tournament.filename
@@ -218,12 +534,16 @@ class TestTournament(unittest.TestCase):
         self.assertEqual(self.test_tournament.filename, self.filename)
         self.assertNotEqual(old_filename, self.test_tournament.filename)
 
-        self.test_tournament.play(progress_bar=False)
+        self.test_tournament.play(build_results=False, progress_bar=False)
         self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
         self.assertIsInstance(self.test_tournament.filename, str)
         self.assertNotEqual(old_filename, self.test_tournament.filename)
         self.assertNotEqual(self.test_tournament.filename, self.filename)
 
+        self.test_tournament.play(progress_bar=False)
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+        self.assertIsNone(self.test_tournament.filename)
+
     def test_get_file_objects_no_filename(self):
         file, writer = self.test_tournament._get_file_objects()
         self.assertIsNone(file)
@@ -339,7 +659,7 @@ class TestTournament(unittest.TestCase):
         results = tournament.play()
         self.assertIsInstance(results, axl.ResultSet)
         # Check that progress bar was created, updated and closed.
-        self.assertEqual(len(RecordedTQDM.record), 2)
+        self.assertEqual(len(RecordedTQDM.record), 1)
         play_pbar = RecordedTQDM.record[0]
         self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
         # Check all progress bars are closed.
@@ -348,7 +668,7 @@ class TestTournament(unittest.TestCase):
         RecordedTQDM.reset_record()
         results = tournament.play(progress_bar=True)
         self.assertIsInstance(results, axl.ResultSet)
-        self.assertEqual(len(RecordedTQDM.record), 2)
+        self.assertEqual(len(RecordedTQDM.record), 1)
         play_pbar = RecordedTQDM.record[0]
         self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
 
@@ -362,6 +682,16 @@ class TestTournament(unittest.TestCase):
         play_pbar = RecordedTQDM.record[0]
         self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
 
+        # Test reading the results from file
+        RecordedTQDM.reset_record()
+        results = tournament.play(progress_bar=True, filename=self.filename)
+        self.assertIsInstance(results, axl.ResultSet)
+        self.assertEqual(len(RecordedTQDM.record), 2)
+        play_pbar = RecordedTQDM.record[0]
+        self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
+        self.assertEqual(RecordedTQDM.record[1].desc, "Analysing")
+        self.assertTrue(RecordedTQDM.record[1].disable)
+
     @patch("tqdm.tqdm", RecordedTQDM)
     def test_progress_bar_play_parallel(self):
         """Test that tournament plays when asking for progress bar for parallel
@@ -385,7 +715,7 @@ class TestTournament(unittest.TestCase):
         results = tournament.play(progress_bar=True, processes=2)
         self.assertIsInstance(results, axl.ResultSet)
 
-        self.assertEqual(len(RecordedTQDM.record), 2)
+        self.assertEqual(len(RecordedTQDM.record), 1)
         play_pbar = RecordedTQDM.record[0]
         self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
 
@@ -394,7 +724,7 @@ class TestTournament(unittest.TestCase):
         results = tournament.play(processes=2)
         self.assertIsInstance(results, axl.ResultSet)
 
-        self.assertEqual(len(RecordedTQDM.record), 2)
+        self.assertEqual(len(RecordedTQDM.record), 1)
         play_pbar = RecordedTQDM.record[0]
         self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
 
@@ -525,6 +855,162 @@ class TestTournament(unittest.TestCase):
         calls = tournament._write_interactions_to_file.call_args_list
         self.assertEqual(len(calls), 15)
 
+    def test_run_executor(self):
+        tournament = axl.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=axl.DEFAULT_TURNS,
+            repetitions=self.test_repetitions,
+        )
+        tournament._write_interactions_to_file = MagicMock(
+            name="_write_interactions_to_file"
+        )
+        # Only two chunks are submitted before the first is processed.
+        with patch("axelrod.tournament._MAX_PENDING_CHUNKS", 2):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                self.assertTrue(tournament._run_executor(executor))
+
+        # Get the calls made to write_interactions
+        calls = tournament._write_interactions_to_file.call_args_list
+        self.assertEqual(len(calls), 15)
+
+    def test_create_executor_with_default_processes(self):
+        with self.test_tournament.create_executor() as executor:
+            self.assertIsInstance(executor, ProcessPoolExecutor)
+            self.assertEqual(
+                executor._max_workers,
+                self.test_tournament._n_workers(processes=cpu_count()),
+            )
+
+    def test_initialise_worker(self):
+        """The players are stored in the module of a worker, which is run
+        here in the same process."""
+        with patch("axelrod.tournament._worker_players", None):
+            axl.tournament._initialise_worker(self.players)
+            self.assertIs(axl.tournament._worker_players, self.players)
+        self.assertIsNone(axl.tournament._worker_players)
+
+    def test_play_chunk_with_worker_players(self):
+        """Chunks sent to the workers of a created executor are played with
+        the players the workers were initialised with."""
+        tournament = axl.Tournament(
+            players=self.players, turns=5, repetitions=2, seed=1
+        )
+        chunk = next(tournament.match_generator.build_match_chunks())
+        expected = axl.tournament._play_chunk(
+            chunk, tournament._chunk_players(chunk), self.game
+        )
+        with patch("axelrod.tournament._worker_players", self.players):
+            self.assertEqual(
+                axl.tournament._play_chunk(chunk, None, self.game), expected
+            )
+
+    def test_play_with_executor(self):
+        players = [axl.TitForTat(), axl.Random(), axl.Alternator()]
+        expected = axl.Tournament(
+            players=[player.clone() for player in players],
+            turns=10,
+            repetitions=2,
+            noise=0.1,
+            seed=4,
+        ).play(progress_bar=False)
+
+        executors = (ThreadPoolExecutor, ProcessPoolExecutor)
+        for executor_class, filename in itertools.product(
+            executors, (None, self.filename)
+        ):
+            tournament = axl.Tournament(
+                players=[player.clone() for player in players],
+                turns=10,
+                repetitions=2,
+                noise=0.1,
+                seed=4,
+            )
+            with executor_class(max_workers=2) as executor:
+                results = tournament.play(
+                    progress_bar=False, executor=executor, filename=filename
+                )
+            self.assertEqual(results.scores, expected.scores)
+            self.assertEqual(results.wins, expected.wins)
+            self.assertEqual(results.cooperation, expected.cooperation)
+
+    def test_play_with_created_executor(self):
+        tournaments = [
+            axl.Tournament(
+                players=[axl.TitForTat(), axl.Random(), axl.Alternator()],
+                turns=10,
+                repetitions=2,
+                noise=0.1,
+                seed=4,
+            )
+            for _ in range(3)
+        ]
+        expected = tournaments[0].play(progress_bar=False)
+
+        # The executor is reused for a tournament with other players.
+        with tournaments[1].create_executor(processes=2) as executor:
+            for tournament in tournaments[1:]:
+                results = tournament.play(progress_bar=False, executor=executor)
+                self.assertEqual(results, expected)
+
+    def test_play_with_executor_and_processes(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValueError):
+                self.test_tournament.play(
+                    progress_bar=False, executor=executor, processes=2
+                )
+
+    def test_balanced_chunks_do_not_change_results(self):
+        players = [axl.TitForTat(), axl.Random(), axl.Alternator()]
+
+        def play(player_costs=None, **kwargs):
+            tournament = axl.Tournament(
+                players=[player.clone() for player in players],
+                turns=10,
+                repetitions=4,
+                noise=0.1,
+                seed=4,
+                balance_chunks=True,
+                player_costs=player_costs,
+            )
+            return tournament.play(progress_bar=False, **kwargs)
+
+        expected = play()
+        player_costs = {str(players[1]): 20}
+        for kwargs in ({}, {"processes": 2}, {"filename": self.filename}):
+            results = play(player_costs=player_costs, **kwargs)
+            self.assertEqual(results.scores, expected.scores)
+            self.assertEqual(results.wins, expected.wins)
+            self.assertEqual(results.payoffs, expected.payoffs)
+            self.assertEqual(results.cooperation, expected.cooperation)
+
+    def test_play_with_persistent_deterministic_cache(self):
+        cache_file = str(
+            axl_filename(pathlib.Path("test_outputs/tournament_cache.sqlite"))
+        )
+        players = [axl.TitForTat(), axl.Alternator(), axl.BackStabber()]
+        expected = axl.Tournament(
+            players=players, turns=20, repetitions=2
+        ).play(progress_bar=False)
+
+        cache = axl.PersistentDeterministicCache(cache_file)
+        for turns, processes in ((10, None), (20, 2), (20, None)):
+            tournament = axl.Tournament(
+                players=players,
+                turns=turns,
+                repetitions=2,
+                deterministic_cache=cache,
+            )
+            results = tournament.play(progress_bar=False, processes=processes)
+        self.assertEqual(results, expected)
+        self.assertEqual(len(cache[(players[0], players[1])]), 20)
+
+        cache.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(cache_file + suffix):
+                os.remove(cache_file + suffix)
+
     def test_n_workers(self):
         max_processes = cpu_count()
 
@@ -607,7 +1093,8 @@ class TestTournament(unittest.TestCase):
         done_queue = Queue()
         tournament._worker(work_queue, done_queue)
         for r in range(count):
-            new_matches = done_queue.get()
+            chunk_key, new_matches = done_queue.get()
+            self.assertIsInstance(chunk_key, list)
             for index_pair, matches in new_matches.items():
                 self.assertIsInstance(index_pair, tuple)
                 self.assertEqual(len(matches), self.test_repetitions)
@@ -625,6 +1112,52 @@ class TestTournament(unittest.TestCase):
         results = tournament.play(progress_bar=False)
         self.assertIsInstance(results, axl.ResultSet)
 
+    def test_binary_file_format(self):
+        results = []
+        for file_format in ("csv", "npz"):
+            tournament = axl.Tournament(
+                name=self.test_name,
+                players=self.players,
+                game=self.game,
+                turns=20,
+                noise=0.1,
+                repetitions=self.test_repetitions,
+                seed=0,
+            )
+            results.append(
+                tournament.play(
+                    filename=self.filename,
+                    progress_bar=False,
+                    file_format=file_format,
+                )
+            )
+            self.assertEqual(tournament.num_interactions, 75)
+            self.assertEqual(
+                axl.interaction_utils.is_binary_interactions_file(
+                    self.filename
+                ),
+                file_format == "npz",
+            )
+        self.assertEqual(results[0].wins, results[1].wins)
+        self.assertEqual(results[0].scores, results[1].scores)
+        self.assertEqual(results[0].cooperation, results[1].cooperation)
+        self.assertEqual(results[0].ranked_names, results[1].ranked_names)
+        np.testing.assert_allclose(
+            results[0].payoff_matrix, results[1].payoff_matrix
+        )
+
+        result_set = axl.ResultSet(
+            self.filename,
+            [str(player) for player in self.players],
+            self.test_repetitions,
+            progress_bar=False,
+        )
+        self.assertEqual(result_set, results[1])
+
+    def test_unknown_file_format(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(progress_bar=False, file_format="xls")
+
     def test_no_build_result_set(self):
         tournament = axl.Tournament(
             name=self.test_name,
@@ -634,17 +1167,26 @@ class TestTournament(unittest.TestCase):
             repetitions=self.test_repetitions,
         )
 
-        tournament._calculate_results = MagicMock(name="_calculate_results")
-        # Mocking this as it is called by play
-        self.assertIsNone(
-            tournament.play(
-                filename=self.filename, progress_bar=False, build_results=False
+        with patch(
+            "axelrod.tournament._calculate_results"
+        ) as calculate_results:
+            self.assertIsNone(
+                tournament.play(
+                    filename=self.filename,
+                    progress_bar=False,
+                    build_results=False,
+                )
             )
-        )
+        calculate_results.assert_not_called()
 
-        # Get the calls made to write_interactions
-        calls = tournament._calculate_results.call_args_list
-        self.assertEqual(len(calls), 0)
+        with patch(
+            "axelrod.tournament._calculate_results",
+            wraps=axl.tournament._calculate_results,
+        ) as calculate_results:
+            tournament.play(filename=self.filename, progress_bar=False)
+        self.assertEqual(
+            calculate_results.call_count, 15 * self.test_repetitions
+        )
 
     @given(turns=integers(min_value=1, max_value=200))
     @settings(max_examples=5, deadline=None)
@@ -682,10 +1224,11 @@ class TestTournament(unittest.TestCase):
             for plays in inter:
                 # Check that have the expected number of repetitions
                 self.assertEqual(len(plays), self.test_repetitions)
-                for repetition in plays:
-                    actions, results = repetition
+                for index, repetition in enumerate(plays):
+                    actions, results, repetition_index = repetition
                     self.assertEqual(len(actions), turns)
                     self.assertEqual(len(results), 10)
+                    self.assertEqual(repetition_index, index)
 
         # Check that matches no longer exist
         self.assertEqual((len(list(chunk_generator))), 0)
@@ -1,11 +1,20 @@
 import csv
+import json
 import logging
 import os
 import warnings
-from collections import defaultdict
-from multiprocessing import Process, Queue, cpu_count
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import (
+    Process,
+    Queue,
+    cpu_count,
+    get_all_start_methods,
+    get_context,
+)
 from tempfile import mkstemp
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, TextIO, Tuple
 
 import tqdm
 
@@ -14,10 +23,11 @@ from axelrod import DEFAULT_TURNS
 from axelrod.action import Action, actions_to_str
 from axelrod.player import Player
 
+from .deterministic_cache import DeterministicCache
 from .game import Game
 from .match import Match
 from .match_generator import MatchGenerator
-from .result_set import ResultSet
+from .result_set import ResultAccumulator, ResultSet
 
 C, D = Action.C, Action.D
 
@@ -35,6 +45,10 @@ class Tournament(object):
         edges: List[Tuple] = None,
         match_attributes: dict = None,
         seed: int = None,
+        detect_cycles: bool = False,
+        balance_chunks: bool = False,
+        player_costs: dict = None,
+        deterministic_cache: DeterministicCache = None,
     ) -> None:
         """
         Parameters
@@ -62,6 +76,20 @@ class Tournament(object):
         seed : integer
             The seed for random numbers that will be generated for this
             tournament, thus allowing future runs to exactly reproduce results.
+        detect_cycles : bool
+            Whether matches should stop calling the players' strategies once
+            a cycle of deterministic play is detected.
+        balance_chunks : bool
+            Whether to split the matches into chunks of similar cost, which
+            balances the load of parallel processing. Each repetition of a
+            match then has its own seed.
+        player_costs : dict
+            Mapping player names to their relative cost per turn, used to
+            balance chunks. By default this is estimated from the classifiers.
+        deterministic_cache : axelrod.DeterministicCache
+            A cache of resulting actions for deterministic matches shared by
+            all matches. An axelrod.PersistentDeterministicCache can be reused
+            across tournaments and processes.
         """
         if game is None:
             self.game = Game()
@@ -90,12 +118,30 @@ class Tournament(object):
             edges=edges,
             match_attributes=match_attributes,
             seed=self.seed,
+            detect_cycles=detect_cycles,
+            balance_chunks=balance_chunks,
+            player_costs=player_costs,
+            deterministic_cache=deterministic_cache,
         )
         self._logger = logging.getLogger(__name__)
 
         self.use_progress_bar = True
         self.filename = None  # type: Optional[str]
+        self.file_format = "csv"
         self._temp_file_descriptor = None  # type: Optional[int]
+        self._accumulator = None  # type: Optional[ResultAccumulator]
+        self._journal = None  # type: Optional[TextIO]
+        self._completed_matches = set()  # type: Set[str]
+        self._recorded_chunks = 0
+        self._resume_position = None  # type: Optional[int]
+
+    def __getstate__(self):
+        """Drops the open journal, which cannot be pickled, when the
+        tournament is sent to the sub-processes of `_run_parallel`. The
+        journal is only written to by the parent process."""
+        state = self.__dict__.copy()
+        state["_journal"] = None
+        return state
 
     def setup_output(self, filename=None):
         """assign/create `filename` to `self`. If file should be deleted once
@@ -113,6 +159,11 @@ class Tournament(object):
         filename: str = None,
         processes: int = None,
         progress_bar: bool = True,
+        file_format: str = "csv",
+        executor: Executor = None,
+        accumulator=None,
+        array_mode: bool = False,
+        resume: bool = False,
     ) -> ResultSet:
         """
         Plays the tournament and passes the results to the ResultSet class
@@ -127,36 +178,118 @@ class Tournament(object):
             The number of processes to be used for parallel processing
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        file_format : string
+            The format of the output file: either "csv" or "npz", a binary
+            NumPy format with bit-packed actions which is faster to write and
+            read and much smaller.
+        executor : concurrent.futures.Executor
+            An executor used to play the matches in parallel, for example a
+            `concurrent.futures.ProcessPoolExecutor` or one created with
+            `Tournament.create_executor`. Executors can be reused across
+            tournaments. Cannot be used with `processes`.
+        accumulator : object
+            An object with an `add_results` method, such as a
+            `ResultAccumulator`, which is passed the interactions of each
+            chunk of matches as they are played, as returned by
+            `_play_matches`. If given, no result set is built: the results of
+            the matches are only calculated, and passed to the accumulator,
+            if `build_results` is True.
+        array_mode : bool
+            Whether the attributes of the result set are NumPy arrays rather
+            than lists.
+        resume : bool
+            Whether the tournament can be resumed if it is interrupted, and
+            whether to resume a tournament that was interrupted. The matches
+            written to the csv file are recorded in a journal,
+            `filename + ".journal"`, which is flushed after each chunk of
+            matches and removed once the tournament is complete. The matches
+            recorded by an interrupted tournament are not played again: the
+            other matches are appended to the file, giving the same file as a
+            tournament that was not interrupted. Requires a filename and a
+            seed, and the parameters of the interrupted tournament.
 
         Returns
         -------
         axelrod.ResultSet
         """
+        if file_format not in ("csv", "npz"):
+            raise ValueError("Unknown file format: {}".format(file_format))
+        if executor is not None and processes is not None:
+            raise ValueError("Only one of processes and executor can be given.")
+        if resume and filename is None:
+            raise ValueError("A filename is required to resume a tournament.")
+        if resume and file_format != "csv":
+            raise ValueError("Only tournaments written to csv can be resumed.")
+        if resume and self.seed is None:
+            raise ValueError("A seed is required to resume a tournament.")
+
         self.num_interactions = 0
 
         self.use_progress_bar = progress_bar
-
-        self.setup_output(filename)
-
-        if not build_results and not filename:
+        self.file_format = file_format
+
+        # Without an output file, results are accumulated in memory as
+        # matches are played rather than written to a temporary file.
+        self._accumulator = accumulator
+        if filename is None and (build_results or accumulator is not None):
+            self.filename = None
+            self._temp_file_descriptor = None
+            if accumulator is None:
+                self._accumulator = ResultAccumulator(
+                    players=[str(p) for p in self.players],
+                    repetitions=self.repetitions,
+                )
+        else:
+            self.setup_output(filename)
+        self._completed_matches = set()
+        self._recorded_chunks = 0
+        self._resume_position = None
+        # The journal costs a write and flush per chunk, so it is only kept
+        # when the tournament is to be resumed.
+        if resume:
+            self._open_journal(resume, build_results=build_results)
+
+        if not build_results and not filename and accumulator is None:
             warnings.warn(
                 "Tournament results will not be accessible since "
                 "build_results=False and no filename was supplied."
             )
 
-        if processes is None:
-            self._run_serial(build_results=build_results)
-        else:
-            self._run_parallel(build_results=build_results, processes=processes)
+        try:
+            if executor is not None:
+                self._run_executor(executor, build_results=build_results)
+            elif processes is None:
+                self._run_serial(build_results=build_results)
+            else:
+                self._run_parallel(
+                    build_results=build_results, processes=processes
+                )
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+        # The journal is only kept to resume an interrupted tournament.
+        if resume:
+            os.remove(str(self.filename) + ".journal")
 
         result_set = None
-        if build_results:
+        if accumulator is not None:
+            self._accumulator = None
+        elif self._accumulator is not None:
+            result_set = ResultSet.from_accumulator(
+                self._accumulator,
+                progress_bar=progress_bar,
+                array_mode=array_mode,
+            )
+            self._accumulator = None
+        elif build_results:
             result_set = ResultSet(
                 filename=self.filename,
                 players=[str(p) for p in self.players],
                 repetitions=self.repetitions,
                 processes=processes,
                 progress_bar=progress_bar,
+                array_mode=array_mode,
             )
         if self._temp_file_descriptor is not None:
             assert self.filename is not None
@@ -168,7 +301,7 @@ class Tournament(object):
     def _run_serial(self, build_results: bool = True) -> bool:
         """Run all matches in serial."""
 
-        chunks = self.match_generator.build_match_chunks()
+        chunks = self._build_match_chunks()
 
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
@@ -176,6 +309,7 @@ class Tournament(object):
         for chunk in chunks:
             results = self._play_matches(chunk, build_results=build_results)
             self._write_interactions_to_file(results, writer=writer)
+            self._record_chunk(_match_keys(chunk), out_file)
 
             if self.use_progress_bar:
                 progress_bar.update(1)
@@ -184,15 +318,100 @@ class Tournament(object):
 
         return True
 
+    def create_executor(self, processes: int = None) -> Executor:
+        """
+        Creates a pool of processes, forked where possible, to pass to `play`.
+        Each worker receives the players once, when it starts, so that only
+        the match parameters are sent for each chunk of matches.
+
+        Parameters
+        ----------
+        processes : integer
+            The number of processes, defaults to the number of CPUs.
+
+        Returns
+        -------
+        concurrent.futures.ProcessPoolExecutor
+        """
+        if processes is None:
+            processes = cpu_count()
+        context = None
+        if "fork" in get_all_start_methods():
+            context = get_context("fork")
+        executor = ProcessPoolExecutor(
+            max_workers=self._n_workers(processes=processes),
+            mp_context=context,
+            initializer=_initialise_worker,
+            initargs=(self.players,),
+        )
+        _executor_players[executor] = self.players
+        return executor
+
+    def _run_executor(
+        self, executor: Executor, build_results: bool = True
+    ) -> bool:
+        """
+        Run all matches with an executor.
+
+        Workers only receive the chunk, the game and, unless they were
+        initialised with them, the two players of the chunk. The interactions
+        are only sent back if they are written to file.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+            The executor to submit chunks of matches to
+        build_results : bool
+            whether or not to build a results set
+        """
+        players_in_workers = _executor_players.get(executor) is self.players
+        # Only the accumulator building the result set does not use the
+        # actions.
+        keep_interactions = self.filename is not None or not isinstance(
+            self._accumulator, (ResultAccumulator, type(None))
+        )
+
+        out_file, writer = self._get_file_objects(build_results)
+        progress_bar = self._get_progress_bar()
+
+        def process(chunk_and_future):
+            chunk, future = chunk_and_future
+            self._write_interactions_to_file(future.result(), writer)
+            self._record_chunk(_match_keys(chunk), out_file)
+            if self.use_progress_bar:
+                progress_bar.update(1)
+
+        # Results are processed in the order the chunks were submitted so
+        # that they do not depend on the scheduling of the workers.
+        pending = deque()  # type: deque
+        for chunk in self._build_match_chunks():
+            players = None
+            if not players_in_workers:
+                players = self._chunk_players(chunk)
+            future = executor.submit(
+                _play_chunk,
+                chunk,
+                players,
+                self.game,
+                build_results,
+                keep_interactions,
+            )
+            pending.append((chunk, future))
+            # Limit the results held in memory.
+            if len(pending) >= _MAX_PENDING_CHUNKS:
+                process(pending.popleft())
+        while pending:
+            process(pending.popleft())
+
+        _close_objects(out_file, progress_bar)
+        return True
+
     def _get_file_objects(self, build_results=True):
         """Returns the file object and writer for writing results or
         (None, None) if self.filename is None"""
         file_obj = None
         writer = None
         if self.filename is not None:
-            file_obj = open(self.filename, "w")
-            writer = csv.writer(file_obj, lineterminator="\n")
-
             header = [
                 "Interaction index",
                 "Player index",
@@ -229,21 +448,151 @@ class Tournament(object):
                     ]
                 )
 
-            writer.writerow(header)
+            if self.file_format == "npz":
+                writer = iu.BinaryInteractionsWriter(self.filename, header)
+                return writer, writer
+
+            if self._resume_position is not None:
+                # Discard rows written after the last recorded chunk.
+                os.truncate(self.filename, self._resume_position)
+                file_obj = open(self.filename, "a")
+                writer = csv.writer(file_obj, lineterminator="\n")
+            else:
+                file_obj = open(self.filename, "w")
+                writer = csv.writer(file_obj, lineterminator="\n")
+                writer.writerow(header)
         return file_obj, writer
 
+    def _open_journal(self, resume=False, build_results=True):
+        """
+        Opens the journal recording the chunks of matches written to file. Its
+        first line holds the parameters of the tournament that change the
+        file. If resuming, reads the matches recorded by an interrupted
+        tournament and the position of the end of the last chunk in the file.
+
+        Parameters
+        ----------
+        resume : bool
+            Whether to keep the chunks recorded in an existing journal
+        build_results : bool
+            whether or not the results of the matches are written to file
+        """
+        journal_filename = str(self.filename) + ".journal"
+        header = {
+            "seed": int(self.seed),
+            "players": [str(player) for player in self.players],
+            "repetitions": self.repetitions,
+            "turns": self.turns,
+            "prob_end": self.prob_end,
+            "noise": self.noise,
+            "game": repr(self.game),
+            "edges": repr(self.edges),
+            "match_attributes": repr(self.match_generator.match_attributes),
+            "detect_cycles": self.match_generator.detect_cycles,
+            "balance_chunks": self.match_generator.balance_chunks,
+            "build_results": build_results,
+        }
+        entries = []
+        if resume and os.path.exists(journal_filename):
+            with open(journal_filename, "r") as journal:
+                for line in journal:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # The last line is incomplete if the tournament was
+                        # interrupted while writing it.
+                        break
+            if entries and entries.pop(0) != json.loads(json.dumps(header)):
+                raise ValueError(
+                    "{} was written by a different tournament.".format(
+                        self.filename
+                    )
+                )
+
+        self._completed_matches = {
+            json.dumps(key) for entry in entries for key in entry["matches"]
+        }
+        self._recorded_chunks = len(entries)
+        if entries:
+            self._resume_position = entries[-1]["position"]
+            self.num_interactions = entries[-1]["interactions"]
+
+        self._journal = open(journal_filename, "w")
+        for entry in [header] + entries:
+            self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+
+    def _build_match_chunks(self):
+        """Yields the chunks of matches of the match generator without the
+        matches recorded as completed in the journal. The repetitions of
+        balanced chunks are recorded separately, so that they are skipped
+        whichever chunks they were played in."""
+        for chunk in self.match_generator.build_match_chunks():
+            if not self._completed_matches:
+                yield chunk
+            elif not isinstance(chunk, list):
+                if json.dumps(_match_keys(chunk)[0]) not in (
+                    self._completed_matches
+                ):
+                    yield chunk
+            else:
+                tasks = []
+                for index_pair, params, repetitions, seeds in chunk:
+                    remaining = [
+                        (repetition, seed)
+                        for repetition, seed in zip(repetitions, seeds)
+                        if json.dumps(_match_key(index_pair, seed, repetition))
+                        not in self._completed_matches
+                    ]
+                    if remaining:
+                        repetitions, seeds = map(list, zip(*remaining))
+                        tasks.append((index_pair, params, repetitions, seeds))
+                if tasks:
+                    yield tasks
+
+    def _record_chunk(self, match_keys, file_obj):
+        """
+        Records in the journal that the interactions of a chunk were written
+        to file, once they are flushed to it.
+
+        Parameters
+        ----------
+        match_keys : list
+            The keys of the matches of the chunk, as returned by
+            `_match_keys`
+        file_obj : file
+            The file the interactions are written to
+        """
+        if self._journal is None:
+            return
+        file_obj.flush()
+        entry = {
+            "matches": match_keys,
+            "interactions": self.num_interactions,
+            "position": file_obj.tell(),
+        }
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+
     def _get_progress_bar(self):
         if self.use_progress_bar:
             return tqdm.tqdm(
-                total=self.match_generator.size, desc="Playing matches"
+                total=self.match_generator.size,
+                initial=self._recorded_chunks,
+                desc="Playing matches",
             )
         return None
 
     def _write_interactions_to_file(self, results, writer):
-        """Write the interactions to csv."""
+        """Write the interactions to file and accumulate the results in memory
+        if no file is written."""
+        if self._accumulator is not None:
+            self._accumulator.add_results(results)
+        if writer is None:
+            self.num_interactions += sum(map(len, results.values()))
+            return
         for index_pair, interactions in results.items():
-            repetition = 0
-            for interaction, results in interactions:
+            for interaction, results, repetition in interactions:
 
                 if results is not None:
                     (
@@ -299,7 +648,6 @@ class Tournament(object):
                         )
 
                     writer.writerow(row)
-                repetition += 1
                 self.num_interactions += 1
 
     def _run_parallel(
@@ -321,7 +669,7 @@ class Tournament(object):
         done_queue = Queue()  # type: Queue
         workers = self._n_workers(processes=processes)
 
-        chunks = self.match_generator.build_match_chunks()
+        chunks = self._build_match_chunks()
         for chunk in chunks:
             work_queue.put(chunk)
 
@@ -398,7 +746,9 @@ class Tournament(object):
             if results == "STOP":
                 stops += 1
             else:
+                match_keys, results = results
                 self._write_interactions_to_file(results, writer)
+                self._record_chunk(match_keys, out_file)
 
                 if self.use_progress_bar:
                     progress_bar.update(1)
@@ -423,7 +773,7 @@ class Tournament(object):
         """
         for chunk in iter(work_queue.get, "STOP"):
             interactions = self._play_matches(chunk, build_results)
-            done_queue.put(interactions)
+            done_queue.put((_match_keys(chunk), interactions))
         done_queue.put("STOP")
         return True
 
@@ -433,77 +783,180 @@ class Tournament(object):
 
         Parameters
         ----------
-        chunk : tuple (index pair, match_parameters, repetitions)
-            match_parameters are also a tuple: (turns, game, noise)
+        chunk : tuple (index pair, match_parameters, repetitions, seed)
+            or a list of such tuples if chunks are balanced
         build_results : bool
             whether or not to build a results set
 
         Returns
         -------
         interactions : dictionary
-            Mapping player index pairs to results of matches:
+            Mapping player index pairs to the interactions, results and
+            repetition index of each match:
 
-                (0, 1) -> [(C, D), (D, C),...]
+                (0, 1) -> [[[(C, D), (D, C),...], results, 0], ...]
         """
-        interactions = defaultdict(list)
-        index_pair, match_params, repetitions, seed = chunk
-        p1_index, p2_index = index_pair
-        player1 = self.players[p1_index].clone()
-        player2 = self.players[p2_index].clone()
-        match_params["players"] = (player1, player2)
-        match_params["seed"] = seed
-        match = Match(**match_params)
-        for _ in range(repetitions):
-            match.play()
+        return _play_chunk(
+            chunk, self._chunk_players(chunk), self.game, build_results
+        )
 
-            if build_results:
-                results = self._calculate_results(match.result)
-            else:
-                results = None
+    def _chunk_players(self, chunk):
+        """Returns a dictionary mapping the indices of the players of a chunk
+        to the players."""
+        return {
+            index: self.players[index]
+            for index_pair, *_ in _chunk_tasks(chunk)
+            for index in index_pair
+        }
 
-            interactions[index_pair].append([match.result, results])
-        return interactions
 
-    def _calculate_results(self, interactions):
-        results = []
+def _calculate_results(interactions, game):
+    results = []
 
-        scores = iu.compute_final_score(interactions, self.game)
-        results.append(scores)
+    scores = iu.compute_final_score(interactions, game)
+    results.append(scores)
 
-        score_diffs = scores[0] - scores[1], scores[1] - scores[0]
-        results.append(score_diffs)
+    score_diffs = scores[0] - scores[1], scores[1] - scores[0]
+    results.append(score_diffs)
 
-        turns = len(interactions)
-        results.append(turns)
+    turns = len(interactions)
+    results.append(turns)
 
-        score_per_turns = iu.compute_final_score_per_turn(
-            interactions, self.game
-        )
-        results.append(score_per_turns)
+    score_per_turns = iu.compute_final_score_per_turn(interactions, game)
+    results.append(score_per_turns)
 
-        score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
-        results.append(score_diffs_per_turns)
+    score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
+    results.append(score_diffs_per_turns)
+
+    initial_coops = tuple(map(bool, iu.compute_cooperations(interactions[:1])))
+    results.append(initial_coops)
+
+    cooperations = iu.compute_cooperations(interactions)
+    results.append(cooperations)
+
+    state_distribution = iu.compute_state_distribution(interactions)
+    results.append(state_distribution)
+
+    state_to_action_distributions = iu.compute_state_to_action_distribution(
+        interactions
+    )
+    results.append(state_to_action_distributions)
+
+    winner_index = iu.compute_winner_index(interactions, game)
+    results.append(winner_index)
+
+    return results
+
+
+# The players of the tournament that created the executor of a worker.
+_worker_players = None  # type: Optional[List[Player]]
+
+# Mapping executors created by tournaments to the players their workers were
+# initialised with.
+_executor_players = weakref.WeakKeyDictionary()  # type: ignore
+
+# The maximum number of chunks submitted to an executor but not yet processed.
+_MAX_PENDING_CHUNKS = 1000
 
-        initial_coops = tuple(
-            map(bool, iu.compute_cooperations(interactions[:1]))
-        )
-        results.append(initial_coops)
 
-        cooperations = iu.compute_cooperations(interactions)
-        results.append(cooperations)
+def _initialise_worker(players):
+    """Stores the players in a worker of an executor."""
+    global _worker_players
+    _worker_players = players
 
-        state_distribution = iu.compute_state_distribution(interactions)
-        results.append(state_distribution)
 
-        state_to_action_distributions = iu.compute_state_to_action_distribution(
-            interactions
+def _chunk_tasks(chunk):
+    """Returns the list of (index pair, match parameters, repetitions, seed)
+    tuples of a chunk, which is either one such tuple or, if chunks are
+    balanced, a list of them."""
+    if isinstance(chunk, list):
+        return chunk
+    return [chunk]
+
+
+def _match_key(index_pair, seed, repetition=None):
+    """Returns the key of a match in the journal of a tournament: its index
+    pair and seed, and its repetition if each repetition has its own seed.
+    This identifies the match for a given seed of the tournament."""
+    key = [[int(index) for index in index_pair], int(seed)]
+    if repetition is not None:
+        key.insert(1, int(repetition))
+    return key
+
+
+def _match_keys(chunk):
+    """Returns the keys of the matches of a chunk in the journal of a
+    tournament: one per repetition of balanced chunks, whose repetitions
+    have their own seeds."""
+    keys = []
+    for index_pair, _, repetitions, seed in _chunk_tasks(chunk):
+        if isinstance(repetitions, int):
+            keys.append(_match_key(index_pair, seed))
+        else:
+            keys.extend(
+                _match_key(index_pair, s, repetition)
+                for repetition, s in zip(repetitions, seed)
+            )
+    return keys
+
+
+def _play_chunk(
+    chunk, players, game, build_results=True, keep_interactions=True
+):
+    """
+    Play the matches in a given chunk. This does not depend on a tournament,
+    so that only the chunk, the players and the game are sent to workers.
+
+    Parameters
+    ----------
+    chunk : tuple (index pair, match_parameters, repetitions, seed) or a list
+        of such tuples, as built by `MatchGenerator.build_match_chunks`
+    players : dict
+        Mapping the indices of the players of the chunk to the players, or
+        None to use the players a worker was initialised with.
+    game : axelrod.Game
+        The game used to calculate the results
+    build_results : bool
+        whether or not to calculate the results of the matches
+    keep_interactions : bool
+        whether or not to return the actions played, otherwise None is
+        returned in their place
+
+    Returns
+    -------
+    interactions : dictionary
+        Mapping player index pairs to lists of interactions, results and
+        repetition indices.
+    """
+    if players is None:
+        players = _worker_players
+    interactions = {}
+    for index_pair, match_params, repetitions, seed in _chunk_tasks(chunk):
+        # Balanced chunks give a range of repetitions with one seed each.
+        if isinstance(repetitions, int):
+            repetitions, seeds = range(repetitions), None
+        else:
+            seed, seeds = None, seed
+        match_params = dict(
+            match_params,
+            players=tuple(players[index].clone() for index in index_pair),
+            seed=seed,
         )
-        results.append(state_to_action_distributions)
+        match = Match(**match_params)
+        for i, repetition in enumerate(repetitions):
+            if seeds is not None:
+                match.set_seed(seeds[i])
+            match.play()
 
-        winner_index = iu.compute_winner_index(interactions, self.game)
-        results.append(winner_index)
+            results = None
+            if build_results:
+                results = _calculate_results(match.result, game)
 
-        return results
+            interaction = match.result if keep_interactions else None
+            interactions.setdefault(index_pair, []).append(
+                [interaction, results, repetition]
+            )
+    return interactions
 
 
 def _close_objects(*objs):
@@ -19,8 +19,6 @@ import sys
 import mock
 
 MOCK_MODULES = [
-    "dask",
-    "dask.dataframe",
     "matplotlib",
     "matplotlib.pyplot",
     "matplotlib.transforms",